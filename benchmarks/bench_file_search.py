@@ -0,0 +1,89 @@
+"""Measure the Desktop/Downloads search of the enhanced detection
+
+Builds synthetic user folders (a Downloads folder with thousands of files
+and subfolders) and compares the old serial listdir walk with the bounded,
+parallel scandir search.
+
+Run from the repository root:
+    python -m benchmarks.bench_file_search
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from poe_core.catalog import CATALOG
+from poe_core.file_search import FileSearch
+
+
+def make_folders(files, subfolders, files_per_subfolder):
+    """Desktop, Downloads and Documents folders; the programs sit at the end of the walk"""
+    root = tempfile.mkdtemp(prefix='poe-launcher-search-')
+    folders = [os.path.join(root, name) for name in ('Desktop', 'Downloads', 'Documents')]
+    for folder in folders:
+        os.makedirs(folder)
+
+    downloads = folders[1]
+    for i in range(files):
+        open(os.path.join(downloads, f'file{i:05}.zip'), 'w').close()
+    for i in range(subfolders):
+        sub = os.path.join(downloads, f'folder{i:04}')
+        os.makedirs(sub)
+        for j in range(files_per_subfolder):
+            open(os.path.join(sub, f'part{j:03}.dll'), 'w').close()
+    # Folders the search prunes by name
+    for i in range(subfolders // 10):
+        os.makedirs(os.path.join(downloads, f'.cache{i}'))
+        os.makedirs(os.path.join(downloads, 'node_modules', f'pkg{i}'), exist_ok=True)
+
+    open(os.path.join(folders[0], 'Awakened-PoE-Trade-Setup.exe'), 'w').close()
+    open(os.path.join(folders[2], 'PoeLurker.exe'), 'w').close()
+    cre = os.path.join(downloads, 'zz-ChaosRecipeEnhancer')
+    os.makedirs(cre)
+    open(os.path.join(cre, 'ChaosRecipeEnhancer.exe'), 'w').close()
+    return root, folders
+
+
+def serial_listdir(folders):
+    """The previous detection: listdir every folder and every subfolder in turn"""
+    detected = {}
+    for folder in folders:
+        for item in os.listdir(folder):
+            item_path = os.path.join(folder, item)
+            if item.lower().endswith('.exe'):
+                spec = CATALOG.match_file_name(item)
+                if spec and spec.key not in detected:
+                    detected[spec.key] = item_path
+            elif os.path.isdir(item_path):
+                for subitem in os.listdir(item_path):
+                    if subitem.lower().endswith('.exe'):
+                        spec = CATALOG.match_file_name(subitem)
+                        if spec and spec.deep_search and spec.key not in detected:
+                            detected[spec.key] = os.path.join(item_path, subitem)
+    return detected
+
+
+def timed(func, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = func()
+    return (time.perf_counter() - start) / runs, result
+
+
+def main(files=5000, subfolders=500, files_per_subfolder=20, runs=5):
+    root, folders = make_folders(files, subfolders, files_per_subfolder)
+    try:
+        serial, serial_found = timed(lambda: serial_listdir(folders), runs)
+        parallel, parallel_found = timed(lambda: FileSearch().search(folders), runs)
+        assert serial_found == parallel_found, (serial_found, parallel_found)
+
+        entries = files + subfolders * (files_per_subfolder + 1)
+        print(f"Downloads with {entries} entries, found {sorted(parallel_found)}")
+        print(f"  serial listdir    {serial * 1000:8.2f} ms")
+        print(f"  parallel scandir  {parallel * 1000:8.2f} ms")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare per-name process scans with a single process snapshot
+
+Run from the repository root:
+    python -m benchmarks.bench_processes
+"""
+import timeit
+
+from benchmarks.fakes import IMAGE_QUERY_COST, fake_process_iter, make_process_table
+from poe_core.processes import ProcessSnapshot
+
+CHECKED_NAMES = [
+    "steam.exe",
+    "Awakened PoE Trade.exe",
+    "Poe Lurker.exe",
+    "ChaosRecipeEnhancer.exe",
+]
+
+# Configured companion paths, matched by path instead of image name
+CONFIGURED_PATHS = [
+    "C:\\Program Files\\Awakened PoE Trade\\Awakened PoE Trade.exe",
+    "C:\\Users\\me\\AppData\\Local\\PoeLurker\\app-1.4.2\\PoeLurker.exe",
+    "D:\\Tools\\CRE\\CRE.exe",
+]
+
+
+def per_name_scans(process_iter):
+    """The old launch behaviour: one full walk per checked name"""
+    results = []
+    for process_name in CHECKED_NAMES:
+        running = False
+        for proc in process_iter(['name']):
+            if proc.info['name'] and proc.info['name'].lower() == process_name.lower():
+                running = True
+                break
+        results.append(running)
+    return results
+
+
+def single_snapshot(process_iter, include_paths=False):
+    """One walk, then dictionary lookups for every checked name"""
+    snapshot = ProcessSnapshot.capture(include_paths=include_paths, process_iter=process_iter)
+    return [snapshot.is_running(name) for name in CHECKED_NAMES]
+
+
+def path_snapshot(process_iter):
+    """One walk with paths, then one lookup per configured companion"""
+    snapshot = ProcessSnapshot.capture(include_paths=True, process_iter=process_iter)
+    return [snapshot.is_running("steam.exe")] + [snapshot.is_program_running(path) for path in CONFIGURED_PATHS]
+
+
+def main(count=350, repeat=5, number=20):
+    table = make_process_table(count)
+    process_iter = fake_process_iter(table, query_cost=IMAGE_QUERY_COST)
+    assert per_name_scans(process_iter) == single_snapshot(process_iter)
+
+    cases = [
+        ("per-name scans", lambda: per_name_scans(process_iter)),
+        ("snapshot (names)", lambda: single_snapshot(process_iter)),
+        ("snapshot (names+paths)", lambda: single_snapshot(process_iter, include_paths=True)),
+        ("snapshot (configured paths)", lambda: path_snapshot(process_iter)),
+    ]
+
+    print(f"{count} processes, {len(CHECKED_NAMES)} checks per launch, "
+          f"{IMAGE_QUERY_COST * 1e6:.0f} us per image path query")
+    for label, func in cases:
+        process_iter.stats.update(walks=0, image_queries=0)
+        func()
+        walks, queries = process_iter.stats['walks'], process_iter.stats['image_queries']
+        best = min(timeit.repeat(func, repeat=repeat, number=number)) / number
+        print(f"  {label:<28} {best * 1e6:8.1f} us/launch  {walks} walk(s), {queries} image queries")
+
+if __name__ == "__main__":
+    main()
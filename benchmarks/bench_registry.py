@@ -0,0 +1,40 @@
+"""Measure building and reusing the Uninstall registry index
+
+Run from the repository root:
+    python -m benchmarks.bench_registry
+"""
+import time
+
+from benchmarks.fakes import make_uninstall_registry
+from poe_core.registry import RegistryIndex
+
+QUERIES = [('steam',), ('path', 'exile'), ('awakened', 'poe'), ('lurker',), ('chaos', 'recipe')]
+
+
+def main(count=5000):
+    fake = make_uninstall_registry(count, {
+        'Steam': 'C:\\Program Files (x86)\\Steam',
+        'Awakened PoE Trade 3.24': 'C:\\Program Files\\Awakened PoE Trade',
+        'PoeLurker': 'C:\\Users\\me\\AppData\\Local\\PoeLurker',
+    })
+    index = RegistryIndex(fake)
+
+    start = time.perf_counter()
+    index.refresh()
+    build = time.perf_counter() - start
+    build_calls = fake.calls
+
+    fake.calls = 0
+    start = time.perf_counter()
+    rebuilt = index.refresh()
+    matches = {query: len(index.query(*query)) for query in QUERIES}
+    reuse = time.perf_counter() - start
+
+    print(f"{count} uninstall entries")
+    print(f"  first detection   {build * 1000:8.2f} ms  ({build_calls} registry calls)")
+    print(f"  repeat detection  {reuse * 1000:8.2f} ms  ({fake.calls} registry calls, rebuilt={rebuilt})")
+    print(f"  matches: {matches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measure .lnk parsing throughput and a bulk Start Menu shortcut scan
+
+Writes a synthetic Start Menu with thousands of shortcuts (a few of them
+to catalogued programs) and reports shortcuts/second for parsing alone and
+for the shortcut detection walk.
+
+Run from the repository root:
+    python -m benchmarks.bench_shortcuts
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from benchmarks.fakes import make_lnk
+from poe_core.file_search import FileSearch
+from poe_core.shortcuts import read_lnk
+
+PROGRAM_TARGETS = {
+    'awakened_trade': 'C:\\Users\\me\\AppData\\Local\\Programs\\Awakened PoE Trade\\Awakened PoE Trade.exe',
+    'poe_lurker': 'C:\\Users\\me\\AppData\\Local\\PoeLurker\\app-1.4.2\\PoeLurker.exe',
+    'steam': 'C:\\Program Files (x86)\\Steam\\steam.exe',
+}
+
+
+def make_start_menu(count, per_folder=20):
+    """Start Menu tree with count unrelated shortcuts and the catalogued ones last"""
+    root = tempfile.mkdtemp(prefix='poe-launcher-lnk-')
+    programs = os.path.join(root, 'Programs')
+    paths = []
+    for i in range(count):
+        folder = os.path.join(programs, f'Vendor {i // per_folder:03}')
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f'Tool {i:05}.lnk')
+        with open(path, 'wb') as f:
+            f.write(make_lnk(f'C:\\Program Files\\Vendor {i // per_folder:03}\\tool{i:05}.exe',
+                             arguments='--profile default', unicode_paths=i % 2 == 0))
+        paths.append(path)
+
+    folder = os.path.join(programs, 'zz Games')
+    os.makedirs(folder)
+    for key, target in PROGRAM_TARGETS.items():
+        path = os.path.join(folder, f'{key}.lnk')
+        with open(path, 'wb') as f:
+            f.write(make_lnk(target, env_target=key == 'poe_lurker'))
+        paths.append(path)
+    return root, programs, paths
+
+
+def main(count=3000, runs=5):
+    root, programs, paths = make_start_menu(count)
+    try:
+        start = time.perf_counter()
+        for _ in range(runs):
+            for path in paths:
+                read_lnk(path)
+        parse = (time.perf_counter() - start) / runs
+
+        # Targets do not exist on this machine, so accept every target path.
+        # Chaos Recipe Enhancer has no shortcut, so the walk cannot stop early.
+        search = FileSearch(max_depth=3, shortcuts=True, exists=lambda path: True)
+        start = time.perf_counter()
+        for _ in range(runs):
+            found = search.search([programs], wanted=list(PROGRAM_TARGETS) + ['chaos_recipe'])
+        scan = (time.perf_counter() - start) / runs
+        assert found == PROGRAM_TARGETS, found
+
+        print(f"{len(paths)} shortcuts")
+        print(f"  parse only      {parse * 1000:8.2f} ms  ({len(paths) / parse:10.0f} shortcuts/s)")
+        print(f"  detection walk  {scan * 1000:8.2f} ms  ({len(paths) / scan:10.0f} shortcuts/s)")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
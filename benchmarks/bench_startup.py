@@ -0,0 +1,85 @@
+"""Measure launcher startup: time-to-first-frame and time-to-interactive
+
+Starts the Tk launcher in fresh interpreters (fast start and the old
+blocking startup) against a throwaway config directory and reports the
+median timings. Needs a display.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD_SCRIPT = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import poe_launcher
+import_time = time.perf_counter() - t0
+app = poe_launcher.PoELauncher(fast_start=sys.argv[1] == 'fast')
+
+def report():
+    if 'interactive' not in app.startup_timings:
+        app.root.after(5, report)
+        return
+    timings = dict(app.startup_timings, import_time=import_time)
+    print(json.dumps(timings))
+    app.root.destroy()
+
+app.root.after(0, report)
+app.run()
+"""
+
+
+def make_home(config):
+    """Temporary home directory with a config.json in both OS locations"""
+    home = tempfile.mkdtemp(prefix='poe-launcher-bench-')
+    for parts in (('AppData', 'Local', 'PoELauncher'), ('.config', 'PoeLauncher')):
+        config_dir = os.path.join(home, *parts)
+        os.makedirs(config_dir)
+        with open(os.path.join(config_dir, 'config.json'), 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+    return home
+
+
+def run_once(mode, home):
+    env = dict(os.environ, HOME=home, USERPROFILE=home, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run([sys.executable, '-c', CHILD_SCRIPT, mode], cwd=REPO_ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else 'launcher failed')
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(runs=5):
+    # Every path filled in, so startup does not trigger a full detection
+    config = {
+        'game_version': 'steam',
+        'steam_path': sys.executable,
+        'standalone_path': sys.executable,
+        'awakened_path': sys.executable,
+        'lurker_path': sys.executable,
+        'chaos_recipe_path': sys.executable,
+        'start_awakened': True,
+    }
+    home = make_home(config)
+
+    for mode in ('fast', 'blocking'):
+        try:
+            samples = [run_once(mode, home) for _ in range(runs)]
+        except RuntimeError as e:
+            print(f"Cannot start the launcher here ({e}) - a display is required")
+            return
+        print(f"{mode} start ({runs} runs, median)")
+        for key in ('import_time', 'first_frame', 'interactive'):
+            value = statistics.median(sample[key] for sample in samples)
+            print(f"  {key:<14} {value * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Stand-ins for Windows-only modules and files so the detectors can run on Linux"""
+import ntpath
+import random
+import struct
+import threading
+import time
+
+from poe_core import shortcuts
+
+
+class FakeKey:
+    """Registry key handle: named subkeys, values and a last-write stamp"""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.subkeys = {}
+        self.last_write = 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def child(self, name, values=None):
+        key = self.subkeys.get(name)
+        if key is None:
+            key = self.subkeys[name] = FakeKey(values)
+            self.last_write += 1
+        return key
+
+
+class FakeWinreg:
+    """Minimal in-memory replacement for the winreg module"""
+
+    HKEY_LOCAL_MACHINE = 'HKLM'
+    HKEY_CURRENT_USER = 'HKCU'
+
+    def __init__(self):
+        self.hives = {self.HKEY_LOCAL_MACHINE: FakeKey(), self.HKEY_CURRENT_USER: FakeKey()}
+        self.calls = 0
+
+    def add_key(self, hive, path, values=None):
+        """Create the key at path (and its parents), returns it"""
+        key = self.hives[hive]
+        for part in path.split('\\'):
+            key = key.child(part)
+        key.values.update(values or {})
+        return key
+
+    def OpenKey(self, key, sub_key):
+        self.calls += 1
+        if not isinstance(key, FakeKey):
+            key = self.hives[key]
+        for part in sub_key.split('\\'):
+            if part not in key.subkeys:
+                raise FileNotFoundError(sub_key)
+            key = key.subkeys[part]
+        return key
+
+    def EnumKey(self, key, index):
+        self.calls += 1
+        names = list(key.subkeys)
+        if index >= len(names):
+            raise OSError("No more data is available")
+        return names[index]
+
+    def QueryValueEx(self, key, name):
+        self.calls += 1
+        if name not in key.values:
+            raise FileNotFoundError(name)
+        return key.values[name], 1
+
+    def QueryInfoKey(self, key):
+        self.calls += 1
+        return len(key.subkeys), len(key.values), key.last_write
+
+
+def make_uninstall_registry(count=2000, programs=None):
+    """Build a FakeWinreg with count filler Uninstall entries plus the given programs
+
+    programs maps a display name to its install location.
+    """
+    from poe_core.registry import UNINSTALL_KEY
+
+    fake = FakeWinreg()
+    root = fake.add_key(fake.HKEY_LOCAL_MACHINE, UNINSTALL_KEY)
+    for i in range(count):
+        root.child(f"{{{i:08d}-FILLER}}", {
+            'DisplayName': f"Filler Application {i}",
+            'InstallLocation': f"C:\\Program Files\\Filler {i}",
+            'UninstallString': f"C:\\Program Files\\Filler {i}\\uninstall.exe",
+        })
+    for display_name, location in (programs or {}).items():
+        root.child(display_name.replace(' ', ''), {'DisplayName': display_name, 'InstallLocation': location})
+    return fake
+
+
+def make_lnk(target, arguments=None, working_dir=None, unicode_paths=True, env_target=False,
+             relative_path=None):
+    """Bytes of a .lnk file pointing at target, laid out like the Windows shell writes them
+
+    With env_target the path is only stored in an EnvironmentVariableDataBlock,
+    as for shortcuts to %LOCALAPPDATA% installs. Without a target there is
+    no LinkInfo, only the relative_path (if given).
+    """
+    flags = shortcuts.IS_UNICODE
+    body = b''
+
+    # A small LinkTargetIDList the parser has to skip
+    id_list = struct.pack('<H', 4) + b'\xAA\xBB' + struct.pack('<H', 0)
+    flags |= shortcuts.HAS_LINK_TARGET_ID_LIST
+    body += struct.pack('<H', len(id_list)) + id_list
+
+    if target and not env_target:
+        flags |= shortcuts.HAS_LINK_INFO
+        header_size = 0x24 if unicode_paths else 0x1C
+        volume_id = struct.pack('<4I', 0x11, 3, 0x1234ABCD, 0x10) + b'\0'
+        local_base = target.encode('cp1252', errors='replace') + b'\0'
+        suffix = b'\0'
+        volume_offset = header_size
+        local_base_offset = volume_offset + len(volume_id)
+        suffix_offset = local_base_offset + len(local_base)
+        tail = volume_id + local_base + suffix
+        unicode_offsets = b''
+        if unicode_paths:
+            local_base_unicode_offset = header_size + len(tail)
+            wide_base = target.encode('utf-16-le') + b'\0\0'
+            suffix_unicode_offset = local_base_unicode_offset + len(wide_base)
+            tail += wide_base + b'\0\0'
+            unicode_offsets = struct.pack('<2I', local_base_unicode_offset, suffix_unicode_offset)
+        size = header_size + len(tail)
+        body += struct.pack('<7I', size, header_size, shortcuts.VOLUME_ID_AND_LOCAL_BASE_PATH, volume_offset,
+                            local_base_offset, 0, suffix_offset) + unicode_offsets + tail
+
+    for flag, value in ((shortcuts.HAS_RELATIVE_PATH, relative_path), (shortcuts.HAS_WORKING_DIR, working_dir),
+                        (shortcuts.HAS_ARGUMENTS, arguments)):
+        if value is not None:
+            flags |= flag
+            encoded = value.encode('utf-16-le')
+            # The count is in UTF-16 code units
+            body += struct.pack('<H', len(encoded) // 2) + encoded
+
+    if env_target:
+        ansi = target.encode('cp1252', errors='replace')[:259].ljust(260, b'\0')
+        wide = target.encode('utf-16-le')[:518].ljust(520, b'\0')
+        body += struct.pack('<2I', 0x314, shortcuts.ENVIRONMENT_VARIABLE_BLOCK) + ansi + wide
+    body += struct.pack('<I', 0)
+
+    header = struct.pack('<I', shortcuts.HEADER_SIZE) + shortcuts.LINK_CLSID + struct.pack('<I', flags)
+    header = header.ljust(shortcuts.HEADER_SIZE, b'\0')
+    return header + body
+
+
+class FakeProcess:
+    """Minimal stand-in for psutil.Process; info holds the attributes of the last walk"""
+
+    def __init__(self, pid, name, exe):
+        self.pid = pid
+        self.name = name
+        self.exe = exe
+        self.info = {'pid': pid, 'name': name, 'exe': exe}
+
+
+# Seconds psutil needs per process to read its image path on Windows
+# (OpenProcess + QueryFullProcessImageNameW, ~10-30 us). Process.name()
+# is derived from the image path there, so reading name or exe costs one
+# query per process and walk; within one process_iter walk both are read
+# together.
+IMAGE_QUERY_COST = 15e-6
+
+
+def spin(seconds):
+    """Busy-wait; time.sleep cannot wait for a few microseconds"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def make_process_table(count=350, seed=42, running=None):
+    """Build a synthetic process list with a few of the checked programs
+
+    running maps extra process names to their executable paths; Steam is
+    always in the table.
+    """
+    rng = random.Random(seed)
+    table = []
+    for pid in range(count):
+        name = f"svc{rng.randint(0, 10000)}.exe"
+        table.append(FakeProcess(pid + 4, name, f"C:\\Windows\\System32\\{name}"))
+    table[count // 2] = FakeProcess(9001, "steam.exe", "C:\\Program Files (x86)\\Steam\\steam.exe")
+    for offset, (name, exe) in enumerate((running or {}).items()):
+        table[count // 3 + offset] = FakeProcess(9100 + offset, name, exe)
+    return table
+
+
+def fake_process_iter(table, query_cost=0.0):
+    """Return a psutil.process_iter replacement over the synthetic table
+
+    Like psutil it fills proc.info with the requested attributes while
+    walking. The returned function counts walks and image path queries
+    in its stats dict; query_cost is spent per query (IMAGE_QUERY_COST
+    models Windows).
+    """
+    stats = {'walks': 0, 'image_queries': 0}
+
+    def process_iter(attrs=None):
+        stats['walks'] += 1
+        attrs = list(attrs or ('pid', 'name', 'exe'))
+        queries = 'name' in attrs or 'exe' in attrs
+        for proc in table:
+            if queries:
+                stats['image_queries'] += 1
+                if query_cost:
+                    spin(query_cost)
+            proc.info = {attr: getattr(proc, attr) for attr in attrs}
+            yield proc
+
+    process_iter.stats = stats
+    return process_iter
+
+
+class FakeFilesystem:
+    """Virtual Windows drives for os.path.exists-style probes
+
+    files is a set of full paths (directories are implied by their files).
+    latency maps a drive root to the seconds every probe on it takes, to
+    stand in for sleeping disks and network shares.
+    """
+
+    def __init__(self, files=(), latency=None):
+        self.paths = set()
+        for path in files:
+            self.add(path)
+        self.latency = dict(latency or {})
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def add(self, path):
+        path = ntpath.normcase(ntpath.normpath(path))
+        while True:
+            self.paths.add(path)
+            parent = ntpath.dirname(path)
+            if parent == path:
+                break
+            path = parent
+
+    def exists(self, path):
+        with self.lock:
+            self.calls += 1
+        drive = ntpath.splitdrive(path)[0].upper() + '\\'
+        delay = self.latency.get(drive)
+        if delay:
+            time.sleep(delay)
+        return ntpath.normcase(ntpath.normpath(path)) in self.paths
+
+
+class RecordingPopen:
+    """subprocess.Popen replacement that records launches instead of running them"""
+
+    def __init__(self, latency=0.0):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.next_pid = 20000
+        # Seconds every start takes, e.g. to model an extra cmd.exe
+        self.latency = latency
+
+    def __call__(self, args, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            self.next_pid += 1
+            self.calls.append((list(args) if not isinstance(args, str) else [args], kwargs))
+            return _RecordedProcess(args, self.next_pid)
+
+
+class _RecordedProcess:
+    def __init__(self, args, pid):
+        self.args = args
+        self.pid = pid
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
@@ -0,0 +1,369 @@
+"""Repeatable timings of the detection and launch hot paths, with a regression gate
+
+Every case runs against the fakes in benchmarks.fakes (a synthetic
+Uninstall registry, virtual drives including slow ones, a fake process
+table, a recording Popen), so results do not depend on what is installed
+and everything runs on Linux. Besides the median time each case reports
+operation counts (registry calls, probes, launches); where they are exact
+they are compared too, which catches regressions independent of the
+machine.
+
+Run from the repository root:
+    python -m benchmarks.harness                    # compare with benchmarks/baseline.json
+    python -m benchmarks.harness --update-baseline  # record a new baseline on this machine
+
+Exits with status 1 if a case got slower than the threshold, an exact
+work count grew, or a result count (programs found, launches made)
+differs from the baseline.
+"""
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_steam_library import make_steam_dir
+from benchmarks.fakes import (FakeFilesystem, RecordingPopen, fake_process_iter, make_process_table,
+                              make_uninstall_registry)
+from poe_core.catalog import CATALOG
+from poe_core.detection import Detector
+from poe_core.drives import DriveProber, windows_drive_roots
+from poe_core.file_search import FileSearch
+from poe_core.launching import Launcher
+from poe_core.processes import ProcessSnapshot
+from poe_core.registry import RegistryIndex
+from poe_core.squirrel import SquirrelResolver
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_REPEAT = 7
+# Allowed slowdown against the baseline median
+DEFAULT_THRESHOLD = 0.25
+# Differences below this many milliseconds are noise, whatever the ratio
+MIN_DELTA_MS = 1.0
+
+# Counts that describe results rather than work (programs found, launches
+# made); they must match the baseline exactly in every case
+RESULT_COUNTS = ('found', 'newest', 'running', 'spawned', 'urls_opened', 'errors')
+
+CASES = []
+
+
+def case(name, exact_counts=True):
+    """Register a benchmark case
+
+    The function is a context manager that sets up its fakes and yields a
+    callable running the hot path once and returning a dict of counts.
+    exact_counts is False where parallel early stopping makes work counts
+    vary; result counts (RESULT_COUNTS) are always compared exactly.
+    """
+    def register(func):
+        CASES.append((name, contextlib.contextmanager(func), exact_counts))
+        return func
+    return register
+
+
+def quiet(func):
+    """Run func with the detectors' progress prints suppressed"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return func()
+
+
+@contextlib.contextmanager
+def install_dirs(*names):
+    """Temporary program folders, each holding the catalogued executable"""
+    root = tempfile.mkdtemp(prefix='poe-launcher-harness-')
+    try:
+        locations = {}
+        for key in names:
+            folder = os.path.join(root, key)
+            os.makedirs(folder)
+            open(os.path.join(folder, CATALOG[key].exe_names[0]), 'w').close()
+            locations[key] = folder
+        yield locations
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@case('registry.cold')
+def registry_cold(entries=5000):
+    with install_dirs('steam', 'awakened_trade') as locations:
+        fake = make_uninstall_registry(entries, {
+            'Steam': locations['steam'],
+            'Awakened PoE Trade 3.24': locations['awakened_trade'],
+        })
+
+        def run():
+            fake.calls = 0
+            detector = Detector(registry_index=RegistryIndex(fake), windows=True)
+            found = quiet(detector.detect_from_registry)
+            return {'registry_calls': fake.calls, 'found': len(found)}
+        yield run
+
+
+@case('registry.warm')
+def registry_warm(entries=5000):
+    with install_dirs('steam', 'awakened_trade') as locations:
+        fake = make_uninstall_registry(entries, {
+            'Steam': locations['steam'],
+            'Awakened PoE Trade 3.24': locations['awakened_trade'],
+        })
+        detector = Detector(registry_index=RegistryIndex(fake), windows=True)
+        quiet(detector.detect_from_registry)
+
+        def run():
+            fake.calls = 0
+            found = quiet(detector.detect_from_registry)
+            return {'registry_calls': fake.calls, 'found': len(found)}
+        yield run
+
+
+def virtual_drives():
+    """C: local, D: sleeping disk, E: network share; programs spread over them"""
+    return FakeFilesystem([
+        'C:\\Program Files\\Awakened PoE Trade\\Awakened PoE Trade.exe',
+        'D:\\Steam\\steam.exe',
+        'E:\\Tools\\ChaosRecipeEnhancer.exe',
+    ], latency={'D:\\': 0.002, 'E:\\': 0.01})
+
+
+@case('filesystem.drives', exact_counts=False)
+def filesystem_drives():
+    fs = virtual_drives()
+
+    def run():
+        fs.calls = 0
+        prober = DriveProber(windows_drive_roots(), exists=fs.exists, drive_timeout=1.0)
+        detector = Detector(drive_prober=prober, windows=True)
+        found = quiet(lambda: detector.detect_from_filesystem('steam'))
+        return {'probes': fs.calls, 'found': len(found)}
+    yield run
+
+
+@case('enhanced.folders', exact_counts=False)
+def enhanced_folders(files=3000, subfolders=300):
+    root = tempfile.mkdtemp(prefix='poe-launcher-harness-')
+    try:
+        downloads = os.path.join(root, 'Downloads')
+        os.makedirs(downloads)
+        for i in range(files):
+            open(os.path.join(downloads, f'file{i:05}.zip'), 'w').close()
+        for i in range(subfolders):
+            os.makedirs(os.path.join(downloads, f'folder{i:04}'))
+        cre = os.path.join(downloads, 'ChaosRecipeEnhancer')
+        os.makedirs(cre)
+        open(os.path.join(cre, 'ChaosRecipeEnhancer.exe'), 'w').close()
+        fs = virtual_drives()
+
+        def run():
+            fs.calls = 0
+            prober = DriveProber(windows_drive_roots(), exists=fs.exists, drive_timeout=1.0)
+            detector = Detector(drive_prober=prober, file_search=FileSearch(), windows=True)
+            detector.search_folders = lambda: [downloads, os.path.join(root, 'Desktop')]
+            found = quiet(detector.detect_enhanced_methods)
+            return {'probes': fs.calls, 'found': len(found)}
+        yield run
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@case('steam.libraries')
+def steam_libraries(libraries=40, apps_per_library=100):
+    root, steam_exe = make_steam_dir(libraries, apps_per_library)
+    try:
+        detector = Detector(windows=True)
+
+        def run():
+            found = quiet(lambda: detector.detect_steam_games(steam_exe))
+            return {'found': len(found)}
+        yield run
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def squirrel_folder(versions=50):
+    """PoE Lurker style base folder: app-x.y.z builds, a stub and Squirrel's own files"""
+    root = tempfile.mkdtemp(prefix='poe-launcher-harness-')
+    try:
+        for i in range(versions):
+            folder = os.path.join(root, f'app-1.{i}.{i % 3}')
+            os.makedirs(folder)
+            open(os.path.join(folder, 'PoeLurker.exe'), 'w').close()
+        os.makedirs(os.path.join(root, 'packages'))
+        for name in ('PoeLurker.exe', 'Update.exe', 'SquirrelSetup.log'):
+            open(os.path.join(root, name), 'w').close()
+        yield root
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@case('squirrel.cold')
+def squirrel_cold():
+    with squirrel_folder() as base:
+        def run():
+            resolver = SquirrelResolver()
+            path = resolver.resolve(base, 'PoeLurker.exe')
+            return {'scans': resolver.scans, 'newest': int(os.path.basename(os.path.dirname(path)) == 'app-1.49.1')}
+        yield run
+
+
+@case('squirrel.warm')
+def squirrel_warm():
+    with squirrel_folder() as base:
+        resolver = SquirrelResolver()
+        resolver.resolve(base, 'PoeLurker.exe')
+
+        def run():
+            resolver.scans = 0
+            for _ in range(100):
+                path = resolver.resolve(base, 'PoeLurker.exe')
+            return {'scans': resolver.scans, 'newest': int(os.path.basename(os.path.dirname(path)) == 'app-1.49.1')}
+        yield run
+
+
+@case('processes.checks')
+def process_checks(count=400):
+    configured = {
+        'awakened_trade': 'C:\\Awakened\\Awakened PoE Trade.exe',
+        'poe_lurker': 'C:\\Users\\me\\AppData\\Local\\PoeLurker\\app-1.4.2\\PoeLurker.exe',
+        'chaos_recipe': 'D:\\Tools\\CRE\\CRE.exe',
+    }
+    table = make_process_table(count, running={
+        'Awakened PoE Trade.exe': configured['awakened_trade'],
+        'PoeLurker.exe': configured['poe_lurker'],
+    })
+    process_iter = fake_process_iter(table)
+
+    def run():
+        process_iter.stats.update(walks=0, image_queries=0)
+        snapshot = ProcessSnapshot.capture(include_paths=True, process_iter=process_iter)
+        running = [snapshot.is_running('steam.exe')]
+        running += [snapshot.is_program_running(path) for path in configured.values()]
+        return {'process_walks': process_iter.stats['walks'], 'image_queries': process_iter.stats['image_queries'],
+                'running': sum(running)}
+    yield run
+
+
+@case('launch.pipeline')
+def launch_pipeline():
+    # Real, existing executables; nothing is started thanks to RecordingPopen
+    settings = {'game_version': 'steam', 'language': 'en', 'launch_history': 0}
+    for spec in CATALOG:
+        settings[spec.path_attr] = sys.executable
+        if spec.start_attr:
+            settings[spec.start_attr] = True
+    for site in CATALOG.websites:
+        settings[site.start_attr] = True
+    # Steam is already running, so there is no readiness wait
+    process_iter = fake_process_iter(make_process_table(400))
+
+    def run():
+        popen = RecordingPopen()
+        urls = []
+        launcher = Launcher(settings, status=lambda message: None, popen=popen,
+                            open_url=urls.append, process_iter=process_iter)
+        report = quiet(launcher.launch)
+        return {'spawned': len(popen.calls), 'urls_opened': len(urls), 'errors': len(report.errors)}
+    yield run
+
+
+def run_case(setup, repeat):
+    """Median and minimum of repeat runs (after one warm-up) plus the last counts"""
+    with setup() as run:
+        run()
+        samples = []
+        counts = {}
+        for _ in range(repeat):
+            start = time.perf_counter()
+            counts = run()
+            samples.append(time.perf_counter() - start)
+    return {
+        'median_ms': round(statistics.median(samples) * 1000, 3),
+        'min_ms': round(min(samples) * 1000, 3),
+        'counts': counts,
+    }
+
+
+def compare(name, result, baseline, threshold, exact_counts):
+    """Regression messages for one case (empty if it is within limits)"""
+    problems = []
+    old = baseline.get(name)
+    if not old:
+        return problems
+    limit = old['median_ms'] * (1 + threshold)
+    if result['median_ms'] > limit and result['median_ms'] - old['median_ms'] > MIN_DELTA_MS:
+        problems.append(f"median {result['median_ms']:.2f} ms > {old['median_ms']:.2f} ms + {threshold:.0%}")
+    for counter, value in result['counts'].items():
+        if counter not in old.get('counts', {}):
+            continue
+        expected = old['counts'][counter]
+        if counter in RESULT_COUNTS:
+            # What was found or started must not change, whatever the timing
+            if value != expected:
+                problems.append(f"{counter} {value} != {expected}")
+        elif exact_counts and value > expected:
+            problems.append(f"{counter} {value} > {expected}")
+    return problems
+
+
+def load_baseline(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('cases', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction (default %(default)s)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--case', action='append', default=[],
+                        help="only run cases whose name contains this text (repeatable)")
+    parser.add_argument('--json', default=None, metavar='FILE', help="also write the results to FILE")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    results = {}
+    failures = 0
+
+    print(f"{'case':<20} {'median':>10} {'baseline':>10}  counts")
+    for name, setup, exact_counts in CASES:
+        if args.case and not any(text in name for text in args.case):
+            continue
+        result = results[name] = run_case(setup, args.repeat)
+        old = baseline.get(name)
+        old_text = f"{old['median_ms']:8.2f}ms" if old else f"{'-':>10}"
+        counts = ', '.join(f"{key}={value}" for key, value in result['counts'].items())
+        print(f"{name:<20} {result['median_ms']:8.2f}ms {old_text}  {counts}")
+        if not args.update_baseline:
+            for problem in compare(name, result, baseline, args.threshold, exact_counts):
+                failures += 1
+                print(f"  REGRESSION: {problem}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'cases': results}, f, indent=2)
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'repeat': args.repeat, 'cases': baseline}, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if failures:
+        print(f"{failures} regression(s) beyond the {args.threshold:.0%} threshold")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,5 +18,13 @@ if %errorlevel% neq 0 (
     )
 )
 
-echo Build complete! Check the 'dist' folder for PoE-Launcher.exe
+echo Building command line executable...
+python -m PyInstaller --onefile --console --name "PoE-Launcher-CLI" poe_launcher_cli.py
+if %errorlevel% neq 0 (
+    echo Building PoE-Launcher-CLI.exe failed.
+    pause
+    exit /b 1
+)
+
+echo Build complete! Check the 'dist' folder for PoE-Launcher.exe and PoE-Launcher-CLI.exe
 pause
\ No newline at end of file
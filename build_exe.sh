@@ -5,4 +5,6 @@ pip install -r requirements.txt
 echo "Building executable..."
 pyinstaller --onefile --windowed --name "PoE-Launcher" poe_launcher.py
 
-echo "Build complete! Check the 'dist' folder for PoE-Launcher executable"
\ No newline at end of file
+pyinstaller --onefile --console --name "PoE-Launcher-CLI" poe_launcher_cli.py
+
+echo "Build complete! Check the 'dist' folder for the PoE-Launcher and PoE-Launcher-CLI executables"
\ No newline at end of file
@@ -0,0 +1 @@
+"""GUI-free helpers shared by the Path of Exile Launcher front ends"""
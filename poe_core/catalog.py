@@ -0,0 +1,196 @@
+"""Declarative catalog of the game, its launchers and companion programs
+
+Everything the launcher knows about a program lives in its ProgramSpec.
+Detection, validation, settings and launch iterate over the catalog
+instead of carrying per-program branches. Adding a companion tool means
+adding one entry here (plus its translation key).
+"""
+
+PROGRAM_KIND_LAUNCHER = 'launcher'
+PROGRAM_KIND_GAME = 'game'
+PROGRAM_KIND_COMPANION = 'companion'
+
+
+class ProgramSpec:
+    """Static description of one program the launcher can find and start"""
+
+    def __init__(self, key, kind, display_name, path_attr, exe_names,
+                 start_attr=None, browse_title=None, game_version=None,
+                 registry_queries=(), filesystem_locations=(), appdata_locations=(),
+                 appdata_versioned=(), file_keywords=(), deep_search=False,
+                 alt_exe_names=(), portable_dirs=(), launch_args=()):
+        # Detection key, also the translation key of the checkbox label
+        self.key = key
+        self.kind = kind
+        self.display_name = display_name
+        # Attribute/config key holding the configured path
+        self.path_attr = path_attr
+        # Attribute/config key of the "start this program" checkbox
+        self.start_attr = start_attr
+        self.exe_names = list(exe_names)
+        self.browse_title = browse_title or f"{display_name} executable"
+        # Only search for this program when this game version is selected
+        self.game_version = game_version
+        # Token tuples matched against Uninstall DisplayName values
+        self.registry_queries = [tuple(query) for query in registry_queries]
+        # Path parts relative to a drive root, in order of preference
+        self.filesystem_locations = [tuple(parts) for parts in filesystem_locations]
+        # Path parts relative to %LOCALAPPDATA%
+        self.appdata_locations = [tuple(parts) for parts in appdata_locations]
+        # (base folder under %LOCALAPPDATA%, exe name) for versioned installs
+        self.appdata_versioned = [tuple(entry) for entry in appdata_versioned]
+        # Keyword tuples matched against loose .exe file names
+        self.file_keywords = [tuple(words) for words in file_keywords]
+        # Also look one level into subfolders of the enhanced search folders
+        self.deep_search = deep_search
+        # Extra executable names checked in portable app folders
+        self.alt_exe_names = list(alt_exe_names)
+        self.portable_dirs = list(portable_dirs)
+        self.launch_args = list(launch_args)
+
+    @property
+    def is_companion(self):
+        return self.kind == PROGRAM_KIND_COMPANION
+
+    def __repr__(self):
+        return f"<ProgramSpec {self.key}>"
+
+
+class WebsiteSpec:
+    """A website that can be opened alongside the game"""
+
+    def __init__(self, key, start_attr, url, display_name):
+        self.key = key
+        self.start_attr = start_attr
+        self.url = url
+        self.display_name = display_name
+
+
+class Catalog:
+    """Programs compiled into the lookup tables used by detection and launch"""
+
+    def __init__(self, programs, websites=()):
+        self.programs = list(programs)
+        self.websites = list(websites)
+        self.by_key = {}
+        self.by_exe_name = {}
+        self.by_file_keyword = {}
+
+        for spec in self.programs:
+            if spec.key in self.by_key:
+                raise ValueError(f"Duplicate program key: {spec.key}")
+            self.by_key[spec.key] = spec
+            for exe_name in spec.exe_names + spec.alt_exe_names:
+                self.by_exe_name.setdefault(exe_name.lower(), spec)
+            for words in spec.file_keywords:
+                self.by_file_keyword.setdefault(words[0], []).append((spec, words))
+
+        self.keys = [spec.key for spec in self.programs]
+        self.companions = [spec for spec in self.programs if spec.is_companion]
+
+    def __iter__(self):
+        return iter(self.programs)
+
+    def __getitem__(self, key):
+        return self.by_key[key]
+
+    def __contains__(self, key):
+        return key in self.by_key
+
+    def for_version(self, game_version):
+        """Programs relevant to the selected game version"""
+        return [spec for spec in self.programs
+                if spec.game_version is None or spec.game_version == game_version]
+
+    def match_file_name(self, file_name):
+        """Return the spec whose file keywords all appear in the file name, or None"""
+        lowered = file_name.lower()
+        spec = self.by_exe_name.get(lowered)
+        if spec and spec.file_keywords:
+            return spec
+        for first, candidates in self.by_file_keyword.items():
+            if first not in lowered:
+                continue
+            for spec, words in candidates:
+                if all(word in lowered for word in words[1:]):
+                    return spec
+        return None
+
+
+PROGRAMS = [
+    ProgramSpec(
+        'steam', PROGRAM_KIND_LAUNCHER, 'Steam', 'steam_path', ['steam.exe'],
+        browse_title="Steam executable (steam.exe)",
+        game_version='steam',
+        registry_queries=[('steam',)],
+        filesystem_locations=[
+            ('Program Files (x86)', 'Steam', 'steam.exe'),
+            ('Program Files', 'Steam', 'steam.exe'),
+            ('Steam', 'steam.exe'),
+        ],
+    ),
+    ProgramSpec(
+        'poe_standalone', PROGRAM_KIND_GAME, 'Path of Exile (Standalone)', 'standalone_path',
+        ['PathOfExile.exe'],
+        browse_title="Path of Exile executable (PathOfExile.exe)",
+        game_version='standalone',
+        registry_queries=[('path', 'exile')],
+        filesystem_locations=[
+            ('Program Files (x86)', 'Grinding Gear Games', 'Path of Exile', 'PathOfExile.exe'),
+            ('Program Files', 'Grinding Gear Games', 'Path of Exile', 'PathOfExile.exe'),
+            ('Games', 'Path of Exile', 'PathOfExile.exe'),
+        ],
+    ),
+    ProgramSpec(
+        'awakened_trade', PROGRAM_KIND_COMPANION, 'Awakened PoE Trade', 'awakened_path',
+        ['Awakened PoE Trade.exe'],
+        start_attr='start_awakened',
+        registry_queries=[('awakened', 'poe')],
+        filesystem_locations=[
+            ('Program Files', 'Awakened PoE Trade', 'Awakened PoE Trade.exe'),
+        ],
+        appdata_locations=[('Programs', 'Awakened PoE Trade', 'Awakened PoE Trade.exe')],
+        file_keywords=[('awakened', 'poe')],
+    ),
+    ProgramSpec(
+        'poe_lurker', PROGRAM_KIND_COMPANION, 'PoE Lurker', 'lurker_path',
+        ['PoeLurker.exe', 'Poe Lurker.exe'],
+        start_attr='start_lurker',
+        registry_queries=[('lurker',)],
+        filesystem_locations=[
+            ('Program Files', 'Poe Lurker', 'Poe Lurker.exe'),
+            ('Program Files (x86)', 'Poe Lurker', 'Poe Lurker.exe'),
+        ],
+        appdata_versioned=[('PoeLurker', 'PoeLurker.exe')],
+        file_keywords=[('lurker',)],
+    ),
+    ProgramSpec(
+        'chaos_recipe', PROGRAM_KIND_COMPANION, 'Chaos Recipe Enhancer', 'chaos_recipe_path',
+        ['ChaosRecipeEnhancer.exe'],
+        start_attr='start_chaos_recipe',
+        registry_queries=[('chaos', 'recipe')],
+        filesystem_locations=[
+            ('Program Files (x86)', 'Chaos Recipe Enhancer', 'ChaosRecipeEnhancer.exe'),
+            ('Program Files', 'Chaos Recipe Enhancer', 'ChaosRecipeEnhancer.exe'),
+            ('Program Files (x86)', 'ChaosRecipeEnhancer', 'ChaosRecipeEnhancer.exe'),
+            ('Program Files', 'ChaosRecipeEnhancer', 'ChaosRecipeEnhancer.exe'),
+        ],
+        appdata_locations=[('Programs', 'ChaosRecipeEnhancer', 'ChaosRecipeEnhancer.exe')],
+        file_keywords=[('chaosrecipe',)],
+        deep_search=True,
+        alt_exe_names=[
+            'ChaosRecipeEnhancer.exe',
+            'Chaos Recipe Enhancer.exe',
+            'CRE.exe',
+            'chaos-recipe-enhancer.exe',
+        ],
+        portable_dirs=['PortableApps', 'Tools', 'Games', 'Utilities'],
+    ),
+]
+
+WEBSITES = [
+    WebsiteSpec('filterblade', 'open_filterblade', "https://www.filterblade.xyz", "FilterBlade"),
+    WebsiteSpec('trade_site', 'open_trade_site', "https://www.pathofexile.com/trade", "Trade Site"),
+]
+
+CATALOG = Catalog(PROGRAMS, WEBSITES)
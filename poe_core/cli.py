@@ -0,0 +1,181 @@
+"""Headless entry point: launch or detect without building the Tk window
+
+Usage:
+    python -m poe_core.cli --launch [--supervise] [--profile NAME] [--trace FILE] [--json] [--config PATH]
+    python -m poe_core.cli --detect [--force] [--apply] [--timings] [--profile NAME] [--json] [--config PATH]
+    python -m poe_core.cli --history [--json] [--config PATH]
+
+poe_launcher.py forwards to this module whenever it is started with
+arguments, before tkinter is imported.
+"""
+import argparse
+import contextlib
+import json
+import sys
+
+from poe_core.catalog import CATALOG
+from poe_core.config import default_config_file, launch_history_dir
+from poe_core.profiles import UnknownProfileError
+
+EXIT_OK = 0
+EXIT_ERRORS = 1
+EXIT_USAGE = 2
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='poe_launcher',
+        description="Path of Exile Launcher without the GUI")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument('--launch', action='store_true',
+                        help="launch the game and companions enabled in the config")
+    action.add_argument('--detect', action='store_true',
+                        help="detect installed programs")
+    action.add_argument('--history', action='store_true',
+                        help="compare the last launch with the earlier ones, per phase")
+    parser.add_argument('--json', action='store_true',
+                        help="print a JSON report on stdout (log output goes to stderr)")
+    parser.add_argument('--config', default=None,
+                        help="config.json to use (default: the launcher's config)")
+    parser.add_argument('--profile', default=None,
+                        help="settings profile to use (default: the active profile)")
+    parser.add_argument('--trace', default=None, metavar='FILE',
+                        help="with --launch: write the launch timeline as a Chrome trace (chrome://tracing)")
+    parser.add_argument('--supervise', action='store_true',
+                        help="with --launch: restart crashed companions and stop them when the game exits")
+    parser.add_argument('--force', action='store_true',
+                        help="with --detect: also run the slower enhanced searches")
+    parser.add_argument('--apply', action='store_true',
+                        help="with --detect: store found paths for empty fields in the config")
+    parser.add_argument('--timings', action='store_true',
+                        help="with --detect: time and count every probe (per strategy, drive and folder)")
+    return parser
+
+
+def load_engine(config_file):
+    from poe_core.engine import Engine
+
+    return Engine(config_file).load()
+
+
+def run_launch(args, config_file):
+    from poe_core.tracing import Tracer
+
+    tracer = Tracer()
+    with tracer.span("load_settings"):
+        engine = load_engine(config_file)
+        settings = engine.settings(args.profile)
+    report = engine.launch(settings, tracer=tracer, profile=args.profile)
+    if args.trace:
+        tracer.export(args.trace)
+        print(f"Launch trace written to: {args.trace}")
+    result = report.to_dict()
+    if (args.supervise or settings.get('supervise_companions')) and report.started:
+        # Report the launch now; supervising blocks until the game exits
+        emit_report(result, args.json, args.stdout)
+        result['supervised'] = engine.supervise(settings, report)
+        result['reported'] = True
+    return (EXIT_OK if report.ok else EXIT_ERRORS), result
+
+
+def run_history(args, config_file):
+    from poe_core.tracing import LaunchHistory
+
+    history = LaunchHistory(launch_history_dir(config_file))
+    report = {
+        'ok': True,
+        'launches': history.entries(),
+        'comparison': [{'phase': phase, 'latest_ms': latest, 'median_ms': median}
+                       for phase, latest, median in history.compare()],
+    }
+    return EXIT_OK, report
+
+
+def run_detect(args, config_file):
+    from poe_core.engine import merge_detected
+
+    engine = load_engine(config_file)
+    settings = engine.settings(args.profile)
+    report = engine.detect(settings.get('game_version', 'steam'), force=args.force, timings=args.timings)
+
+    applied = []
+    if args.apply:
+        # Same rule as the GUI on startup: only fill in empty paths
+        applied = merge_detected(settings, report['detected'])
+        if applied:
+            engine.save(settings, args.profile)
+
+    report = {'ok': True, **report, 'applied': applied}
+    return EXIT_OK, report
+
+
+def print_report(report):
+    """Human readable summary for terminal use"""
+    if 'launched' in report:
+        print(f"Launched: {', '.join(report['launched']) or 'nothing'}")
+        for error in report['errors']:
+            print(f"Error: {error}")
+    elif 'comparison' in report:
+        if not report['comparison']:
+            print("No launches recorded yet")
+            return
+        print(f"{len(report['launches'])} launches recorded; last launch vs median of the earlier ones:")
+        for row in report['comparison']:
+            median = f"{row['median_ms']:10.1f}" if row['median_ms'] is not None else f"{'-':>10}"
+            print(f"  {row['phase']:<40} {row['latest_ms']:10.1f} ms  {median} ms")
+    else:
+        for key, path in report['detected'].items():
+            print(f"{CATALOG[key].display_name}: {path}")
+        for key in report['missing']:
+            print(f"{CATALOG[key].display_name}: not found")
+        if 'timings' in report:
+            from poe_core.detection_profile import format_report
+            print()
+            print(format_report(report['timings']))
+
+
+def emit_report(report, as_json, out):
+    """Print a report to out, as JSON or for terminal use
+
+    out is None in the windowed executable, which has no stdout; the exit
+    code is all it reports.
+    """
+    if out is None:
+        return
+    if as_json:
+        print(json.dumps(report, indent=2, ensure_ascii=False), file=out)
+    else:
+        with contextlib.redirect_stdout(out):
+            print_report(report)
+    out.flush()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    config_file = args.config or default_config_file()
+    if args.launch:
+        action = run_launch
+    elif args.history:
+        action = run_history
+    else:
+        action = run_detect
+
+    # Reports go to the real stdout even while --json sends log output to stderr
+    args.stdout = sys.stdout
+    try:
+        if args.json:
+            # Keep stdout clean for the JSON report
+            with contextlib.redirect_stdout(sys.stderr):
+                code, report = action(args, config_file)
+        else:
+            code, report = action(args, config_file)
+        if not report.pop('reported', False):
+            emit_report(report, args.json, args.stdout)
+    except UnknownProfileError as e:
+        print(e.args[0], file=sys.stderr)
+        return EXIT_USAGE
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""Location, defaults and persistence of config.json"""
+import json
+import os
+import stat
+import tempfile
+import threading
+
+from poe_core.catalog import CATALOG
+from poe_core.readiness import DEFAULT_STEAM_SIGNAL, DEFAULT_STEAM_TIMEOUT
+from poe_core.translations import system_language
+
+# Launches kept in the launch trace history (0 disables it)
+DEFAULT_HISTORY_SIZE = 20
+
+
+def config_dir():
+    """Directory holding config.json and the launcher's caches"""
+    if os.name == 'nt':  # Windows
+        return os.path.expanduser('~\\AppData\\Local\\PoELauncher')
+    return os.path.expanduser('~/.config/PoeLauncher')
+
+
+def default_config_file():
+    return os.path.join(config_dir(), 'config.json')
+
+
+def launch_history_dir(config_file=None):
+    """Folder for launch traces, next to config.json"""
+    directory = os.path.dirname(config_file) if config_file else config_dir()
+    return os.path.join(directory, 'launch_traces')
+
+
+def default_settings():
+    """Settings used when config.json is missing or incomplete"""
+    settings = {'game_version': 'steam'}
+    for spec in CATALOG:
+        settings[spec.path_attr] = ''
+        if spec.start_attr:
+            settings[spec.start_attr] = False
+    for site in CATALOG.websites:
+        settings[site.start_attr] = False
+    settings['supervise_companions'] = False
+    settings['language'] = system_language()
+    settings['steam_ready_timeout'] = DEFAULT_STEAM_TIMEOUT
+    settings['steam_ready_signal'] = DEFAULT_STEAM_SIGNAL
+    settings['steam_ready_port'] = 0
+    settings['launch_history'] = DEFAULT_HISTORY_SIZE
+    settings['detect_in_process'] = True
+    return settings
+
+
+def read_config(config_file):
+    """Return the raw dict stored in config.json, or None if there is none"""
+    if not os.path.exists(config_file):
+        return None
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def serialize_config(settings):
+    return json.dumps(settings, indent=2, ensure_ascii=False)
+
+
+_umask = None
+_umask_lock = threading.Lock()
+
+
+def _read_umask():
+    # Linux reports it without changing it
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('Umask:'):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    # Elsewhere os.umask can only be read by setting it
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+def umask():
+    """The process umask, read on first use (the first write_atomic)"""
+    global _umask
+    with _umask_lock:
+        if _umask is None:
+            _umask = _read_umask()
+        return _umask
+
+
+def file_mode(path):
+    """Permission bits of an existing file, else what open() would create under the umask"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~umask()
+
+
+def write_atomic(path, text):
+    """Replace a file with new text so readers only ever see the old or the new content
+
+    The text goes to a temporary file in the same folder, is flushed to disk
+    and then renamed over the target, so a crash mid-write leaves the
+    previous file intact.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        if os.name != 'nt':
+            # mkstemp creates the file 0600; keep the mode of the file it replaces
+            os.fchmod(fd, file_mode(path))
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    if os.name != 'nt':
+        # Make the rename itself durable
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+
+class ConfigStore:
+    """config.json with atomic writes that skip unchanged content
+
+    Remembers the text last read or written, so saving the same settings
+    again does not touch the disk. Safe to call from several threads.
+    """
+
+    def __init__(self, config_file):
+        self.config_file = config_file
+        self.last_text = None
+        self.writes = 0
+        self.lock = threading.Lock()
+
+    def read(self):
+        """Raw dict stored in config.json, or None if there is none"""
+        config = read_config(self.config_file)
+        if config is not None:
+            with self.lock:
+                self.last_text = serialize_config(config)
+        return config
+
+    def save(self, settings):
+        """Write settings if they changed; returns True if the file was written"""
+        text = serialize_config(settings)
+        with self.lock:
+            if text == self.last_text:
+                return False
+            write_atomic(self.config_file, text)
+            self.last_text = text
+            self.writes += 1
+        return True
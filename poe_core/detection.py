@@ -0,0 +1,313 @@
+"""Detection of installed programs (registry, drives, AppData, loose files)"""
+import contextlib
+import os
+import time
+
+from poe_core.catalog import CATALOG
+from poe_core.drives import DriveProber
+from poe_core.file_search import FileSearch
+from poe_core.registry import RegistryIndex
+from poe_core.squirrel import RESOLVER
+from poe_core.steam_library import POE_EXE_NAME, POE_INSTALL_DIR, SteamLibraryIndex
+
+
+def normalize_path(path):
+    """Normalize path to use consistent Windows backslashes"""
+    if not path:
+        return path
+    # Convert forward slashes to backslashes and normalize
+    return os.path.normpath(path.replace('/', '\\'))
+
+
+class DetectionCancelled(Exception):
+    """A detection run was cancelled between two strategies"""
+
+
+class Detector:
+    """Runs the detection strategies over the program catalog
+
+    Works on plain data only - results are dicts of program key -> path -
+    so it can run without a GUI, in a worker thread or another process.
+    """
+
+    def __init__(self, catalog=CATALOG, drive_prober=None, registry_index=None,
+                 detection_cache=None, file_search=None, shortcut_search=None, windows=None,
+                 versioned_resolver=None):
+        self.catalog = catalog
+        # Drive prober keeps its blacklist of unresponsive drives for the session
+        self.drive_prober = drive_prober or DriveProber()
+        # Uninstall registry entries, re-read only when the keys change
+        self.registry_index = registry_index or RegistryIndex()
+        self.detection_cache = detection_cache
+        # Bounded scandir walk of Desktop, Downloads and Documents
+        self.file_search = file_search or FileSearch(catalog)
+        # Start Menu and Desktop shortcuts, parsed without COM
+        self.shortcut_search = shortcut_search or FileSearch(catalog, max_depth=3, shortcuts=True)
+        # Newest app-x.y.z build of Squirrel installs, cached per folder mtime
+        self.versioned_resolver = versioned_resolver or RESOLVER
+        # Filesystem strategies only make sense with Windows drive letters
+        self.windows = os.name == 'nt' if windows is None else windows
+        # DetectionProfiler of the running detection, if profiling was requested
+        self.profiler = None
+
+    def _exists(self, path, root=None, kind='folder'):
+        """os.path.exists, timed and counted while a profiler is attached"""
+        if self.profiler is None:
+            return os.path.exists(path)
+        return self.profiler.timed_exists(path, root, kind)
+
+    def detect_from_registry(self):
+        """Detect installed programs from Windows registry"""
+        detected = {}
+
+        # Skip registry detection where there is no registry
+        index = self.registry_index
+        if not index.available:
+            return detected
+
+        # Walk the Uninstall keys only if they changed since the last detection
+        if index.refresh():
+            print(f"Registry index built: {len(index.entries)} uninstall entries")
+
+        # Match every catalogued program against the shared index
+        for spec in self.catalog:
+            for query in spec.registry_queries:
+                for entry in index.query(*query):
+                    exe_path = self.find_exe_in_location(entry.install_location, spec.exe_names)
+                    if exe_path:
+                        detected[spec.key] = exe_path
+
+        return detected
+
+    def find_exe_in_location(self, location, exe_names):
+        """Find executable in given location, supports single name or list"""
+        if not location or not self._exists(location, location):
+            return None
+
+        if isinstance(exe_names, str):
+            exe_names = [exe_names]
+
+        for exe_name in exe_names:
+            exe_path = os.path.join(location, exe_name)
+            if self._exists(exe_path, location):
+                return exe_path
+
+        return None
+
+    def get_all_drives(self):
+        """Get all available drive letters (checked in parallel, slow drives skipped)"""
+        return self.drive_prober.available_roots()
+
+    def detect_from_filesystem(self, game_version='steam'):
+        """Detect programs using filesystem patterns"""
+        detected = {}
+
+        # Skip filesystem detection on non-Windows platforms
+        if not self.windows:
+            return detected
+
+        # Only search for programs relevant to current game version
+        programs = self.catalog.for_version(game_version)
+
+        # Search all drives in parallel, stopping once every program is found
+        wanted = {}
+        for spec in programs:
+            if spec.filesystem_locations:
+                wanted[spec.key] = [os.path.join(*parts) for parts in spec.filesystem_locations]
+        detected.update(self.drive_prober.find(wanted))
+
+        # Special handling for AppData programs
+        try:
+            localappdata = os.path.expandvars('%LOCALAPPDATA%')
+
+            for spec in programs:
+                if spec.key in detected:
+                    continue
+
+                # Fixed install folders below AppData
+                for parts in spec.appdata_locations:
+                    appdata_path = os.path.join(localappdata, *parts)
+                    if self._exists(appdata_path, localappdata):
+                        detected[spec.key] = appdata_path
+                        break
+
+                # Installs with wildcard version folders
+                for base, exe_name in spec.appdata_versioned:
+                    if spec.key in detected:
+                        break
+                    versioned_path = self.versioned_resolver.resolve(os.path.join(localappdata, base), exe_name)
+                    if versioned_path:
+                        detected[spec.key] = versioned_path
+
+        except Exception as e:
+            print(f"Error checking AppData locations: {e}")
+
+        return detected
+
+    def detect_steam_games(self, steam_path):
+        """Detect games in Steam libraries"""
+        detected = {}
+        if not steam_path or not os.path.exists(steam_path):
+            return detected
+
+        steam_dir = os.path.dirname(steam_path)
+
+        # Look Path of Exile up in the app index of libraryfolders.vdf and its appmanifest
+        try:
+            poe_path = SteamLibraryIndex(steam_dir).find_poe()
+            if poe_path:
+                detected['poe_steam'] = poe_path
+                return detected
+        except (OSError, ValueError) as e:
+            print(f"Error parsing Steam library folders: {e}")
+
+        # Check default Steam library
+        default_library = os.path.join(steam_dir, 'steamapps', 'common', POE_INSTALL_DIR, POE_EXE_NAME)
+        if os.path.exists(default_library):
+            detected['poe_steam'] = default_library
+
+        return detected
+
+    def shortcut_folders(self):
+        """Folders whose shortcuts are resolved by the shortcut detection"""
+        return [
+            os.path.expandvars('%APPDATA%\\Microsoft\\Windows\\Start Menu\\Programs'),
+            os.path.expandvars('%PROGRAMDATA%\\Microsoft\\Windows\\Start Menu\\Programs'),
+            os.path.expanduser('~\\Desktop'),
+            os.path.expandvars('%PUBLIC%\\Desktop')
+        ]
+
+    def detect_from_shortcuts(self):
+        """Detect programs from Start Menu and Desktop shortcuts"""
+        if not self.windows:
+            return {}
+
+        def on_match(folder, path, spec):
+            print(f"Found {spec.display_name} via shortcut in {folder}: {path}")
+
+        return self.shortcut_search.search(self.shortcut_folders(), wanted=self.catalog.keys,
+                                           on_match=on_match)
+
+    def search_folders(self):
+        """Folders searched for loose executables by the enhanced detection"""
+        return [
+            os.path.expanduser('~\\Desktop'),
+            os.path.expanduser('~\\Downloads'),
+            os.path.expanduser('~\\Documents'),
+            os.path.expandvars('%PUBLIC%\\Desktop')
+        ]
+
+    def detect_enhanced_methods(self):
+        """Enhanced detection methods for hard-to-find programs"""
+        detected = {}
+
+        if not self.windows:
+            return detected
+
+        # 1. Desktop and Downloads folder detection, all folders searched in parallel
+        def on_match(folder, path, spec):
+            print(f"Found {spec.display_name} in {folder}: {path}")
+
+        try:
+            detected.update(self.file_search.search(self.search_folders(), on_match=on_match))
+        except Exception as e:
+            print(f"Folder detection failed: {e}")
+
+        # 2. Alternative executable names in common portable app locations
+        wanted = {}
+        for spec in self.catalog:
+            if spec.key not in detected and spec.alt_exe_names:
+                wanted[spec.key] = [os.path.join(location, alt_name)
+                                    for alt_name in spec.alt_exe_names
+                                    for location in spec.portable_dirs]
+        if wanted:
+            for key, search_path in self.drive_prober.find(wanted).items():
+                detected[key] = search_path
+                print(f"Found {self.catalog[key].display_name} in portable location: {search_path}")
+
+        return detected
+
+    def attach_profiler(self, profiler):
+        """Let every detection component report to a profiler (None detaches)"""
+        self.profiler = profiler
+        for component in (self.registry_index, self.drive_prober, self.file_search, self.shortcut_search):
+            component.profiler = profiler
+
+    def run_strategies(self, strategies, profiler=None, progress=None, cancel=None, searched_keys=None):
+        """Run detection strategies in order; earlier strategies win
+
+        strategies is a list of (name, searched locations label, function
+        taking the results so far). Returns (detected, detection_results).
+        searched_keys are the programs the strategies looked for (default:
+        the whole catalog); only those are cached as missing.
+        With a DetectionProfiler, every probe of the run is timed and counted.
+        progress(name, result, detected) is called after every strategy, and
+        once cancel (an Event) is set DetectionCancelled is raised before the
+        next one.
+        """
+        detected = {}
+        detection_results = {}
+
+        if profiler is not None:
+            self.attach_profiler(profiler)
+        try:
+            for name, searched, strategy in strategies:
+                if cancel is not None and cancel.is_set():
+                    raise DetectionCancelled(f"Detection cancelled before {name}")
+                start = time.perf_counter()
+                timing = profiler.strategy(name) if profiler else contextlib.nullcontext()
+                try:
+                    with timing:
+                        found = strategy(detected)
+                    # Only add if not already detected
+                    for key, value in found.items():
+                        if key not in detected:
+                            detected[key] = value
+                    detection_results[name] = {'found': list(found.keys()), 'searched': searched}
+                    print(f"{name.capitalize()} detection found: {list(found.keys())}")
+                except Exception as e:
+                    detection_results[name] = {'found': [], 'searched': searched, 'error': str(e)}
+                    print(f"{name.capitalize()} detection failed: {e}")
+                detection_results[name]['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 1)
+                if progress is not None:
+                    progress(name, detection_results[name], dict(detected))
+        finally:
+            if profiler is not None:
+                self.attach_profiler(None)
+
+        # Remember results so the next startup can skip the scan
+        if self.detection_cache is not None:
+            if searched_keys is None:
+                searched_keys = self.catalog.keys
+            self.detection_cache.record(detected, searched_keys)
+
+        return detected, detection_results
+
+    def searched_keys(self, game_version):
+        """Programs a detection run for this game version looks for"""
+        return [spec.key for spec in self.catalog.for_version(game_version)]
+
+    def auto_detect(self, game_version='steam', profiler=None, progress=None, cancel=None):
+        """Startup detection: registry, drive patterns and Steam libraries"""
+        print("Starting auto-detection of installations...")
+
+        def steam_games(detected):
+            # Only if Steam was found
+            return self.detect_steam_games(detected.get('steam'))
+
+        return self.run_strategies([
+            ('registry', 'Windows Registry', lambda detected: self.detect_from_registry()),
+            ('filesystem', 'Program Files', lambda detected: self.detect_from_filesystem(game_version)),
+            ('shortcuts', 'Start Menu, Desktop', lambda detected: self.detect_from_shortcuts()),
+            ('steam games', 'Steam Libraries', steam_games),
+        ], profiler, progress, cancel, self.searched_keys(game_version))
+
+    def auto_detect_force(self, game_version='steam', profiler=None, progress=None, cancel=None):
+        """Manual detection: registry, drive patterns and the enhanced searches"""
+        print("Starting forced auto-detection of installations...")
+        return self.run_strategies([
+            ('registry', 'Windows Registry', lambda detected: self.detect_from_registry()),
+            ('filesystem', 'Program Files', lambda detected: self.detect_from_filesystem(game_version)),
+            ('shortcuts', 'Start Menu, Desktop', lambda detected: self.detect_from_shortcuts()),
+            ('enhanced', 'Desktop, Downloads, Portable Apps', lambda detected: self.detect_enhanced_methods()),
+        ], profiler, progress, cancel, self.searched_keys(game_version))
@@ -0,0 +1,105 @@
+"""Persistent cache of auto-detection results keyed on file fingerprints"""
+import json
+import os
+import time
+
+from poe_core.catalog import CATALOG
+from poe_core.config import write_atomic
+
+CACHE_VERSION = 1
+
+# Programs that are not installed are only re-searched after this many seconds
+DEFAULT_NEGATIVE_TTL = 24 * 60 * 60
+
+# Detection keys the launcher keeps paths for
+DETECTION_KEYS = tuple(CATALOG.keys)
+
+
+def fingerprint(path):
+    """Return (mtime, size) of a file, or None if it cannot be stat'ed"""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return [st.st_mtime, st.st_size]
+
+
+class DetectionCache:
+    """Remembers found paths (with fingerprints) and misses (with a TTL)"""
+
+    def __init__(self, cache_file, negative_ttl=DEFAULT_NEGATIVE_TTL, clock=time.time):
+        self.cache_file = cache_file
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.found = {}
+        self.missing = {}
+        self.load()
+
+    def load(self):
+        """Load the cache file, starting empty if it is missing or unreadable"""
+        self.found = {}
+        self.missing = {}
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_VERSION:
+                    self.found = data.get('found', {})
+                    self.missing = data.get('missing', {})
+        except Exception as e:
+            print(f"Error loading detection cache: {e}")
+
+    def save(self):
+        """Write the cache next to the config file"""
+        data = {'version': CACHE_VERSION, 'found': self.found, 'missing': self.missing}
+        try:
+            write_atomic(self.cache_file, json.dumps(data, ensure_ascii=False))
+        except Exception as e:
+            print(f"Error saving detection cache: {e}")
+
+    def lookup(self, keys):
+        """Re-validate cached entries for the given keys with one stat each
+
+        Returns (hits, stale): hits maps keys to still-valid paths, stale lists
+        the keys that need a real filesystem scan. Keys cached as missing
+        within the TTL are in neither.
+        """
+        hits = {}
+        stale = []
+        now = self.clock()
+        for key in keys:
+            entry = self.found.get(key)
+            if entry:
+                if fingerprint(entry['path']) == entry.get('fingerprint'):
+                    hits[key] = entry['path']
+                else:
+                    stale.append(key)
+                continue
+
+            checked_at = self.missing.get(key)
+            if checked_at is None or now - checked_at > self.negative_ttl:
+                stale.append(key)
+        return hits, stale
+
+    def record(self, detected, searched_keys=DETECTION_KEYS):
+        """Store the results of a detection run and save the cache"""
+        now = self.clock()
+        for key, path in detected.items():
+            fp = fingerprint(path)
+            if fp is None:
+                continue
+            self.found[key] = {'path': path, 'fingerprint': fp}
+            self.missing.pop(key, None)
+
+        for key in searched_keys:
+            if key not in detected:
+                self.found.pop(key, None)
+                self.missing[key] = now
+
+        self.save()
+
+    def clear(self):
+        """Forget everything so the next startup rescans"""
+        self.found = {}
+        self.missing = {}
+        self.save()
@@ -0,0 +1,169 @@
+"""Per-strategy, per-root and per-path timing of a detection run
+
+The detection components (registry index, drive prober, folder search)
+report what they do to a DetectionProfiler while one is attached, so a
+slow drive or folder on a given machine can be singled out.
+"""
+import contextlib
+import heapq
+import itertools
+import os
+import threading
+import time
+
+# Slowest individual probes kept in the report
+DEFAULT_KEEP_SLOWEST = 25
+
+# Counter names
+EXISTS_CALLS = 'exists_calls'
+DIRS_LISTED = 'dirs_listed'
+ENTRIES_SEEN = 'entries_seen'
+SHORTCUTS_PARSED = 'shortcuts_parsed'
+REGISTRY_KEYS = 'registry_keys_visited'
+
+
+class RootStats:
+    """Work done below one drive or search folder"""
+
+    def __init__(self, root, kind):
+        self.root = root
+        self.kind = kind
+        self.elapsed = 0.0
+        self.probe_time = 0.0
+        self.counters = {}
+        self.timed_out = False
+
+    def to_dict(self):
+        return {
+            'root': self.root,
+            'kind': self.kind,
+            'elapsed_ms': round(self.elapsed * 1000, 2),
+            'probe_ms': round(self.probe_time * 1000, 2),
+            'counters': dict(self.counters),
+            'timed_out': self.timed_out,
+        }
+
+
+class DetectionProfiler:
+    """Collects timings and counters from any thread during one detection run"""
+
+    def __init__(self, clock=time.perf_counter, keep_slowest=DEFAULT_KEEP_SLOWEST):
+        self.clock = clock
+        self.keep_slowest = keep_slowest
+        self.origin = clock()
+        self.counters = {}
+        self.strategies = {}
+        self.roots = {}
+        # min-heap of (elapsed, sequence, probe dict) holding the slowest probes
+        self.slowest = []
+        self.sequence = itertools.count()
+        self.current = None
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def strategy(self, name):
+        """Attribute everything inside the with block to a detection strategy"""
+        stats = {'elapsed_ms': 0.0, 'counters': {}}
+        with self.lock:
+            self.strategies[name] = stats
+            self.current = name
+        start = self.clock()
+        try:
+            yield stats
+        finally:
+            with self.lock:
+                stats['elapsed_ms'] = round((self.clock() - start) * 1000, 2)
+                self.current = None
+
+    def _root(self, root, kind):
+        stats = self.roots.get((root, kind))
+        if stats is None:
+            stats = self.roots[(root, kind)] = RootStats(root, kind)
+        return stats
+
+    def _add(self, counter, n, root=None, kind=None):
+        self.counters[counter] = self.counters.get(counter, 0) + n
+        if self.current is not None:
+            counters = self.strategies[self.current]['counters']
+            counters[counter] = counters.get(counter, 0) + n
+        if root is not None:
+            counters = self._root(root, kind).counters
+            counters[counter] = counters.get(counter, 0) + n
+
+    def count(self, counter, n=1, root=None, kind='folder'):
+        with self.lock:
+            self._add(counter, n, root, kind)
+
+    def probe(self, op, path, elapsed, root=None, kind='drive', counter=EXISTS_CALLS, n=1):
+        """Record one timed filesystem operation"""
+        with self.lock:
+            self._add(counter, n, root, kind)
+            if root is not None:
+                self._root(root, kind).probe_time += elapsed
+            entry = {'op': op, 'path': path, 'elapsed_ms': round(elapsed * 1000, 3),
+                     'strategy': self.current}
+            item = (elapsed, next(self.sequence), entry)
+            if len(self.slowest) < self.keep_slowest:
+                heapq.heappush(self.slowest, item)
+            elif elapsed > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, item)
+
+    def timed_exists(self, path, root=None, kind='drive', exists=os.path.exists):
+        """os.path.exists that is timed and counted"""
+        start = self.clock()
+        try:
+            return exists(path)
+        finally:
+            self.probe('exists', path, self.clock() - start, root, kind)
+
+    def root_done(self, root, kind, elapsed):
+        """Wall time spent on a drive or search folder"""
+        with self.lock:
+            self._root(root, kind).elapsed += elapsed
+
+    def root_timed_out(self, root, kind='drive'):
+        with self.lock:
+            self._root(root, kind).timed_out = True
+
+    def to_dict(self):
+        """Machine-readable report; roots and probes are sorted slowest first"""
+        with self.lock:
+            roots = sorted(self.roots.values(), key=lambda stats: (-stats.elapsed, stats.root))
+            slowest = [entry for _, _, entry in sorted(self.slowest, reverse=True)]
+            return {
+                'total_ms': round((self.clock() - self.origin) * 1000, 2),
+                'counters': dict(self.counters),
+                'strategies': {name: {'elapsed_ms': stats['elapsed_ms'], 'counters': dict(stats['counters'])}
+                               for name, stats in self.strategies.items()},
+                'roots': [stats.to_dict() for stats in roots],
+                'slowest_probes': slowest,
+            }
+
+
+def format_report(report, roots=10, probes=10):
+    """Plain text version of a DetectionProfiler report"""
+    lines = [f"Detection took {report['total_ms']:.1f} ms"]
+    counters = ', '.join(f"{name} {value}" for name, value in sorted(report['counters'].items()))
+    if counters:
+        lines.append(f"  {counters}")
+
+    lines.append("")
+    lines.append("Strategies:")
+    for name, stats in report['strategies'].items():
+        counters = ', '.join(f"{key} {value}" for key, value in sorted(stats['counters'].items()))
+        lines.append(f"  {name:<12} {stats['elapsed_ms']:9.1f} ms  {counters}")
+
+    if report['roots']:
+        lines.append("")
+        lines.append("Slowest drives and folders:")
+        for stats in report['roots'][:roots]:
+            note = '  TIMED OUT' if stats['timed_out'] else ''
+            counters = ', '.join(f"{key} {value}" for key, value in sorted(stats['counters'].items()))
+            lines.append(f"  {stats['root']:<40} {stats['elapsed_ms']:9.1f} ms  {counters}{note}")
+
+    if report['slowest_probes']:
+        lines.append("")
+        lines.append("Slowest probes:")
+        for probe in report['slowest_probes'][:probes]:
+            lines.append(f"  {probe['elapsed_ms']:9.2f} ms  {probe['op']:<7} {probe['path']}")
+    return "\n".join(lines)
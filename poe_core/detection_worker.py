@@ -0,0 +1,312 @@
+"""Run detection in a separate process and stream its progress back
+
+Directory walks and registry enumeration hold the GIL between system
+calls. In a worker process they cannot slow down the Tk main loop; the
+worker only sends small events (one per strategy, then the report) over a
+queue.
+
+One worker process serves all detections of a session. It keeps its
+Engine, so the RegistryIndex last-write stamps and the DriveProber's
+blacklist of unresponsive drives carry over from one run to the next, and
+the interpreter only starts once.
+"""
+import itertools
+import multiprocessing
+import queue
+import threading
+
+from poe_core.detection import DetectionCancelled
+
+# Events sent by the worker, each prefixed with the run id
+PROGRESS = 'progress'    # (PROGRESS, strategy name, strategy result, detected so far)
+DONE = 'done'            # (DONE, detection report)
+FAILED = 'failed'        # (FAILED, error message)
+CANCELLED = 'cancelled'  # (CANCELLED,)
+
+# Requests sent to the worker
+DETECT = 'detect'        # (DETECT, run id, game version, force, timings)
+CANCEL = 'cancel'        # (CANCEL, run id)
+STOP = 'stop'            # (STOP,)
+
+# Seconds a cancelled run gets to stop before the worker process is terminated
+CANCEL_TIMEOUT = 1.0
+# Seconds between checks that the worker process is still alive
+POLL_INTERVAL = 0.2
+
+
+def run_detection(engine, game_version, force, timings, events, cancel):
+    """Detect and put events on the queue"""
+    def progress(name, result, detected):
+        events.put((PROGRESS, name, result, detected))
+
+    try:
+        report = engine.detect(game_version, force, timings, progress=progress, cancel=cancel)
+    except DetectionCancelled:
+        events.put((CANCELLED,))
+    except Exception as e:
+        events.put((FAILED, str(e)))
+    else:
+        events.put((DONE, report))
+
+
+class RunEvents:
+    """Event queue of one run: puts its events on the shared queue, tagged with the run id"""
+
+    def __init__(self, events, run_id):
+        self.events = events
+        self.run_id = run_id
+
+    def put(self, event):
+        self.events.put((self.run_id,) + event)
+
+
+def detection_process_main(config_file, requests, events):
+    """Entry point of the worker process; one Engine serves every request
+
+    Detections run one after the other on a thread, so cancel requests are
+    read while a run is busy.
+    """
+    from poe_core.engine import Engine
+
+    engine = Engine(config_file)
+    pending = queue.Queue()
+    # run id -> threading.Event, for runs that are queued or running
+    cancels = {}
+    lock = threading.Lock()
+
+    def detect_loop():
+        while True:
+            request = pending.get()
+            if request is None:
+                return
+            run_id, game_version, force, timings = request
+            with lock:
+                cancel = cancels[run_id]
+            try:
+                run_detection(engine, game_version, force, timings, RunEvents(events, run_id), cancel)
+            finally:
+                with lock:
+                    del cancels[run_id]
+
+    thread = threading.Thread(target=detect_loop, name='detection')
+    thread.start()
+    try:
+        while True:
+            request = requests.get()
+            if request[0] == DETECT:
+                with lock:
+                    cancels[request[1]] = threading.Event()
+                pending.put(request[1:])
+            elif request[0] == CANCEL:
+                with lock:
+                    cancel = cancels.get(request[1])
+                if cancel is not None:
+                    cancel.set()
+            else:
+                with lock:
+                    for cancel in cancels.values():
+                        cancel.set()
+                break
+    finally:
+        pending.put(None)
+        thread.join()
+
+
+class DetectionWorker:
+    """The detection process of a session, started with its first run
+
+    If the process dies, e.g. because a cancelled run did not stop in
+    time, its runs are reported as cancelled or failed and the next run
+    starts a new process.
+    """
+
+    def __init__(self, config_file):
+        self.config_file = config_file
+        # spawn everywhere: forking a process that runs Tk is not safe
+        self.context = multiprocessing.get_context('spawn')
+        self.lock = threading.Lock()
+        self.process = None
+        self.requests = None
+        # run id -> DetectionRun, of the current process
+        self.runs = {}
+        self.run_ids = itertools.count(1)
+
+    def submit(self, run):
+        """Queue a run, starting the process if it is not running"""
+        with self.lock:
+            if self.process is None or not self.process.is_alive():
+                self.start_process()
+            run.run_id = next(self.run_ids)
+            run.process = self.process
+            self.runs[run.run_id] = run
+            self.requests.put((DETECT, run.run_id, run.game_version, run.force, run.timings))
+
+    def start_process(self):
+        events = self.context.Queue()
+        self.requests = self.context.Queue()
+        self.runs = {}
+        self.process = self.context.Process(target=detection_process_main, name='detection',
+                                            args=(self.config_file, self.requests, events))
+        self.process.daemon = True
+        self.process.start()
+        reader = threading.Thread(target=self.read_events, args=(self.process, events, self.runs),
+                                  name='detection events')
+        reader.daemon = True
+        reader.start()
+
+    def read_events(self, process, events, runs):
+        """Hand the events of one worker process to its runs until the process is gone"""
+        process_gone = False
+        while True:
+            try:
+                run_id, kind, *args = events.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if process_gone:
+                    break
+                # Its last events may still be in transit when the process exits
+                process_gone = not process.is_alive()
+                continue
+            with self.lock:
+                run = runs.get(run_id)
+            if run is not None and run.handle_event(kind, args):
+                with self.lock:
+                    runs.pop(run_id, None)
+
+        with self.lock:
+            unfinished = list(runs.values())
+            runs.clear()
+        for run in unfinished:
+            run.finished_without_report(process.exitcode)
+
+    def cancel(self, run, timeout=CANCEL_TIMEOUT):
+        """Cancel a run; the process is terminated if the run does not stop in time"""
+        with self.lock:
+            if run.process is not self.process or not self.process.is_alive():
+                return
+            self.requests.put((CANCEL, run.run_id))
+        if not run.finished.wait(timeout) and run.process.is_alive():
+            print("Terminating detection worker")
+            run.process.terminate()
+            run.process.join(timeout)
+
+    def stop(self, timeout=CANCEL_TIMEOUT):
+        """Cancel every run and end the process"""
+        with self.lock:
+            process = self.process
+            if process is None or not process.is_alive():
+                return
+            self.requests.put((STOP,))
+        process.join(timeout)
+        if process.is_alive():
+            print("Terminating detection worker")
+            process.terminate()
+            process.join(timeout)
+
+
+class DetectionRun:
+    """One detection run in the worker process (or a thread), reported through callbacks
+
+    The callbacks are called on a background thread: on_progress(name,
+    result, detected) after each strategy, then exactly one of
+    on_done(report), on_error(message) or on_cancelled(). GUI callers hand
+    them on to their UI thread. Without a worker, an in-process run gets a
+    process of its own.
+    """
+
+    def __init__(self, engine, game_version, force=False, timings=False, in_process=True,
+                 on_progress=None, on_done=None, on_error=None, on_cancelled=None, worker=None):
+        self.engine = engine
+        self.game_version = game_version
+        self.force = force
+        self.timings = timings
+        self.in_process = in_process
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancelled = on_cancelled
+        self.worker = worker
+        self.own_worker = False
+        self.report = None
+        self.run_id = None
+        self.process = None
+        self.started = False
+        self.cancel_requested = False
+        self.cancel_event = threading.Event()
+        self.finished = threading.Event()
+
+    def start(self):
+        self.started = True
+        if self.in_process:
+            if self.worker is None:
+                self.worker = DetectionWorker(self.engine.config_file)
+                self.own_worker = True
+            self.worker.submit(self)
+        else:
+            thread = threading.Thread(target=run_detection, name='detection',
+                                      args=(self.engine, self.game_version, self.force, self.timings,
+                                            self, self.cancel_event))
+            thread.daemon = True
+            thread.start()
+        return self
+
+    def put(self, event):
+        """Event sink of a run in a thread"""
+        self.handle_event(event[0], event[1:])
+
+    def handle_event(self, kind, args):
+        """Pass an event to the callbacks; True once the run is over"""
+        if kind == PROGRESS:
+            self.notify(self.on_progress, *args)
+            return False
+        if kind == DONE:
+            self.report = args[0]
+            if self.in_process:
+                # The worker updated detection_cache.json
+                self.engine.detection_cache.load()
+            self.notify(self.on_done, self.report)
+        elif kind == FAILED:
+            self.notify(self.on_error, args[0])
+        else:
+            self.notify(self.on_cancelled)
+        self.finish()
+        return True
+
+    def finished_without_report(self, exitcode=None):
+        """The worker process is gone without a final event: terminated or crashed"""
+        if self.cancel_requested:
+            self.notify(self.on_cancelled)
+        else:
+            self.notify(self.on_error, f"Detection worker exited unexpectedly (exit code {exitcode})")
+        self.finish()
+
+    def finish(self):
+        self.finished.set()
+        if self.own_worker:
+            threading.Thread(target=self.worker.stop, name='detection worker stop', daemon=True).start()
+
+    def notify(self, callback, *args):
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"Detection callback failed: {e}")
+
+    def cancel(self, timeout=CANCEL_TIMEOUT):
+        """Stop the run; a worker process that does not stop in time is terminated"""
+        if not self.running:
+            return
+        self.cancel_requested = True
+        self.cancel_event.set()
+        if self.in_process:
+            self.worker.cancel(self, timeout)
+
+    def wait(self, timeout=None):
+        """Block until the callbacks ran; returns the report or None"""
+        if self.started:
+            self.finished.wait(timeout)
+        return self.report
+
+    @property
+    def running(self):
+        return self.started and not self.finished.is_set()
@@ -0,0 +1,151 @@
+"""Concurrent probing of install locations across drives"""
+import os
+import queue
+import string
+import threading
+import time
+
+# A drive that does not answer within this many seconds is skipped for the session
+DEFAULT_DRIVE_TIMEOUT = 3.0
+
+
+def windows_drive_roots():
+    """All possible drive roots A:\\ to Z:\\"""
+    return [f"{letter}:\\" for letter in string.ascii_uppercase]
+
+
+class DriveProber:
+    """Checks candidate paths on every drive in parallel
+
+    Each drive is probed on its own daemon thread, so a disconnected network
+    drive or a sleeping USB disk only delays its own results. Drives that
+    miss their deadline are blacklisted for the lifetime of the prober.
+    """
+
+    def __init__(self, roots=None, exists=os.path.exists, drive_timeout=DEFAULT_DRIVE_TIMEOUT,
+                 clock=time.monotonic):
+        self.roots = list(roots) if roots is not None else windows_drive_roots()
+        self.exists = exists
+        self.drive_timeout = drive_timeout
+        self.clock = clock
+        self.blacklist = set()
+        self.lock = threading.Lock()
+        # DetectionProfiler attached for the current detection run, if any
+        self.profiler = None
+
+    def available_roots(self):
+        """Return the roots that exist, checking all of them concurrently"""
+        present = []
+        self._run({}, present)
+        return present
+
+    def find(self, wanted):
+        """Find programs across all drives
+
+        wanted maps a program key to a list of paths relative to a drive root,
+        in order of preference. Returns a dict of program key -> full path,
+        preferring earlier drives and then earlier patterns, like a serial scan.
+        """
+        return self._run(wanted, [])
+
+    def _run(self, wanted, present):
+        roots = [(index, root) for index, root in enumerate(self.roots) if root not in self.blacklist]
+        if not roots:
+            return {}
+
+        # program -> (drive index, pattern index, path)
+        best = {}
+        # Indexes of drives that missed their deadline; their results are dropped
+        timed_out = set()
+        profiler = self.profiler
+        stop = threading.Event()
+        events = queue.Queue()
+        deadlines = {}
+
+        for index, root in roots:
+            deadlines[index] = self.clock() + self.drive_timeout
+            thread = threading.Thread(target=self._probe_drive,
+                                      args=(index, root, wanted, best, timed_out, stop, events, profiler))
+            thread.daemon = True
+            thread.start()
+
+        pending = dict(roots)
+        while pending:
+            if wanted and self._settled(wanted, best, pending):
+                # Every program is found and no earlier drive can beat it
+                stop.set()
+                break
+
+            timeout = max(0.0, min(deadlines[index] for index in pending) - self.clock())
+            try:
+                kind, index, value = events.get(timeout=timeout)
+            except queue.Empty:
+                now = self.clock()
+                for index in [i for i in pending if deadlines[i] <= now]:
+                    root = pending.pop(index)
+                    with self.lock:
+                        self.blacklist.add(root)
+                        timed_out.add(index)
+                        # Probe threads past their deadline may still write
+                        for program in [p for p, found in best.items() if found[0] == index]:
+                            del best[program]
+                    print(f"Drive {root} did not respond within {self.drive_timeout}s, skipping it")
+                    if profiler:
+                        profiler.root_timed_out(root)
+                continue
+
+            if kind == 'present':
+                present.append((index, value))
+            elif kind == 'done':
+                pending.pop(index, None)
+
+        stop.set()
+        present.sort()
+        present[:] = [root for index, root in present]
+        with self.lock:
+            return {program: path for program, (drive, pattern, path) in best.items()
+                    if drive not in timed_out}
+
+    def _settled(self, wanted, best, pending):
+        with self.lock:
+            if len(best) < len(wanted):
+                return False
+            return all(not any(index < best[program][0] for index in pending) for program in wanted)
+
+    def _exists(self, path, root, profiler):
+        if profiler is None:
+            return self.exists(path)
+        return profiler.timed_exists(path, root, 'drive', self.exists)
+
+    def _probe_drive(self, index, root, wanted, best, timed_out, stop, events, profiler=None):
+        start = self.clock()
+        try:
+            if not self._exists(root, root, profiler):
+                return
+            events.put(('present', index, root))
+
+            for program, patterns in wanted.items():
+                for pattern_index, relative in enumerate(patterns):
+                    if stop.is_set():
+                        return
+                    with self.lock:
+                        current = best.get(program)
+                    if current and current[:2] <= (index, pattern_index):
+                        # An earlier drive or pattern already won
+                        break
+
+                    full_path = os.path.join(root, relative)
+                    if self._exists(full_path, root, profiler):
+                        with self.lock:
+                            if index in timed_out:
+                                return
+                            current = best.get(program)
+                            if not current or (index, pattern_index) < current[:2]:
+                                best[program] = (index, pattern_index, full_path)
+                        break
+        except Exception as e:
+            print(f"Error probing drive {root}: {e}")
+        finally:
+            if profiler:
+                profiler.root_done(root, 'drive', self.clock() - start)
+            events.put(('done', index, None))
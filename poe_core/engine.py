@@ -0,0 +1,159 @@
+"""Detection, launching and settings behind plain dicts
+
+The Tk window and the command line both drive the launcher through an
+Engine. Inputs and outputs are settings dicts (config.json layout) and
+JSON-ready reports, so detection can run in a worker thread or process
+and be benchmarked without a Tk root.
+"""
+import os
+
+from poe_core.catalog import CATALOG
+from poe_core.config import DEFAULT_HISTORY_SIZE, ConfigStore, default_config_file, launch_history_dir
+from poe_core.detection import Detector, normalize_path
+from poe_core.detection_cache import DetectionCache
+from poe_core.profiles import ProfileStore
+from poe_core.squirrel import current_build
+
+
+def detection_cache_file(config_file):
+    """detection_cache.json next to config.json"""
+    return os.path.join(os.path.dirname(config_file), 'detection_cache.json')
+
+
+def detection_report(game_version, detected, strategies, profiler=None):
+    """JSON-ready result of one detection run
+
+    detected only holds catalogued programs, with normalized paths.
+    """
+    detected = {key: normalize_path(path) for key, path in detected.items() if key in CATALOG}
+    report = {
+        'game_version': game_version,
+        'detected': detected,
+        'missing': [spec.key for spec in CATALOG.for_version(game_version) if spec.key not in detected],
+        'strategies': strategies,
+    }
+    if profiler:
+        report['timings'] = profiler.to_dict()
+    return report
+
+
+def merge_detected(settings, detected, overwrite=False):
+    """Copy detected paths into settings; returns the keys that changed
+
+    Without overwrite only empty paths are filled in, as on startup.
+    """
+    applied = []
+    for spec in CATALOG:
+        path = detected.get(spec.key)
+        if not path or settings.get(spec.path_attr) == path:
+            continue
+        if overwrite or not settings.get(spec.path_attr):
+            settings[spec.path_attr] = path
+            applied.append(spec.key)
+    return applied
+
+
+def missing_paths(settings):
+    """Detection keys of the settings' game version whose path is empty
+
+    Programs of the other game version (poe_standalone in Steam mode) are
+    never searched for, so they are not missing either.
+    """
+    return [spec.key for spec in CATALOG.for_version(settings.get('game_version', 'steam'))
+            if not settings.get(spec.path_attr)]
+
+
+class Engine:
+    """Settings profiles, the detector and the launcher of one config.json"""
+
+    def __init__(self, config_file=None, detector=None):
+        self.config_file = config_file or default_config_file()
+        self.config_store = ConfigStore(self.config_file)
+        self.profiles = ProfileStore(self.config_store)
+        self.detection_cache = DetectionCache(detection_cache_file(self.config_file))
+        self.detector = detector or Detector(detection_cache=self.detection_cache)
+        # Supervisor of the last launch while it runs
+        self.supervisor = None
+
+    def load(self):
+        """Read config.json (defaults only if it cannot be read)"""
+        try:
+            self.profiles.load()
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+        return self
+
+    def settings(self, profile=None):
+        return self.profiles.settings(profile)
+
+    def save(self, settings, profile=None):
+        """Store settings into a profile and write config.json if it changed"""
+        self.profiles.update(settings, profile)
+        return self.profiles.save()
+
+    def check_paths(self, settings, profile=None):
+        """Which companion paths exist; the results are remembered per profile
+
+        A path in an app-x.y.z folder counts as its newest build, the one
+        a launch starts.
+        """
+        states = {}
+        for spec in CATALOG.companions:
+            path = (settings.get(spec.path_attr) or '').strip()
+            states[spec.key] = bool(path and os.path.exists(current_build(path)))
+            self.profiles.remember_validation(spec.key, path, states[spec.key], profile)
+        return states
+
+    def cached_detection(self, settings):
+        """Still valid cached paths for empty fields, and the keys to search again"""
+        return self.detection_cache.lookup(missing_paths(settings))
+
+    def detect(self, game_version, force=False, timings=False, progress=None, cancel=None):
+        """Run the detection strategies and return a detection_report
+
+        force also runs the slower enhanced searches and ignores the cache.
+        progress and cancel are passed on to Detector.run_strategies.
+        """
+        profiler = None
+        if timings:
+            from poe_core.detection_profile import DetectionProfiler
+            profiler = DetectionProfiler()
+        if force:
+            detected, strategies = self.detector.auto_detect_force(game_version, profiler, progress, cancel)
+        else:
+            detected, strategies = self.detector.auto_detect(game_version, profiler, progress, cancel)
+        return detection_report(game_version, detected, strategies, profiler)
+
+    def launch_history(self, size=DEFAULT_HISTORY_SIZE):
+        from poe_core.tracing import LaunchHistory
+
+        return LaunchHistory(launch_history_dir(self.config_file), size)
+
+    def launch(self, settings, translate=None, status=None, tracer=None, profile=None):
+        """Launch everything enabled in settings and return the LaunchReport"""
+        from poe_core.launching import Launcher
+
+        history = self.launch_history(settings.get('launch_history', 0))
+        return Launcher(settings, translate=translate, status=status, tracer=tracer,
+                        history=history, profile=profile or self.profiles.active).launch()
+
+    def supervise(self, settings, report, status=None):
+        """Watch the companions a launch started until the game exits (blocks)
+
+        Crashed companions are restarted; returns True once the game exited
+        and the companions were stopped.
+        """
+        from poe_core.launching import Launcher
+        from poe_core.supervisor import Supervisor
+
+        launcher = Launcher(settings, status=status)
+        self.supervisor = Supervisor.for_launch(CATALOG, report.started, launcher.run_program,
+                                                pids=report.pids, status=status)
+        try:
+            return self.supervisor.run()
+        finally:
+            self.supervisor = None
+
+    def stop_supervising(self):
+        if self.supervisor is not None:
+            self.supervisor.stop()
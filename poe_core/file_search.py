@@ -0,0 +1,211 @@
+"""Bounded, parallel search of user folders for catalogued executables"""
+import ntpath
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from poe_core.catalog import CATALOG
+from poe_core.detection_profile import DIRS_LISTED, ENTRIES_SEEN, SHORTCUTS_PARSED
+from poe_core.shortcuts import shortcut_target
+
+# Folder levels below each root that are searched (0 = only the root itself)
+DEFAULT_MAX_DEPTH = 1
+# Directory entries looked at per root before giving up on it
+DEFAULT_MAX_ENTRIES = 20000
+DEFAULT_MAX_WORKERS = 4
+
+# Folders that never hold the programs we look for
+SKIP_DIR_NAMES = frozenset([
+    'node_modules', '__pycache__', 'site-packages', '.git', '.svn',
+    'cache', 'temp', 'tmp', 'logs',
+    'my music', 'my pictures', 'my videos', 'my games',
+])
+
+
+def should_descend(name):
+    """Name heuristic for folders worth searching"""
+    lowered = name.lower()
+    if lowered.startswith(('.', '$', '~')):
+        return False
+    return lowered not in SKIP_DIR_NAMES
+
+
+class FileSearch:
+    """Walks several folders at once looking for catalogued executables
+
+    Each root is walked breadth first with os.scandir on a thread pool, at
+    most max_depth levels deep and max_entries entries per root. Executables
+    directly in a root can match any program; deeper ones only programs with
+    deep_search. With shortcuts enabled, .lnk files at any depth match by
+    the name of their (existing) target. Symlinks and junctions are not
+    followed.
+    """
+
+    def __init__(self, catalog=CATALOG, max_depth=DEFAULT_MAX_DEPTH, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_workers=DEFAULT_MAX_WORKERS, should_descend=should_descend, shortcuts=False,
+                 exists=os.path.exists):
+        self.catalog = catalog
+        self.max_depth = max_depth
+        self.max_entries = max_entries
+        self.max_workers = max_workers
+        self.should_descend = should_descend
+        self.shortcuts = shortcuts
+        self.exists = exists
+        # DetectionProfiler attached for the current detection run, if any
+        self.profiler = None
+
+    def default_wanted(self):
+        """Programs that can be recognised by file name"""
+        return [spec.key for spec in self.catalog if spec.file_keywords]
+
+    def match(self, name, depth):
+        """Program spec for an executable found at the given depth, or None"""
+        if not name.lower().endswith('.exe'):
+            return None
+        spec = self.catalog.match_file_name(name)
+        if spec and (depth == 0 or spec.deep_search):
+            return spec
+        return None
+
+    def match_shortcut(self, lnk_path, root=None, profiler=None):
+        """(spec, target path) for a shortcut to a catalogued program, or (None, None)"""
+        if profiler:
+            profiler.count(SHORTCUTS_PARSED, root=root)
+        target = shortcut_target(lnk_path)
+        if not target:
+            return None, None
+        name = ntpath.basename(target)
+        spec = self.catalog.by_exe_name.get(name.lower()) or self.catalog.match_file_name(name)
+        if not spec:
+            return None, None
+        if profiler:
+            exists = profiler.timed_exists(target, root, 'folder', self.exists)
+        else:
+            exists = self.exists(target)
+        if exists:
+            return spec, target
+        return None, None
+
+    def iter_matches(self, roots, wanted=None):
+        """Yield (root index, depth, program key, path) as soon as they are found"""
+        for event in self._events(roots, wanted):
+            if event[0] == 'match':
+                yield event[1:]
+
+    def search(self, roots, wanted=None, on_match=None):
+        """Find programs below the roots
+
+        Returns a dict of program key -> path, preferring earlier roots and
+        then shallower matches, like a serial scan. Stops as soon as every
+        wanted program is found and no earlier root can beat it. on_match is
+        called with (root, path, spec) for every match as it streams in.
+        """
+        roots = list(roots)
+        wanted = list(wanted) if wanted is not None else self.default_wanted()
+        pending = set(range(len(roots)))
+        # program -> (root index, depth, path)
+        best = {}
+
+        for event in self._events(roots, wanted):
+            if event[0] == 'done':
+                pending.discard(event[1])
+            else:
+                _, index, depth, key, path = event
+                if on_match:
+                    on_match(roots[index], path, self.catalog[key])
+                if key not in best or (index, depth) < best[key][:2]:
+                    best[key] = (index, depth, path)
+            if self._settled(wanted, best, pending):
+                break
+
+        return {key: path for key, (_, _, path) in best.items()}
+
+    def _settled(self, wanted, best, pending):
+        for key in wanted:
+            if key not in best:
+                return False
+            if any(index < best[key][0] for index in pending):
+                return False
+        return True
+
+    def _events(self, roots, wanted):
+        roots = list(roots)
+        wanted = set(wanted) if wanted is not None else set(self.default_wanted())
+        if not roots or not wanted:
+            return
+
+        events = queue.Queue()
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(roots))))
+        profiler = self.profiler
+        try:
+            for index, root in enumerate(roots):
+                pool.submit(self._walk_root, index, root, wanted, stop, events, profiler)
+            pending = len(roots)
+            while pending:
+                event = events.get()
+                if event[0] == 'done':
+                    pending -= 1
+                yield event
+        finally:
+            # Consumer stopped early or finished: let the walkers wind down
+            stop.set()
+            pool.shutdown(wait=False)
+
+    def _walk_root(self, index, root, wanted, stop, events, profiler=None):
+        start = time.perf_counter()
+        try:
+            self._walk(index, root, wanted, stop, events, profiler)
+        except Exception as e:
+            print(f"Search of {root} failed: {e}")
+        finally:
+            if profiler:
+                profiler.root_done(root, 'folder', time.perf_counter() - start)
+            events.put(('done', index))
+
+    def _walk(self, index, root, wanted, stop, events, profiler=None):
+        remaining = set(wanted)
+        budget = self.max_entries
+        level = [root]
+
+        for depth in range(self.max_depth + 1):
+            next_level = []
+            for folder in level:
+                listed_at = time.perf_counter()
+                seen = 0
+                try:
+                    with os.scandir(folder) as entries:
+                        for entry in entries:
+                            if stop.is_set():
+                                return
+                            budget -= 1
+                            seen += 1
+                            if budget < 0:
+                                print(f"Search budget of {self.max_entries} entries used up in {root}")
+                                return
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    if depth < self.max_depth and self.should_descend(entry.name):
+                                        next_level.append(entry.path)
+                                    continue
+                            except OSError:
+                                continue
+                            if self.shortcuts and entry.name.lower().endswith('.lnk'):
+                                spec, path = self.match_shortcut(entry.path, root, profiler)
+                            else:
+                                spec, path = self.match(entry.name, depth), entry.path
+                            if spec and spec.key in remaining:
+                                remaining.discard(spec.key)
+                                events.put(('match', index, depth, spec.key, path))
+                                if not remaining:
+                                    return
+                except OSError:
+                    continue
+                finally:
+                    if profiler:
+                        profiler.probe('scandir', folder, time.perf_counter() - listed_at, root, 'folder',
+                                       counter=DIRS_LISTED)
+                        profiler.count(ENTRIES_SEEN, seen, root=root)
+            level = next_level
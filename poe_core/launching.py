@@ -0,0 +1,264 @@
+"""Launching the game, companion programs and websites from plain settings"""
+import os
+
+from poe_core.catalog import CATALOG
+from poe_core.processes import ProcessSnapshot
+from poe_core.readiness import DEFAULT_STEAM_SIGNAL, DEFAULT_STEAM_TIMEOUT
+from poe_core.spawning import Spawner
+from poe_core.squirrel import current_build, stub_target
+from poe_core.steam_library import POE_STEAM_APP_ID
+from poe_core.tracing import Tracer
+from poe_core.translations import translator
+
+
+class LaunchReport:
+    """What a launch started, what failed and how long each step took"""
+
+    def __init__(self, launched, errors, steps, elapsed, tracer=None, started=None, pids=None):
+        self.launched = launched
+        self.errors = errors
+        self.steps = steps
+        self.elapsed = elapsed
+        self.tracer = tracer
+        # Companion programs started by this launch: key -> path, key -> PID
+        self.started = started or {}
+        self.pids = pids or {}
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def to_dict(self):
+        return {
+            'ok': self.ok,
+            'launched': self.launched,
+            'errors': self.errors,
+            'elapsed': round(self.elapsed, 3),
+            'steps': [self.step_dict(step) for step in self.steps],
+            'phases': self.tracer.summary() if self.tracer else {},
+        }
+
+    @staticmethod
+    def step_dict(step):
+        if step.error is not None:
+            error = str(step.error)
+        else:
+            error = step.value[1] if step.value else None
+        return {
+            'name': step.name,
+            'ok': error is None,
+            'error': error,
+            'started': round(step.started, 3),
+            'elapsed': round(step.elapsed, 3),
+        }
+
+
+class Launcher:
+    """Starts everything enabled in a settings dict (the config.json layout)"""
+
+    def __init__(self, settings, catalog=CATALOG, translate=None, status=None, tracer=None, history=None,
+                 profile=None, popen=None, open_url=None, process_iter=None):
+        self.settings = settings
+        self.catalog = catalog
+        self.t = translate or translator(settings.get('language', 'en'))
+        # Progress callback, e.g. the GUI status label
+        self.status = status or (lambda message: print(message))
+        self.steam_ready_timeout = settings.get('steam_ready_timeout', DEFAULT_STEAM_TIMEOUT)
+        self.steam_ready_signal = settings.get('steam_ready_signal', DEFAULT_STEAM_SIGNAL)
+        self.steam_ready_port = settings.get('steam_ready_port', 0)
+        # Timeline of the launch phases; callers may pass one that already
+        # holds their own spans (e.g. saving the settings)
+        self.tracer = tracer or Tracer()
+        # Optional LaunchHistory the finished trace is added to
+        self.history = history
+        self.profile = profile
+        # OS hooks, replaceable by fakes (default: subprocess.Popen,
+        # webbrowser.open and psutil.process_iter)
+        self.spawner = Spawner(popen)
+        self.open_url = open_url
+        self.process_iter = process_iter
+        # Companions started by the current launch, for the supervisor
+        self.started = {}
+        self.pids = {}
+
+    def _open_url(self, url):
+        if self.open_url is not None:
+            return self.open_url(url)
+        import webbrowser
+        return webbrowser.open(url)
+
+    def is_process_running(self, process_name, snapshot=None):
+        """Check if a process is running"""
+        if snapshot is None:
+            snapshot = ProcessSnapshot.capture(process_iter=self.process_iter)
+        return snapshot.is_running(process_name)
+
+    def run_program(self, path, args=()):
+        """Run a program; returns its SpawnedProcess, or None if it could not be started"""
+        with self.tracer.span(f"run_program {os.path.basename(path)}", path=path) as span:
+            try:
+                if os.path.exists(path):
+                    process = self.spawner.spawn(path, args)
+                    span['pid'] = process.pid
+                    span['direct'] = process.direct
+                    span['spawn_ms'] = round(process.latency * 1000, 2)
+                    return process
+            except Exception as e:
+                span['error'] = str(e)
+                print(f"Error running {path}: {e}")
+            return None
+
+    def launch_steam_game(self, steam_path, app_id):
+        """Launch Steam game with specific app ID"""
+        try:
+            # Use Steam URL protocol to avoid security warnings
+            steam_url = f"steam://rungameid/{app_id}"
+            with self.tracer.span("webbrowser.open steam://rungameid", url=steam_url):
+                self._open_url(steam_url)
+            return True
+        except Exception as e:
+            print(f"Error launching Steam game: {e}")
+            # Fallback to old method if URL protocol fails
+            try:
+                self.spawner.spawn(steam_path, ['-applaunch', app_id])
+                return True
+            except Exception:
+                return False
+
+    def start_steam(self, steam_path):
+        """Start Steam and wait until it is ready to launch games"""
+        self.run_program(steam_path)
+        self.status(self.t('steam_starting'))
+        # Wait until Steam is actually up instead of a fixed delay
+        from poe_core.readiness import wait_for_steam
+        with self.tracer.span("steam_wait", timeout=self.steam_ready_timeout,
+                              signal=self.steam_ready_signal) as span:
+            readiness = wait_for_steam(self.steam_ready_timeout, port=self.steam_ready_port,
+                                       process_iter=self.process_iter, signal=self.steam_ready_signal)
+            span['ready'] = readiness.ready
+            span['attempts'] = readiness.attempts
+        print(f"Steam readiness: {readiness}")
+        return None, None
+
+    def launch_program_step(self, name, path, label=None, args=()):
+        """Launch step for a program, returns (launched name, error message)"""
+        if self.run_program(path, args):
+            return name, None
+        return None, self.t('file_not_found').format(label or name, path)
+
+    def launch_companion_step(self, spec, path):
+        """Launch step for a companion program; remembers it for supervision"""
+        process = self.run_program(path, spec.launch_args)
+        if process is None:
+            return None, self.t('file_not_found').format(spec.display_name, path)
+        if process.direct:
+            self.started[spec.key] = path
+            self.pids[spec.key] = process.pid
+        else:
+            # A batch file or shortcut: the program it starts cannot be told apart
+            print(f"{spec.display_name} was started through {os.path.basename(path)}, it is not supervised")
+        return spec.display_name, None
+
+    def open_website_step(self, name, url):
+        """Launch step for a website, returns (launched name, error message)"""
+        with self.tracer.span(f"webbrowser.open {name}", url=url):
+            self._open_url(url)
+        return name, None
+
+    def launch(self):
+        """Launch all selected programs and websites"""
+        with self.tracer.span("launch"):
+            report = self._launch()
+        if self.history is not None:
+            try:
+                trace_file = self.history.record(self.tracer, report.ok, self.profile)
+                if trace_file:
+                    print(f"Launch trace saved to: {trace_file}")
+            except Exception as e:
+                print(f"Error saving launch history: {e}")
+        return report
+
+    def _launch(self):
+        from poe_core.scheduler import LaunchScheduler
+
+        settings = self.settings
+        self.started = {}
+        self.pids = {}
+        self.status(self.t('launching'))
+
+        errors = []
+        launched = []
+
+        # Walk the process table once for all duplicate-instance checks;
+        # companions are matched by their configured executable path
+        with self.tracer.span("process_checks"):
+            snapshot = ProcessSnapshot.capture(include_paths=True, process_iter=self.process_iter)
+
+        # Build the launch pipeline: Steam (if needed) before the game,
+        # then companion programs and websites in parallel
+        scheduler = LaunchScheduler()
+
+        def step(name, func, depends_on=()):
+            return scheduler.add(name, self.tracer.wrap(f"step {name}", func), depends_on)
+
+        version = settings.get('game_version', 'steam')
+        game_step = None
+
+        if version == 'steam':
+            steam_path = settings.get(self.catalog['steam'].path_attr, '')
+
+            if steam_path and os.path.exists(steam_path):
+                game_deps = []
+                # Check if Steam is running
+                if not self.is_process_running("steam.exe", snapshot):
+                    game_deps.append(step('steam', lambda: self.start_steam(steam_path)))
+
+                def launch_game():
+                    if self.launch_steam_game(steam_path, POE_STEAM_APP_ID):
+                        return "Path of Exile (Steam)", None
+                    return None, None
+
+                game_step = step('game', launch_game, game_deps)
+            else:
+                errors.append(self.t('file_not_found').format("Steam", steam_path))
+        else:
+            standalone_path = settings.get(self.catalog['poe_standalone'].path_attr, '')
+            game_step = step('game', lambda: self.launch_program_step(
+                "Path of Exile (Standalone)", standalone_path, label="Path of Exile"))
+
+        after_game = [game_step] if game_step else []
+
+        # Launch companion programs
+        for spec in self.catalog.companions:
+            if not settings.get(spec.start_attr):
+                continue
+            # Squirrel installs (PoE Lurker) start and match the newest build;
+            # a configured stub launcher runs as that build
+            path = current_build(settings.get(spec.path_attr, ''))
+            if snapshot.is_program_running(path):
+                continue
+            target = stub_target(path)
+            if target and snapshot.is_program_running(target):
+                continue
+            step(spec.key, lambda spec=spec, path=path: self.launch_companion_step(spec, path), after_game)
+
+        # Open websites
+        for site in self.catalog.websites:
+            if settings.get(site.start_attr):
+                step(site.key, lambda site=site: self.open_website_step(
+                    site.display_name, site.url), after_game)
+
+        steps = scheduler.run()
+        for result in steps:
+            if not result.ok:
+                errors.append(f"{result.name}: {result.error}")
+                continue
+            launched_name, error = result.value
+            if launched_name:
+                launched.append(launched_name)
+            if error:
+                errors.append(error)
+
+        print(f"Launch pipeline finished in {scheduler.elapsed:.2f}s, step timings (ms): {scheduler.timings()}")
+        return LaunchReport(launched, errors, steps, scheduler.elapsed, self.tracer,
+                            dict(self.started), dict(self.pids))
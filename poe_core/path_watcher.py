@@ -0,0 +1,235 @@
+"""Re-checks configured executables in the background
+
+Companion tools get uninstalled or updated into a new versioned folder
+while the launcher is open. PathWatcher notices that without running
+detection again: on Windows it waits on directory change notifications
+for the folders of the configured executables, elsewhere it polls their
+fingerprints (one stat each) with an interval that grows while nothing
+changes.
+"""
+import os
+import threading
+
+from poe_core.detection_cache import fingerprint
+from poe_core.squirrel import current_build
+
+# Polling interval after a change, doubled while nothing changes up to the maximum
+DEFAULT_INTERVAL = 2.0
+MAX_INTERVAL = 60.0
+
+# FindFirstChangeNotificationW filter: files and folders created, deleted,
+# renamed or written
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+FILE_NOTIFY_CHANGE_DIR_NAME = 0x00000002
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+NOTIFY_FILTER = FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_DIR_NAME | FILE_NOTIFY_CHANGE_LAST_WRITE
+# WaitForMultipleObjects takes at most 64 handles, one is the wake event
+MAXIMUM_WAIT_OBJECTS = 64
+WAIT_OBJECT_0 = 0
+
+
+def watch_folder(path):
+    """Nearest existing folder above path (None if there is none)"""
+    folder = os.path.dirname(path)
+    while folder and not os.path.isdir(folder):
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            return None
+        folder = parent
+    return folder or None
+
+
+def moved_exe_hint(path):
+    """Where a missing executable probably went: a sibling folder holding the same file
+
+    Squirrel installs (app-1.4.2 -> app-1.5.0) resolve to their newest
+    build; otherwise a single scandir of the folder above looks for the
+    newest copy.
+    """
+    resolved = current_build(path)
+    if resolved != path:
+        return resolved
+    folder = os.path.dirname(path)
+    base = os.path.dirname(folder)
+    name = os.path.basename(path)
+    candidates = []
+    try:
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if entry.path == folder or not entry.is_dir():
+                    continue
+                candidate = os.path.join(entry.path, name)
+                found = fingerprint(candidate)
+                if found:
+                    candidates.append((found[0], candidate))
+    except OSError:
+        return None
+    # Squirrel-style stub launcher right in the base folder
+    stub = os.path.join(base, name)
+    found = fingerprint(stub)
+    if found:
+        candidates.append((found[0], stub))
+    return max(candidates)[1] if candidates else None
+
+
+class ChangeNotifications:
+    """Waits until something changes in a set of folders (Windows only)"""
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+        kernel32.FindFirstChangeNotificationW.restype = wintypes.HANDLE
+        kernel32.FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+        kernel32.FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+        kernel32.CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.WaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE),
+                                                    wintypes.BOOL, wintypes.DWORD]
+        kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+        self.kernel32 = kernel32
+        self.handle_type = wintypes.HANDLE
+        self.invalid_handle = ctypes.c_void_p(-1).value
+        # Auto-reset event that interrupts wait()
+        self.wake_event = kernel32.CreateEventW(None, False, False, None)
+        self.handles = {}
+
+    def watch(self, folders):
+        """Watch exactly these folders"""
+        for folder in set(self.handles) - set(folders):
+            self.kernel32.FindCloseChangeNotification(self.handles.pop(folder))
+        for folder in set(folders) - set(self.handles):
+            if len(self.handles) >= MAXIMUM_WAIT_OBJECTS - 1:
+                break
+            handle = self.kernel32.FindFirstChangeNotificationW(folder, False, NOTIFY_FILTER)
+            if handle and handle != self.invalid_handle:
+                self.handles[folder] = handle
+
+    def wait(self, timeout):
+        """True if a folder changed, False after the timeout or wake()"""
+        handles = [self.wake_event] + list(self.handles.values())
+        array = (self.handle_type * len(handles))(*handles)
+        result = self.kernel32.WaitForMultipleObjects(len(handles), array, False, int(timeout * 1000))
+        index = result - WAIT_OBJECT_0
+        if 1 <= index < len(handles):
+            # Re-arm the handle for the next change
+            self.kernel32.FindNextChangeNotification(handles[index])
+            return True
+        return False
+
+    def wake(self):
+        self.kernel32.SetEvent(self.wake_event)
+
+    def close(self):
+        self.watch(())
+        self.kernel32.CloseHandle(self.wake_event)
+
+
+def default_notifications():
+    """ChangeNotifications on Windows, None (polling) elsewhere or if unavailable"""
+    if os.name != 'nt':
+        return None
+    try:
+        return ChangeNotifications()
+    except Exception as e:
+        print(f"Directory change notifications unavailable, polling instead: {e}")
+        return None
+
+
+class PathWatcher:
+    """Calls on_change(key, path, valid, hint) when a watched executable appears or disappears
+
+    hint is a likely new location of a missing executable (or None). The
+    callback runs on the watcher thread.
+    """
+
+    def __init__(self, on_change, interval=DEFAULT_INTERVAL, max_interval=MAX_INTERVAL,
+                 notifications=None):
+        self.on_change = on_change
+        self.interval = interval
+        self.max_interval = max_interval
+        self.notifications = notifications
+        self.paths = {}
+        # key -> (path, fingerprint) of the last check
+        self.states = {}
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.wake_event = threading.Event()
+        self.thread = None
+
+    def watch(self, paths):
+        """Replace the watched paths (key -> path); changed ones are checked right away"""
+        with self.lock:
+            self.paths = {key: (path or '').strip() for key, path in paths.items()}
+        self.wake()
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='path watcher')
+            self.thread.daemon = True
+            self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        self.wake()
+
+    def wake(self):
+        self.wake_event.set()
+        if self.notifications is not None:
+            self.notifications.wake()
+
+    def check(self):
+        """Stat every watched path; returns the number of changed ones
+
+        A path in an app-x.y.z folder is checked at its newest build, so a
+        Squirrel update that removes the configured folder keeps it valid.
+        """
+        with self.lock:
+            paths = dict(self.paths)
+        changed = 0
+        for key, path in paths.items():
+            found = fingerprint(current_build(path)) if path else None
+            previous = self.states.get(key)
+            if previous == (path, found):
+                continue
+            changed += 1
+            self.states[key] = (path, found)
+            valid = found is not None
+            if previous is not None and previous[0] == path and (previous[1] is not None) == valid:
+                # Updated in place, still there
+                continue
+            hint = moved_exe_hint(path) if path and not valid else None
+            try:
+                self.on_change(key, path, valid, hint)
+            except Exception as e:
+                print(f"Path watcher callback failed: {e}")
+        for key in set(self.states) - set(paths):
+            del self.states[key]
+        return changed
+
+    def folders(self):
+        with self.lock:
+            paths = [path for path in self.paths.values() if path]
+        return {folder for folder in map(watch_folder, paths) if folder}
+
+    def run(self):
+        interval = self.interval
+        try:
+            while not self.stop_event.is_set():
+                self.wake_event.clear()
+                changed = self.check()
+                if self.notifications is not None:
+                    self.notifications.watch(self.folders())
+                    # Checked again on a change, and at the latest after max_interval
+                    self.notifications.wait(self.max_interval)
+                else:
+                    interval = self.interval if changed else min(interval * 2, self.max_interval)
+                    self.wake_event.wait(interval)
+        finally:
+            if self.notifications is not None:
+                self.notifications.close()
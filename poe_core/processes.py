@@ -0,0 +1,84 @@
+"""Process table snapshots for duplicate-instance checks"""
+import ntpath
+
+
+def normalize_exe_path(path):
+    """Normalize an executable path for case-insensitive Windows comparisons"""
+    if not path:
+        return ''
+    return ntpath.normpath(path).lower()
+
+
+class ProcessSnapshot:
+    """Walks the process table once and answers lookups from dictionaries"""
+
+    def __init__(self, entries=(), include_paths=False):
+        self.include_paths = include_paths
+        self.by_name = {}
+        self.by_path = {}
+        # Image names of processes whose executable path could not be read
+        self.names_without_path = set()
+        for entry in entries:
+            self.add(entry.get('pid'), entry.get('name'), entry.get('exe'))
+
+    @classmethod
+    def capture(cls, include_paths=False, process_iter=None):
+        """Take a snapshot of the running processes (one psutil walk)"""
+        attrs = ['pid', 'name']
+        if include_paths:
+            attrs.append('exe')
+
+        if process_iter is None:
+            import psutil
+            process_iter = psutil.process_iter
+
+        snapshot = cls(include_paths=include_paths)
+        try:
+            for proc in process_iter(attrs):
+                info = proc.info
+                snapshot.add(info.get('pid'), info.get('name'), info.get('exe'))
+        except Exception as e:
+            print(f"Error reading process list: {e}")
+        return snapshot
+
+    def add(self, pid, name, exe=None):
+        """Index a single process entry"""
+        if name:
+            self.by_name.setdefault(name.lower(), []).append(pid)
+        if self.include_paths:
+            if exe:
+                # psutil reports absolute, normalized image paths, so only
+                # the configured paths need ntpath.normpath
+                self.by_path.setdefault(exe.lower(), []).append(pid)
+            elif name:
+                self.names_without_path.add(name.lower())
+
+    def is_running(self, process_name):
+        """Check if a process with the given image name is running"""
+        return bool(process_name) and process_name.lower() in self.by_name
+
+    def is_program_running(self, exe_path):
+        """Check if the configured executable runs
+
+        Matches the normalized path, whatever the image name is (PoeLurker.exe,
+        CRE.exe...). Processes whose path cannot be read (e.g. elevated ones)
+        can only match by file name. Snapshots without paths match by file
+        name only.
+        """
+        if not exe_path:
+            return False
+        name = ntpath.basename(exe_path).lower()
+        if not self.include_paths:
+            return name in self.by_name
+        return normalize_exe_path(exe_path) in self.by_path or name in self.names_without_path
+
+    def path_pids(self, exe_path):
+        """Return the PIDs started from the given executable"""
+        return list(self.by_path.get(normalize_exe_path(exe_path), []))
+
+    def pids(self, process_name):
+        """Return the PIDs running under the given image name"""
+        return list(self.by_name.get(process_name.lower(), []))
+
+    def __len__(self):
+        return sum(len(pids) for pids in self.by_name.values())
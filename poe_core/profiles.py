@@ -0,0 +1,130 @@
+"""Named settings profiles kept together in config.json"""
+from poe_core.config import default_settings
+
+CONFIG_VERSION = 2
+DEFAULT_PROFILE = 'default'
+
+# Settings shared by every profile
+GLOBAL_KEYS = ('language', 'steam_ready_timeout', 'steam_ready_signal', 'steam_ready_port', 'launch_history',
+               'detect_in_process')
+
+
+class UnknownProfileError(KeyError):
+    """No profile with the requested name"""
+
+
+class ProfileStore:
+    """Profiles by name on top of a ConfigStore
+
+    config.json layout:
+
+        {"version": 2, "active_profile": "default", "language": "en", ...,
+         "profiles": {"default": {"game_version": "steam", ...}, ...}}
+
+    A flat config.json from older versions becomes the "default" profile.
+    Profiles are a dict, so switching is a lookup. Each profile also keeps
+    the path validation results of this session, so switching back does not
+    check unchanged paths again.
+    """
+
+    def __init__(self, config_store):
+        self.config_store = config_store
+        self.profiles = {DEFAULT_PROFILE: {}}
+        self.active = DEFAULT_PROFILE
+        self.global_settings = {}
+        # profile -> program key -> (path, valid)
+        self.validation = {}
+
+    def load(self):
+        """Read config.json (raises on unreadable files)"""
+        self.from_dict(self.config_store.read() or {})
+        return self
+
+    def from_dict(self, config):
+        self.global_settings = {key: config[key] for key in GLOBAL_KEYS if key in config}
+        if 'profiles' in config:
+            self.profiles = {name: dict(values) for name, values in config['profiles'].items()}
+            if not self.profiles:
+                self.profiles = {DEFAULT_PROFILE: {}}
+            active = config.get('active_profile')
+            self.active = active if active in self.profiles else next(iter(self.profiles))
+        else:
+            # Flat layout from before profiles existed
+            profile = {key: value for key, value in config.items() if key not in GLOBAL_KEYS}
+            self.profiles = {DEFAULT_PROFILE: profile}
+            self.active = DEFAULT_PROFILE
+        self.validation = {}
+
+    def to_dict(self):
+        config = {'version': CONFIG_VERSION, 'active_profile': self.active}
+        config.update(self.global_settings)
+        config['profiles'] = self.profiles
+        return config
+
+    def names(self):
+        return list(self.profiles)
+
+    def __contains__(self, name):
+        return name in self.profiles
+
+    def _profile_name(self, name):
+        name = name or self.active
+        if name not in self.profiles:
+            raise UnknownProfileError(f"Unknown profile: {name}")
+        return name
+
+    def settings(self, name=None):
+        """Complete settings of a profile in the flat config.json layout"""
+        name = self._profile_name(name)
+        settings = default_settings()
+        settings.update(self.global_settings)
+        settings.update(self.profiles[name])
+        return settings
+
+    def update(self, settings, name=None):
+        """Store flat settings into a profile; global keys go to all profiles"""
+        name = self._profile_name(name)
+        for key in GLOBAL_KEYS:
+            if key in settings:
+                self.global_settings[key] = settings[key]
+        self.profiles[name] = {key: value for key, value in settings.items() if key not in GLOBAL_KEYS}
+
+    def switch(self, name):
+        """Make a profile active and return its settings"""
+        self.active = self._profile_name(name)
+        return self.settings(name)
+
+    def create(self, name, settings=None):
+        """Add a profile, copied from settings or the active profile"""
+        name = name.strip() if name else ''
+        if not name:
+            raise ValueError("Profile name must not be empty")
+        if name in self.profiles:
+            raise ValueError(f"Profile already exists: {name}")
+        source = settings if settings is not None else self.settings()
+        self.profiles[name] = {key: value for key, value in source.items() if key not in GLOBAL_KEYS}
+        return name
+
+    def delete(self, name):
+        """Remove a profile; the last one cannot be removed"""
+        name = self._profile_name(name)
+        if len(self.profiles) == 1:
+            raise ValueError("Cannot delete the last profile")
+        del self.profiles[name]
+        self.validation.pop(name, None)
+        if self.active == name:
+            self.active = next(iter(self.profiles))
+
+    def save(self):
+        """Write config.json if anything changed"""
+        return self.config_store.save(self.to_dict())
+
+    def cached_validation(self, key, path, name=None):
+        """Validation result for the same path in this profile, or None"""
+        cached = self.validation.get(name or self.active, {}).get(key)
+        if cached and cached[0] == path:
+            return cached[1]
+        return None
+
+    def remember_validation(self, key, path, valid, name=None):
+        self.validation.setdefault(name or self.active, {})[key] = (path, valid)
@@ -0,0 +1,124 @@
+"""Wait for a program to become ready by polling real signals with backoff"""
+import socket
+import time
+
+from poe_core.processes import ProcessSnapshot
+
+# Steam is usable once its web helper child is up - the client UI and
+# the steam:// protocol handler are served from it
+STEAM_PROCESS = "steam.exe"
+STEAM_CHILD_PROCESS = "steamwebhelper.exe"
+DEFAULT_STEAM_TIMEOUT = 60.0
+
+# What counts as "Steam is ready" (steam_ready_signal setting):
+#   webhelper - steam.exe runs and has started steamwebhelper.exe
+#   process   - steam.exe runs
+STEAM_SIGNALS = ('webhelper', 'process')
+DEFAULT_STEAM_SIGNAL = 'webhelper'
+
+
+class ReadinessResult:
+    """Outcome of a readiness wait"""
+
+    def __init__(self, ready, elapsed, attempts, pending):
+        self.ready = ready
+        self.elapsed = elapsed
+        self.attempts = attempts
+        # Names of the signals that were still failing at the last poll
+        self.pending = pending
+
+    def __repr__(self):
+        state = "ready" if self.ready else f"timed out waiting for {', '.join(self.pending)}"
+        return f"<ReadinessResult {state} after {self.elapsed:.2f}s ({self.attempts} polls)>"
+
+
+def process_signal(process_name, process_iter=None):
+    """Signal that holds once a process with the given image name exists"""
+    def check():
+        return ProcessSnapshot.capture(process_iter=process_iter).is_running(process_name)
+    return (f"process {process_name}", check)
+
+
+def child_process_signal(parent_name, child_name, process_iter=None, process_factory=None):
+    """Signal that holds once the parent process has spawned the given child
+
+    process_factory(pid) replaces psutil.Process, e.g. with a fake.
+    """
+    def check():
+        import psutil
+        factory = process_factory or psutil.Process
+        snapshot = ProcessSnapshot.capture(process_iter=process_iter)
+        for pid in snapshot.pids(parent_name):
+            try:
+                for child in factory(pid).children(recursive=True):
+                    if child.name().lower() == child_name.lower():
+                        return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return False
+    return (f"{parent_name} child {child_name}", check)
+
+
+def port_signal(port, host='127.0.0.1', timeout=0.25):
+    """Signal that holds once something accepts TCP connections on the port"""
+    def check():
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+    return (f"port {host}:{port}", check)
+
+
+def wait_until_ready(signals, timeout, initial_delay=0.1, max_delay=1.0, backoff=1.5,
+                     clock=time.monotonic, sleep=time.sleep):
+    """Poll all signals until they hold at once or the deadline passes"""
+    start = clock()
+    deadline = start + timeout
+    delay = initial_delay
+    attempts = 0
+
+    while True:
+        attempts += 1
+        pending = []
+        for name, check in signals:
+            try:
+                ok = check()
+            except Exception as e:
+                print(f"Readiness check '{name}' failed: {e}")
+                ok = False
+            if not ok:
+                pending.append(name)
+                # Later signals depend on earlier ones, no need to poll them yet
+                break
+
+        now = clock()
+        if not pending:
+            return ReadinessResult(True, now - start, attempts, [])
+        if now >= deadline:
+            return ReadinessResult(False, now - start, attempts, pending)
+
+        sleep(min(delay, deadline - now))
+        delay = min(delay * backoff, max_delay)
+
+
+def steam_signals(port=None, process_iter=None, signal=DEFAULT_STEAM_SIGNAL, process_factory=None):
+    """Signals that indicate a started Steam client is ready
+
+    signal is one of STEAM_SIGNALS; with a port, something must also accept
+    connections on it (a local stand-in can fake Steam that way).
+    """
+    if signal not in STEAM_SIGNALS:
+        raise ValueError(f"Unknown Steam readiness signal {signal!r}, expected one of {', '.join(STEAM_SIGNALS)}")
+    signals = [process_signal(STEAM_PROCESS, process_iter)]
+    if signal == 'webhelper':
+        signals.append(child_process_signal(STEAM_PROCESS, STEAM_CHILD_PROCESS, process_iter, process_factory))
+    if port:
+        signals.append(port_signal(port))
+    return signals
+
+
+def wait_for_steam(timeout=DEFAULT_STEAM_TIMEOUT, port=None, process_iter=None, signal=DEFAULT_STEAM_SIGNAL,
+                   process_factory=None, **kwargs):
+    """Wait for a freshly started Steam client and report the time it took"""
+    return wait_until_ready(steam_signals(port, process_iter, signal, process_factory), timeout, **kwargs)
@@ -0,0 +1,162 @@
+"""In-memory index of the Windows Uninstall registry entries"""
+import re
+import threading
+
+from poe_core.detection_profile import REGISTRY_KEYS
+
+UNINSTALL_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+UNINSTALL_KEY_WOW64 = r"SOFTWARE\Wow6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
+
+# (hive attribute on the winreg module, subkey path)
+UNINSTALL_ROOTS = [
+    ('HKEY_LOCAL_MACHINE', UNINSTALL_KEY),
+    ('HKEY_LOCAL_MACHINE', UNINSTALL_KEY_WOW64),
+    ('HKEY_CURRENT_USER', UNINSTALL_KEY),
+]
+
+_SEPARATOR_RE = re.compile(r'[^0-9A-Za-z]+')
+_CAMEL_RE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+
+
+def name_tokens(name):
+    """Split a display name into lower-case word tokens
+
+    CamelCase words are indexed both whole and split, so "PoeLurker"
+    matches the tokens "poelurker", "poe" and "lurker".
+    """
+    tokens = set()
+    for word in _SEPARATOR_RE.split(name or ''):
+        if not word:
+            continue
+        tokens.add(word.lower())
+        for part in _CAMEL_RE.split(word):
+            if part:
+                tokens.add(part.lower())
+    return tokens
+
+
+class UninstallEntry:
+    """One Uninstall subkey with the values the detectors care about"""
+
+    def __init__(self, key_name, display_name, install_location='', uninstall_string='', display_icon=''):
+        self.key_name = key_name
+        self.display_name = display_name
+        self.install_location = install_location
+        self.uninstall_string = uninstall_string
+        self.display_icon = display_icon
+        self.tokens = name_tokens(display_name)
+
+    def __repr__(self):
+        return f"<UninstallEntry {self.display_name!r} at {self.install_location!r}>"
+
+
+class RegistryIndex:
+    """Walks the Uninstall keys once and serves token lookups from memory
+
+    The walk is repeated only when the last-write time of one of the
+    Uninstall keys has changed since the previous build.
+    """
+
+    def __init__(self, winreg_module=None, roots=UNINSTALL_ROOTS):
+        if winreg_module is None:
+            try:
+                import winreg as winreg_module
+            except ImportError:
+                winreg_module = None
+        self.winreg = winreg_module
+        self.roots = roots
+        self.entries = []
+        self.by_token = {}
+        self.stamps = None
+        self.builds = 0
+        self.lock = threading.Lock()
+        # DetectionProfiler attached for the current detection run, if any
+        self.profiler = None
+
+    @property
+    def available(self):
+        return self.winreg is not None
+
+    def _root_stamps(self):
+        """Last-write time of every Uninstall root (None if the key is missing)"""
+        stamps = []
+        for hive_name, subkey_path in self.roots:
+            try:
+                with self.winreg.OpenKey(getattr(self.winreg, hive_name), subkey_path) as key:
+                    stamps.append(self.winreg.QueryInfoKey(key)[2])
+            except OSError:
+                stamps.append(None)
+        if self.profiler:
+            self.profiler.count(REGISTRY_KEYS, len(self.roots))
+        return stamps
+
+    def refresh(self):
+        """Rebuild the index if the registry changed, returns True if it was rebuilt"""
+        if not self.available:
+            return False
+
+        with self.lock:
+            stamps = self._root_stamps()
+            if stamps == self.stamps:
+                return False
+
+            entries = []
+            for hive_name, subkey_path in self.roots:
+                entries.extend(self._read_root(getattr(self.winreg, hive_name), subkey_path))
+
+            by_token = {}
+            for entry in entries:
+                for token in entry.tokens:
+                    by_token.setdefault(token, []).append(entry)
+
+            self.entries = entries
+            self.by_token = by_token
+            self.stamps = stamps
+            self.builds += 1
+            return True
+
+    def _read_value(self, key, name):
+        try:
+            value = self.winreg.QueryValueEx(key, name)[0]
+        except OSError:
+            return ''
+        return value if isinstance(value, str) else ''
+
+    def _read_root(self, hive, subkey_path):
+        entries = []
+        try:
+            with self.winreg.OpenKey(hive, subkey_path) as key:
+                i = 0
+                while True:
+                    try:
+                        subkey_name = self.winreg.EnumKey(key, i)
+                    except OSError:
+                        break
+                    i += 1
+                    try:
+                        with self.winreg.OpenKey(key, subkey_name) as subkey:
+                            display_name = self._read_value(subkey, 'DisplayName')
+                            if not display_name:
+                                continue
+                            entries.append(UninstallEntry(
+                                subkey_name,
+                                display_name,
+                                self._read_value(subkey, 'InstallLocation'),
+                                self._read_value(subkey, 'UninstallString'),
+                                self._read_value(subkey, 'DisplayIcon'),
+                            ))
+                    except OSError:
+                        continue
+                if self.profiler:
+                    self.profiler.count(REGISTRY_KEYS, i)
+        except OSError:
+            pass
+        return entries
+
+    def query(self, *tokens):
+        """Entries whose display name contains all of the given tokens"""
+        if not tokens:
+            return list(self.entries)
+        candidates = self.by_token.get(tokens[0].lower(), [])
+        rest = [token.lower() for token in tokens[1:]]
+        return [entry for entry in candidates if all(token in entry.tokens for token in rest)]
@@ -0,0 +1,87 @@
+"""Dependency-aware launch scheduler running independent steps in parallel"""
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class StepResult:
+    """Outcome and timing of a single launch step"""
+
+    def __init__(self, name, value=None, error=None, started=0.0, elapsed=0.0):
+        self.name = name
+        self.value = value
+        self.error = error
+        # Seconds since the scheduler started running
+        self.started = started
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        state = "ok" if self.ok else f"error={self.error!r}"
+        return f"<StepResult {self.name} {state} start={self.started:.3f}s took={self.elapsed:.3f}s>"
+
+
+class LaunchScheduler:
+    """Run named steps on a thread pool, starting each once its dependencies finished
+
+    Dependencies only order the steps - a failing step does not cancel the
+    steps that depend on it, matching the launcher's best-effort behaviour.
+    """
+
+    def __init__(self, max_workers=8, clock=time.perf_counter):
+        self.max_workers = max_workers
+        self.clock = clock
+        self.steps = {}
+        self.order = []
+        self.results = {}
+        self.elapsed = 0.0
+
+    def add(self, name, func, depends_on=()):
+        """Register a step; dependencies must be added before their dependents"""
+        if name in self.steps:
+            raise ValueError(f"Duplicate launch step: {name}")
+        for dep in depends_on:
+            if dep not in self.steps:
+                raise ValueError(f"Launch step '{name}' depends on unknown step '{dep}'")
+        self.steps[name] = (func, tuple(depends_on))
+        self.order.append(name)
+        return name
+
+    def _run_step(self, name, func, start):
+        step_start = self.clock()
+        try:
+            value = func()
+            error = None
+        except Exception as e:
+            print(f"Launch step '{name}' failed: {e}")
+            value, error = None, e
+        return StepResult(name, value, error, step_start - start, self.clock() - step_start)
+
+    def run(self):
+        """Run all steps and return their results in registration order"""
+        start = self.clock()
+        waiting = {name: set(deps) for name, (func, deps) in self.steps.items()}
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while waiting or running:
+                for name in [n for n in self.order if n in waiting and not waiting[n]]:
+                    del waiting[name]
+                    future = pool.submit(self._run_step, name, self.steps[name][0], start)
+                    running[future] = name
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    self.results[name] = future.result()
+                    for deps in waiting.values():
+                        deps.discard(name)
+
+        self.elapsed = self.clock() - start
+        return [self.results[name] for name in self.order]
+
+    def timings(self):
+        """Per-step timings in milliseconds, for logging"""
+        return {name: round(result.elapsed * 1000, 1) for name, result in self.results.items()}
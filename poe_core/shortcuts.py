@@ -0,0 +1,172 @@
+"""Reading Windows shortcut (.lnk) files without COM
+
+Parses the Shell Link binary format ([MS-SHLLINK]) directly, so shortcuts
+can be resolved in bulk on any platform.
+"""
+import ntpath
+import os
+import struct
+
+HEADER_SIZE = 0x4C
+LINK_CLSID = bytes.fromhex('0114020000000000c000000000000046')
+
+# LinkFlags
+HAS_LINK_TARGET_ID_LIST = 0x01
+HAS_LINK_INFO = 0x02
+HAS_NAME = 0x04
+HAS_RELATIVE_PATH = 0x08
+HAS_WORKING_DIR = 0x10
+HAS_ARGUMENTS = 0x20
+HAS_ICON_LOCATION = 0x40
+IS_UNICODE = 0x80
+
+# LinkInfoFlags
+VOLUME_ID_AND_LOCAL_BASE_PATH = 0x01
+COMMON_NETWORK_RELATIVE_LINK = 0x02
+
+ENVIRONMENT_VARIABLE_BLOCK = 0xA0000001
+
+# Shortcuts are tiny; anything larger is not worth reading
+MAX_LNK_SIZE = 64 * 1024
+
+
+class ShellLink:
+    """Target and string data of a shortcut"""
+
+    def __init__(self, target=None, name=None, relative_path=None, working_dir=None,
+                 arguments=None, icon_location=None, env_target=None):
+        self.target = target
+        self.name = name
+        self.relative_path = relative_path
+        self.working_dir = working_dir
+        self.arguments = arguments
+        self.icon_location = icon_location
+        self.env_target = env_target
+
+    def resolve(self, lnk_path=None):
+        """Best guess of the target path, or None
+
+        A relative path is relative to the shortcut's folder, or to the
+        working directory if the shortcut's own path is not known.
+        """
+        if self.target:
+            return self.target
+        if self.env_target:
+            return os.path.expandvars(self.env_target)
+        if self.relative_path:
+            base = ntpath.dirname(lnk_path) if lnk_path else self.working_dir
+            if base:
+                return ntpath.normpath(ntpath.join(base, self.relative_path))
+        return None
+
+
+def _c_string(data, offset, encoding='mbcs' if os.name == 'nt' else 'cp1252'):
+    end = data.find(b'\0', offset)
+    if end < 0:
+        raise ValueError("Unterminated string in shortcut")
+    return data[offset:end].decode(encoding, errors='replace')
+
+
+def _c_wstring(data, offset):
+    end = offset
+    while end + 1 < len(data) and data[end:end + 2] != b'\0\0':
+        end += 2
+    if end + 1 >= len(data):
+        raise ValueError("Unterminated string in shortcut")
+    return data[offset:end].decode('utf-16-le', errors='replace')
+
+
+def _parse_link_info(data, offset):
+    """Target path from the LinkInfo structure, returns (path, size)"""
+    size, header_size, flags, _, local_base, network_link, suffix = struct.unpack_from('<7I', data, offset)
+    local_base_unicode = suffix_unicode = 0
+    if header_size >= 0x24:
+        local_base_unicode, suffix_unicode = struct.unpack_from('<2I', data, offset + 28)
+
+    if suffix_unicode:
+        suffix_text = _c_wstring(data, offset + suffix_unicode)
+    else:
+        suffix_text = _c_string(data, offset + suffix)
+
+    path = None
+    if flags & VOLUME_ID_AND_LOCAL_BASE_PATH:
+        if local_base_unicode:
+            path = _c_wstring(data, offset + local_base_unicode)
+        else:
+            path = _c_string(data, offset + local_base)
+        path += suffix_text
+    elif flags & COMMON_NETWORK_RELATIVE_LINK:
+        link = offset + network_link
+        net_name_offset, = struct.unpack_from('<I', data, link + 8)
+        net_name = _c_string(data, link + net_name_offset)
+        path = ntpath.join(net_name, suffix_text) if suffix_text else net_name
+    return path or None, size
+
+
+def parse_lnk(data):
+    """Parse the bytes of a .lnk file into a ShellLink
+
+    Raises ValueError if the data is not a shell link.
+    """
+    if len(data) < HEADER_SIZE or data[:4] != struct.pack('<I', HEADER_SIZE) or data[4:20] != LINK_CLSID:
+        raise ValueError("Not a shell link")
+
+    try:
+        flags, = struct.unpack_from('<I', data, 20)
+        offset = HEADER_SIZE
+        link = ShellLink()
+
+        if flags & HAS_LINK_TARGET_ID_LIST:
+            id_list_size, = struct.unpack_from('<H', data, offset)
+            offset += 2 + id_list_size
+
+        if flags & HAS_LINK_INFO:
+            link.target, size = _parse_link_info(data, offset)
+            offset += size
+            if offset > len(data):
+                raise ValueError("Truncated shell link")
+
+        # StringData: character count followed by UTF-16 or codepage text
+        unicode = flags & IS_UNICODE
+        for flag, attr in ((HAS_NAME, 'name'), (HAS_RELATIVE_PATH, 'relative_path'),
+                           (HAS_WORKING_DIR, 'working_dir'), (HAS_ARGUMENTS, 'arguments'),
+                           (HAS_ICON_LOCATION, 'icon_location')):
+            if flags & flag:
+                count, = struct.unpack_from('<H', data, offset)
+                offset += 2
+                length = count * 2 if unicode else count
+                if offset + length > len(data):
+                    raise ValueError("Truncated shell link")
+                raw = data[offset:offset + length]
+                setattr(link, attr, raw.decode('utf-16-le' if unicode else 'cp1252', errors='replace'))
+                offset += length
+
+        # ExtraData blocks until the terminal block (size < 4)
+        while offset + 8 <= len(data):
+            block_size, signature = struct.unpack_from('<2I', data, offset)
+            if block_size < 8:
+                break
+            if signature == ENVIRONMENT_VARIABLE_BLOCK and block_size >= 0x314:
+                unicode_target = data[offset + 268:offset + 788]
+                link.env_target = unicode_target.decode('utf-16-le', errors='replace').split('\0', 1)[0] or \
+                    _c_string(data[offset + 8:offset + 268], 0)
+            offset += block_size
+    except struct.error:
+        raise ValueError("Truncated shell link")
+
+    return link
+
+
+def read_lnk(path):
+    """Read and parse a .lnk file"""
+    with open(path, 'rb') as f:
+        data = f.read(MAX_LNK_SIZE)
+    return parse_lnk(data)
+
+
+def shortcut_target(path):
+    """Resolved target of a .lnk file, or None if it cannot be read"""
+    try:
+        return read_lnk(path).resolve(path)
+    except (OSError, ValueError):
+        return None
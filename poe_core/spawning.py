@@ -0,0 +1,117 @@
+"""Starting programs directly, without a shell, and keeping their real PID
+
+shell=True ran every program through an extra cmd.exe, whose PID was all
+the launcher got back. Spawner starts the executable itself, detached
+from the launcher so it survives the launcher exiting.
+
+Other targets a path field may hold on Windows still work: batch files
+run through cmd.exe /c, and shortcuts and other documents open through
+the shell like a double-click. Neither gives the launcher the PID of the
+program that ends up running.
+"""
+import os
+import subprocess
+import time
+
+# Windows process creation flags (subprocess only defines them on Windows)
+DETACHED_PROCESS = 0x00000008
+CREATE_NEW_PROCESS_GROUP = 0x00000200
+
+# Targets started directly; batch files go through cmd.exe, anything else
+# through the shell (os.startfile)
+DIRECT_EXTENSIONS = ('.exe', '.com')
+BATCH_EXTENSIONS = ('.bat', '.cmd')
+
+
+def launch_method(path, windows=None):
+    """'direct', 'batch' or 'shell': how Spawner starts path"""
+    if not (os.name == 'nt' if windows is None else windows):
+        return 'direct'
+    extension = os.path.splitext(path)[1].lower()
+    if extension in DIRECT_EXTENSIONS:
+        return 'direct'
+    if extension in BATCH_EXTENSIONS:
+        return 'batch'
+    return 'shell'
+
+
+class SpawnedProcess:
+    """A started program: its Popen handle, PID and how long starting took
+
+    direct is False if a batch file or the shell was started instead of
+    the program itself; pid is then cmd.exe's, or None after the shell.
+    """
+
+    def __init__(self, handle, path, args, latency, direct=True):
+        self.handle = handle
+        self.pid = handle.pid if handle is not None else None
+        self.path = path
+        self.args = list(args)
+        # Seconds spent in Popen, i.e. creating the process
+        self.latency = latency
+        self.direct = direct
+
+    def poll(self):
+        """Exit code, or None while the program runs (always None after the shell)"""
+        if self.handle is None:
+            return None
+        return self.handle.poll()
+
+    def __repr__(self):
+        return f"<SpawnedProcess {os.path.basename(self.path)} pid={self.pid}>"
+
+
+class Spawner:
+    """Starts executables with their folder as working directory
+
+    popen replaces subprocess.Popen (e.g. with benchmarks.fakes.RecordingPopen)
+    and startfile os.startfile.
+    """
+
+    def __init__(self, popen=None, windows=None, clock=time.perf_counter, startfile=None):
+        self.popen = popen or subprocess.Popen
+        self.windows = os.name == 'nt' if windows is None else windows
+        self.clock = clock
+        self.startfile = startfile or getattr(os, 'startfile', None)
+
+    def creation_options(self):
+        """Popen keyword arguments that detach the child from the launcher"""
+        options = {
+            'stdin': subprocess.DEVNULL,
+            'stdout': subprocess.DEVNULL,
+            'stderr': subprocess.DEVNULL,
+            'close_fds': True,
+        }
+        if self.windows:
+            # No console window, and Ctrl+C in a launcher console is not passed on
+            options['creationflags'] = DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+        else:
+            options['start_new_session'] = True
+        return options
+
+    def spawn(self, path, args=(), cwd=None):
+        """Start path with args and return a SpawnedProcess (raises OSError)"""
+        if cwd is None:
+            # Programs often load files relative to their own folder
+            cwd = os.path.dirname(path) or None
+        method = launch_method(path, self.windows)
+        start = self.clock()
+        if method == 'shell':
+            self.open_with_shell(path, args, cwd)
+            return SpawnedProcess(None, path, args, self.clock() - start, direct=False)
+        command = [path] + list(args)
+        if method == 'batch':
+            command = ['cmd.exe', '/c'] + command
+        handle = self.popen(command, cwd=cwd, **self.creation_options())
+        return SpawnedProcess(handle, path, args, self.clock() - start, direct=method == 'direct')
+
+    def open_with_shell(self, path, args, cwd):
+        if self.startfile is None:
+            raise OSError(f"Cannot open {path}: no shell to open it with")
+        if args or cwd:
+            # arguments and cwd need Python 3.10
+            try:
+                return self.startfile(path, 'open', subprocess.list2cmdline(args), cwd)
+            except TypeError:
+                pass
+        return self.startfile(path)
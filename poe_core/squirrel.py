@@ -0,0 +1,155 @@
+"""Current build of Squirrel-installed programs such as PoE Lurker
+
+Squirrel.Windows installs into %LOCALAPPDATA%\\<App> with one app-x.y.z
+folder per version and a stub launcher <App>.exe in the base folder.
+Updates add a new version folder, so the newest build is the highest
+version, not the first folder listed.
+"""
+import os
+import re
+import threading
+
+# Squirrel's updater, always next to the stub launcher in the base folder
+UPDATE_EXE = 'Update.exe'
+
+APP_FOLDER_RE = re.compile(r'^app-(\d+(?:\.\d+)*)(?:-([0-9A-Za-z.-]+))?$', re.IGNORECASE)
+
+
+def parse_version(folder_name):
+    """Sort key of an app-x.y.z[-pre] folder name, or None for other names
+
+    Follows semantic versioning precedence: numeric parts compare as
+    numbers, and a release sorts after its pre-releases. Pre-release
+    identifiers compare one by one, numeric ones as numbers and before
+    alphanumeric ones (beta.9 < beta.10 < beta.x), and a shorter set
+    sorts first (beta < beta.1).
+    """
+    match = APP_FOLDER_RE.match(folder_name)
+    if not match:
+        return None
+    numbers = tuple(int(part) for part in match.group(1).split('.'))
+    # app-1.4 and app-1.4.0 are the same version
+    numbers += (0,) * (4 - len(numbers))
+    prerelease = match.group(2)
+    if prerelease is None:
+        return numbers, True, ()
+    identifiers = tuple((0, int(part), '') if part.isdigit() else (1, 0, part.lower())
+                        for part in prerelease.split('.'))
+    return numbers, False, identifiers
+
+
+class SquirrelResolver:
+    """Finds the newest build in a Squirrel base folder, cached per folder
+
+    Adding or removing a version folder changes the base folder's mtime,
+    so a repeat lookup only stats the base folder and the cached exe.
+    Newer version folders that had no exe yet (an update still being
+    extracted) are stat'ed too, since filling them does not touch the base
+    folder.
+    """
+
+    def __init__(self, stat=os.stat, scandir=os.scandir):
+        self.stat = stat
+        self.scandir = scandir
+        # (base folder, exe name) -> (base mtime, resolved path,
+        # [(newer folder without the exe, its mtime)])
+        self.cache = {}
+        self.lock = threading.Lock()
+        # Folder scans so far (cache misses)
+        self.scans = 0
+
+    def resolve(self, base, exe_name):
+        """exe_name in the highest app-x.y.z folder, else the stub launcher, else None"""
+        key = (os.path.normcase(base), exe_name.lower())
+        try:
+            mtime = self.stat(base).st_mtime_ns
+        except OSError:
+            with self.lock:
+                self.cache.pop(key, None)
+            return None
+
+        with self.lock:
+            cached = self.cache.get(key)
+        if cached and cached[0] == mtime and self.still_valid(cached[1], cached[2]):
+            return cached[1]
+
+        path, incomplete = self.scan(base, exe_name)
+        with self.lock:
+            self.cache[key] = (mtime, path, incomplete)
+        return path
+
+    def mtime(self, path):
+        try:
+            return self.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def still_valid(self, path, incomplete):
+        """The cached exe still exists and no newer folder has changed since the scan"""
+        if path is not None and self.mtime(path) is None:
+            return False
+        return all(self.mtime(folder) == mtime for folder, mtime in incomplete)
+
+    def scan(self, base, exe_name):
+        """One scandir of the base folder; returns (path, newer folders without the exe)"""
+        self.scans += 1
+        versions = []
+        stub = None
+        try:
+            with self.scandir(base) as entries:
+                for entry in entries:
+                    if entry.name.lower() == exe_name.lower():
+                        if entry.is_file():
+                            stub = entry.path
+                        continue
+                    version = parse_version(entry.name)
+                    if version is not None and entry.is_dir():
+                        versions.append((version, entry.path))
+        except OSError:
+            return None, []
+
+        # Newest first; an update still being extracted (or an aborted one)
+        # may have left a folder without the exe
+        incomplete = []
+        for version, folder in sorted(versions, reverse=True):
+            path = os.path.join(folder, exe_name)
+            if os.path.isfile(path):
+                return path, incomplete
+            incomplete.append((folder, self.mtime(folder)))
+        return stub, incomplete
+
+
+# Shared by detection, launch and the path watcher of one process
+RESOLVER = SquirrelResolver()
+
+
+def current_build(path, resolver=None):
+    """path moved to the newest build if it lies in an app-x.y.z folder
+
+    Other paths, and paths whose base folder has no build, are returned as is.
+    """
+    if not path:
+        return path
+    folder = os.path.dirname(path)
+    if parse_version(os.path.basename(folder)) is None:
+        return path
+    resolved = (resolver or RESOLVER).resolve(os.path.dirname(folder), os.path.basename(path))
+    return resolved or path
+
+
+def stub_target(path, resolver=None):
+    """Newest build started by the Squirrel stub launcher at path, or None
+
+    The stub exits once the build runs, so a running program shows up
+    under the build's path, not the stub's. One stat tells other paths
+    apart: only a Squirrel base folder holds Update.exe.
+    """
+    if not path:
+        return None
+    folder = os.path.dirname(path)
+    if not os.path.isfile(os.path.join(folder, UPDATE_EXE)):
+        return None
+    resolved = (resolver or RESOLVER).resolve(folder, os.path.basename(path))
+    if not resolved or os.path.normcase(resolved) == os.path.normcase(path):
+        return None
+    return resolved
@@ -0,0 +1,226 @@
+"""Steam library lookup from libraryfolders.vdf and appmanifest files
+
+Steam stores its configuration in the text KeyValues ("VDF") format:
+
+    "libraryfolders"
+    {
+        "0"
+        {
+            "path"  "D:\\SteamLibrary"
+            "apps"  { "238960"  "40133625856" }
+        }
+    }
+
+The index maps app ids to the library that holds them, so finding a game
+takes one lookup and one stat however many libraries are configured.
+"""
+import os
+import re
+
+POE_STEAM_APP_ID = "238960"
+POE_EXE_NAME = "PathOfExile.exe"
+POE_INSTALL_DIR = "Path of Exile"
+
+# Characters load_vdf reads at a time
+VDF_BLOCK_SIZE = 64 * 1024
+
+# Leading whitespace, then a quoted string, brace, bare word or a quote
+# that opens a string not closed yet; comments and conditionals like
+# [$WIN32] match with every group empty and are skipped
+_TOKEN_RE = re.compile(r'''
+    \s*
+    (?:
+        ("[^"\\]*(?:\\.[^"\\]*)*")
+      | ([{}])
+      | //[^\n]*
+      | \[[^\]\n]*\]
+      | ([^\s"{}]+)
+      | (")
+    )
+''', re.VERBOSE | re.DOTALL)
+
+_ESCAPES = {'n': '\n', 't': '\t', '\\': '\\', '"': '"'}
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+def _unescape(value):
+    if '\\' not in value:
+        return value
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), '\\' + m.group(1)), value)
+
+
+def _scan(text, final):
+    """Tokens of text one match at a time, and where the unread rest starts
+
+    Unless final, the last token is held back as the next chunk may
+    continue it.
+    """
+    tokens = []
+    pos = 0
+    end = len(text)
+    while pos < end:
+        match = _TOKEN_RE.match(text, pos)
+        if match is None:
+            # Only whitespace is left
+            return tokens, end
+        if match.group(4) or (match.end() == end and not final):
+            if final:
+                raise ValueError("Unterminated string in VDF")
+            break
+        pos = match.end()
+        tokens.append(match.groups())
+    return tokens, pos
+
+
+def iter_tokens(chunks):
+    """Yield lists of (quoted, brace, bare, open quote) tokens from an iterable of text chunks
+
+    Only one chunk and the unfinished line before it are in memory at a
+    time. Raises ValueError on a string that is never closed.
+    """
+    rest = ''
+    for chunk in chunks:
+        text = rest + chunk if rest else chunk
+        # Only strings continue past the end of a line, so everything up to
+        # the last line break can be tokenized in one go
+        cut = text.rfind('\n') + 1
+        tokens = _TOKEN_RE.findall(text, 0, cut)
+        if any(token[3] for token in tokens):
+            # A string spans lines
+            tokens, cut = _scan(text, final=False)
+        yield tokens
+        rest = text[cut:]
+    if rest:
+        yield _scan(rest, final=True)[0]
+
+
+def parse_vdf(text):
+    """Parse a VDF document (a string or an iterable of text chunks) into nested dicts
+
+    KeyValues keys are case-insensitive, so keys are stored lower-cased.
+    Raises ValueError on unbalanced braces, a key without a value or an
+    unterminated string.
+    """
+    if isinstance(text, str):
+        text = (text,)
+    root = {}
+    stack = [root]
+    current = root
+    key = None
+
+    for tokens in iter_tokens(text):
+        for quoted, brace, bare, _ in tokens:
+            if quoted or bare:
+                value = _unescape(quoted[1:-1]) if quoted else bare
+                if key is None:
+                    key = value.lower()
+                else:
+                    current[key] = value
+                    key = None
+            elif brace == '{':
+                if key is None:
+                    raise ValueError("VDF block without a key")
+                child = {}
+                current[key] = child
+                stack.append(child)
+                current = child
+                key = None
+            elif brace:
+                if key is not None or len(stack) == 1:
+                    raise ValueError("Unexpected '}' in VDF")
+                stack.pop()
+                current = stack[-1]
+
+    if key is not None or len(stack) != 1:
+        raise ValueError("Unexpected end of VDF")
+    return root
+
+
+def load_vdf(path):
+    """Parse a VDF file, reading it in blocks"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return parse_vdf(iter(lambda: f.read(VDF_BLOCK_SIZE), ''))
+
+
+class SteamLibraryIndex:
+    """App id -> library folder index of a Steam installation"""
+
+    def __init__(self, steam_dir):
+        self.steam_dir = steam_dir
+        self.libraries = []
+        self.app_libraries = {}
+        self._build()
+
+    @classmethod
+    def from_steam_exe(cls, steam_path):
+        return cls(os.path.dirname(steam_path))
+
+    def _build(self):
+        # The Steam folder itself is always the first library
+        self._add_library(self.steam_dir)
+
+        vdf_path = os.path.join(self.steam_dir, 'steamapps', 'libraryfolders.vdf')
+        if not os.path.exists(vdf_path):
+            return
+
+        folders = load_vdf(vdf_path).get('libraryfolders', {})
+        for key, value in folders.items():
+            if not key.isdigit():
+                continue
+            if isinstance(value, str):
+                # Old format: "1" "D:\\SteamLibrary"
+                self._add_library(value)
+            elif 'path' in value:
+                library = self._add_library(value['path'])
+                apps = value.get('apps')
+                if isinstance(apps, dict):
+                    for app_id in apps:
+                        self.app_libraries.setdefault(app_id, library)
+
+    def _add_library(self, path):
+        path = os.path.normpath(path)
+        for library in self.libraries:
+            if os.path.normcase(library) == os.path.normcase(path):
+                return library
+        self.libraries.append(path)
+        return path
+
+    def manifest_path(self, library, app_id):
+        return os.path.join(library, 'steamapps', f'appmanifest_{app_id}.acf')
+
+    def library_for(self, app_id):
+        """Library folder holding the app, or None if it is not installed"""
+        library = self.app_libraries.get(app_id)
+        if library is not None:
+            return library
+        # Old libraryfolders.vdf files have no apps map - look for the manifest
+        for library in self.libraries:
+            if os.path.exists(self.manifest_path(library, app_id)):
+                return library
+        return None
+
+    def install_dir(self, app_id, default=None):
+        """Folder name below steamapps/common from the app's manifest"""
+        library = self.library_for(app_id)
+        if library is None:
+            return None
+        try:
+            manifest = load_vdf(self.manifest_path(library, app_id))
+            return manifest.get('appstate', {}).get('installdir') or default
+        except (OSError, ValueError):
+            return default
+
+    def find_exe(self, app_id, exe_name, default_install_dir=None):
+        """Full path of an installed app's executable, or None"""
+        library = self.library_for(app_id)
+        if library is None:
+            return None
+        install_dir = self.install_dir(app_id, default_install_dir)
+        if not install_dir:
+            return None
+        exe_path = os.path.join(library, 'steamapps', 'common', install_dir, exe_name)
+        if os.path.exists(exe_path):
+            return exe_path
+        return None
+
+    def find_poe(self):
+        return self.find_exe(POE_STEAM_APP_ID, POE_EXE_NAME, POE_INSTALL_DIR)
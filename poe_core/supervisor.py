@@ -0,0 +1,243 @@
+"""Keeps launched companion programs running while the game runs
+
+After a launch the supervisor looks up the PIDs of the companions that
+were started, restarts any that crash (with an increasing delay) and stops
+them once the game exits. While everything runs it only asks psutil
+whether the known PIDs are still alive, every few seconds; the full
+process table is walked only while it waits for the game or a
+(re)started program to show up.
+"""
+import ntpath
+import threading
+import time
+
+from poe_core.processes import ProcessSnapshot
+
+# Image names of the standalone and Steam game clients
+GAME_PROCESS_NAMES = ('PathOfExile.exe', 'PathOfExile_x64.exe', 'PathOfExileSteam.exe', 'PathOfExile_x64Steam.exe')
+
+# Seconds between two checks
+DEFAULT_POLL_INTERVAL = 2.0
+# Give up if the game has not started after this many seconds (Steam updates)
+DEFAULT_GAME_START_TIMEOUT = 300.0
+# A started program that has no process after this many seconds failed to start
+DEFAULT_ADOPT_TIMEOUT = 20.0
+# Restart delays: first delay, doubled after every restart, up to the maximum
+RESTART_DELAY = 2.0
+MAX_RESTART_DELAY = 60.0
+# Restarts in a row before a companion is given up on
+MAX_RESTARTS = 5
+# A companion that stays up this long starts over with the first delay
+STABLE_AFTER = 120.0
+
+# psutil.STATUS_ZOMBIE: exited, but not yet reaped by its parent
+STATUS_ZOMBIE = 'zombie'
+
+
+def default_process_factory(pid):
+    import psutil
+    return psutil.Process(pid)
+
+
+def is_alive(process):
+    """psutil.Process that still runs (is_running also guards against PID reuse)"""
+    try:
+        return process.is_running() and process.status() != STATUS_ZOMBIE
+    except Exception:
+        return False
+
+
+class Companion:
+    """Supervision state of one companion program"""
+
+    def __init__(self, key, name, path, args=(), pid=None):
+        self.key = key
+        self.name = name
+        self.path = path
+        self.args = list(args)
+        # PID of the launch, if known; otherwise it is looked up by path
+        self.pid = pid
+        self.process = None
+        # Clock time the program was (re)started and is expected to appear
+        self.pending_since = None
+        self.up_since = None
+        self.restart_at = None
+        self.restarts = 0
+        self.gave_up = False
+        # The started process exited right away and was assumed to be a stub
+        self.handed_off = False
+
+    def restart_delay(self):
+        return min(RESTART_DELAY * 2 ** self.restarts, MAX_RESTART_DELAY)
+
+
+class Supervisor:
+    """Restarts crashed companions and stops them when the game exits
+
+    start_program(path, args) starts a program and returns a handle with
+    its pid (a SpawnedProcess); if it has none, the PID is found by
+    executable path.
+    """
+
+    def __init__(self, companions, start_program, status=None, process_iter=None,
+                 process_factory=default_process_factory, clock=time.monotonic,
+                 poll_interval=DEFAULT_POLL_INTERVAL, game_start_timeout=DEFAULT_GAME_START_TIMEOUT,
+                 adopt_timeout=DEFAULT_ADOPT_TIMEOUT):
+        self.companions = list(companions)
+        self.start_program = start_program
+        self.status = status or (lambda message: print(message))
+        self.process_iter = process_iter
+        self.process_factory = process_factory
+        self.clock = clock
+        self.poll_interval = poll_interval
+        self.game_start_timeout = game_start_timeout
+        self.adopt_timeout = adopt_timeout
+        self.game = None
+        self.stop_event = threading.Event()
+        self.restarted = 0
+
+    @classmethod
+    def for_launch(cls, catalog, started, start_program, pids=None, **kwargs):
+        """Supervisor for the companions a launch started (key -> path, key -> PID)"""
+        pids = pids or {}
+        companions = [Companion(spec.key, spec.display_name, started[spec.key], spec.launch_args,
+                                pids.get(spec.key))
+                      for spec in catalog.companions if spec.key in started]
+        return cls(companions, start_program, **kwargs)
+
+    def run(self):
+        """Supervise until the game exits, fails to start or stop() is called"""
+        now = self.clock()
+        game_deadline = now + self.game_start_timeout
+        for companion in self.companions:
+            companion.pending_since = now
+            if companion.pid is not None:
+                self.watch(companion, companion.pid, now)
+        print(f"Supervising: {', '.join(companion.name for companion in self.companions) or 'nothing'}")
+
+        while not self.stop_event.is_set():
+            now = self.clock()
+            if self.game is None or self.pending():
+                snapshot = ProcessSnapshot.capture(include_paths=True, process_iter=self.process_iter)
+                if self.game is None:
+                    self.find_game(snapshot)
+                self.adopt(snapshot, now)
+
+            if self.game is None:
+                if now >= game_deadline:
+                    print("Supervisor: the game did not start, companions are left running")
+                    return False
+            elif not is_alive(self.game):
+                self.status("Path of Exile closed, stopping companion programs")
+                self.stop_companions()
+                return True
+
+            self.check(now)
+            self.stop_event.wait(self.poll_interval)
+        return False
+
+    def stop(self):
+        self.stop_event.set()
+
+    def pending(self):
+        return any(companion.pending_since is not None for companion in self.companions)
+
+    def find_game(self, snapshot):
+        for name in GAME_PROCESS_NAMES:
+            pids = snapshot.pids(name)
+            if pids:
+                try:
+                    self.game = self.process_factory(pids[0])
+                    print(f"Supervisor: watching {name} (PID {pids[0]})")
+                except Exception as e:
+                    print(f"Supervisor: cannot watch {name}: {e}")
+                return
+
+    def adopt(self, snapshot, now):
+        """Find the processes of started companions by executable path"""
+        for companion in self.companions:
+            if companion.pending_since is None:
+                continue
+            pids = snapshot.path_pids(companion.path)
+            if not pids and companion.handed_off:
+                # Stubs start the real program from another folder
+                pids = snapshot.pids(ntpath.basename(companion.path))
+            if pids:
+                self.watch(companion, pids[0], now)
+            elif now - companion.pending_since > self.adopt_timeout:
+                print(f"Supervisor: {companion.name} did not start")
+                companion.pending_since = None
+                self.crashed(companion, now)
+
+    def watch(self, companion, pid, now):
+        try:
+            companion.process = self.process_factory(pid)
+        except Exception as e:
+            print(f"Supervisor: cannot watch {companion.name}: {e}")
+            return
+        companion.pending_since = None
+        companion.up_since = now
+
+    def check(self, now):
+        """Notice crashes, start due restarts and reset the backoff of stable programs"""
+        for companion in self.companions:
+            if companion.process is not None:
+                if not is_alive(companion.process):
+                    companion.process = None
+                    if not companion.handed_off and now - companion.up_since < self.adopt_timeout:
+                        # Launcher stubs (e.g. Squirrel's) start the real
+                        # program and exit; look for it instead
+                        companion.handed_off = True
+                        companion.pending_since = now
+                    else:
+                        self.crashed(companion, now)
+                elif companion.restarts and now - companion.up_since >= STABLE_AFTER:
+                    companion.restarts = 0
+            if companion.restart_at is not None and now >= companion.restart_at:
+                self.restart(companion, now)
+
+    def crashed(self, companion, now):
+        if companion.restarts >= MAX_RESTARTS:
+            if not companion.gave_up:
+                companion.gave_up = True
+                self.status(f"{companion.name} keeps exiting, not restarting it again")
+            return
+        delay = companion.restart_delay()
+        companion.restart_at = now + delay
+        self.status(f"{companion.name} exited, restarting in {delay:.0f}s")
+
+    def restart(self, companion, now):
+        companion.restart_at = None
+        companion.handed_off = False
+        companion.restarts += 1
+        self.restarted += 1
+        handle = None
+        try:
+            handle = self.start_program(companion.path, companion.args)
+        except Exception as e:
+            print(f"Supervisor: restarting {companion.name} failed: {e}")
+        pid = getattr(handle, 'pid', None)
+        if pid is not None:
+            self.watch(companion, pid, now)
+        else:
+            companion.pending_since = now
+        print(f"Supervisor: restarted {companion.name} ({companion.restarts}/{MAX_RESTARTS})")
+
+    def stop_companions(self, timeout=5.0):
+        """Terminate the supervised companions that are still running"""
+        running = [companion.process for companion in self.companions
+                   if companion.process is not None and is_alive(companion.process)]
+        for process in running:
+            try:
+                process.terminate()
+            except Exception as e:
+                print(f"Supervisor: cannot stop PID {process.pid}: {e}")
+        deadline = self.clock() + timeout
+        for process in running:
+            try:
+                process.wait(max(0.0, deadline - self.clock()))
+            except Exception:
+                try:
+                    process.kill()
+                except Exception:
+                    pass
@@ -0,0 +1,178 @@
+"""Launch timeline spans, Chrome trace export and a rolling launch history
+
+Spans use a monotonic clock and can be written in the Chrome trace-event
+format, which chrome://tracing and https://ui.perfetto.dev open directly.
+"""
+import contextlib
+import json
+import os
+import statistics
+import threading
+import time
+
+from poe_core.config import DEFAULT_HISTORY_SIZE, write_atomic
+
+
+class Span:
+    """One timed phase: seconds since the tracer started"""
+
+    def __init__(self, name, category, start, end, thread, args):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.end = end
+        self.thread = thread
+        self.args = args
+
+    @property
+    def elapsed(self):
+        return self.end - self.start
+
+
+class Tracer:
+    """Records spans from any thread"""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.origin = clock()
+        self.wall_start = time.time()
+        self.spans = []
+        self.thread_names = {}
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name, category='launch', **args):
+        """Time the body of a with block; exceptions are recorded and re-raised"""
+        thread = threading.current_thread()
+        start = self.clock() - self.origin
+        try:
+            yield args
+        except BaseException as e:
+            args['error'] = str(e)
+            raise
+        finally:
+            end = self.clock() - self.origin
+            with self.lock:
+                self.thread_names.setdefault(thread.ident, thread.name)
+                self.spans.append(Span(name, category, start, end, thread.ident, args))
+
+    def wrap(self, name, func, category='launch', **args):
+        """func wrapped in a span, e.g. for scheduler steps"""
+        def traced(*a, **kw):
+            with self.span(name, category, **args):
+                return func(*a, **kw)
+        return traced
+
+    @property
+    def elapsed(self):
+        """Seconds from the tracer start to the end of the last span"""
+        with self.lock:
+            return max((span.end for span in self.spans), default=0.0)
+
+    def summary(self):
+        """Milliseconds per span name (summed if a name repeats)"""
+        totals = {}
+        with self.lock:
+            for span in self.spans:
+                totals[span.name] = totals.get(span.name, 0.0) + span.elapsed * 1000
+        return {name: round(ms, 1) for name, ms in totals.items()}
+
+    def to_chrome_trace(self):
+        """Trace-event JSON object with one complete ("X") event per span"""
+        with self.lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+            thread_names = dict(self.thread_names)
+
+        # Small, stable thread ids in order of first appearance
+        tids = {}
+        for span in spans:
+            tids.setdefault(span.thread, len(tids) + 1)
+
+        events = []
+        for ident, tid in tids.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid,
+                           'args': {'name': thread_names.get(ident, str(ident))}})
+        for span in spans:
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round(span.start * 1e6, 1),
+                'dur': round(span.elapsed * 1e6, 1),
+                'pid': 1,
+                'tid': tids[span.thread],
+                'args': {key: str(value) for key, value in span.args.items()},
+            })
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.wall_start))},
+        }
+
+    def export(self, path):
+        """Write the Chrome trace to a file"""
+        write_atomic(path, json.dumps(self.to_chrome_trace(), indent=1))
+
+
+class LaunchHistory:
+    """The last launches: a summary list plus their full Chrome traces"""
+
+    def __init__(self, directory, size=DEFAULT_HISTORY_SIZE):
+        self.directory = directory
+        self.size = size
+        self.index_file = os.path.join(directory, 'history.json')
+
+    def entries(self):
+        """Recorded launches, oldest first"""
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def record(self, tracer, ok=True, profile=None):
+        """Store a launch trace and drop launches beyond the history size"""
+        if self.size <= 0:
+            return None
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(tracer.wall_start))
+        trace_name = f"launch-{stamp}-{int(tracer.wall_start * 1000) % 1000:03}.json"
+        tracer.export(os.path.join(self.directory, trace_name))
+
+        entries = self.entries()
+        entries.append({
+            'started': tracer.wall_start,
+            'ok': ok,
+            'profile': profile,
+            'total_ms': round(tracer.elapsed * 1000, 1),
+            'phases': tracer.summary(),
+            'trace': trace_name,
+        })
+        for old in entries[:-self.size]:
+            try:
+                os.remove(os.path.join(self.directory, old['trace']))
+            except OSError:
+                pass
+        entries = entries[-self.size:]
+        write_atomic(self.index_file, json.dumps(entries, indent=1))
+        return os.path.join(self.directory, trace_name)
+
+    def compare(self):
+        """Latest launch against the median of the earlier ones, per phase
+
+        Returns a list of (phase, latest ms, median ms or None).
+        """
+        entries = self.entries()
+        if not entries:
+            return []
+        latest, earlier = entries[-1], entries[:-1]
+        rows = [('total', latest['total_ms'], self._median(earlier, None))]
+        for phase, ms in latest['phases'].items():
+            rows.append((phase, ms, self._median(earlier, phase)))
+        return rows
+
+    def _median(self, entries, phase):
+        if phase is None:
+            values = [entry['total_ms'] for entry in entries]
+        else:
+            values = [entry['phases'][phase] for entry in entries if phase in entry['phases']]
+        return round(statistics.median(values), 1) if values else None
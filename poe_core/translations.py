@@ -0,0 +1,96 @@
+"""UI and status message translations"""
+import locale
+
+TRANSLATIONS = {
+    'en': {
+        'title': 'Path of Exile Launcher',
+        'game_version': 'Game Version',
+        'steam_version': 'Steam Version',
+        'standalone_version': 'Standalone Version',
+        'steam_path': 'Steam Path:',
+        'game_path': 'Game Path:',
+        'companion_programs': 'Companion Programs',
+        'awakened_trade': 'Awakened PoE Trade',
+        'poe_lurker': 'Poe Lurker',
+        'chaos_recipe': 'Chaos Recipe Enhancer',
+        'websites': 'Websites',
+        'filterblade': 'FilterBlade',
+        'trade_site': 'Trade Site',
+        'browse': 'Browse',
+        'launch': 'Start',
+        'start': 'Start',
+        'language': 'Language:',
+        'auto_detect': 'Auto-Detect Programs',
+        'profile': 'Profile:',
+        'detection_timings': 'Detection timings',
+        'supervise_companions': 'Keep companion programs running until the game closes',
+        'supervising': 'Watching companion programs until Path of Exile closes...',
+        'path_missing': '{} is no longer at its configured path',
+        'path_moved': '{} is no longer at its configured path - it may have moved to: {}',
+        'new_profile': 'New',
+        'delete_profile': 'Delete',
+        'profile_name_prompt': 'Name of the new profile:',
+        'steam_path_info': 'Path to Steam executable (steam.exe)\n\nThis is used to start Steam if it\'s not already running.\nThe actual Path of Exile game will be launched automatically\nfrom your Steam library.',
+        'game_path_info': 'Path to standalone Path of Exile executable\n(PathOfExile.exe)\n\nThis is the direct game executable for the\nstandalone (non-Steam) version of Path of Exile.',
+        'launching': 'Launching programs...',
+        'steam_starting': 'Starting Steam... Please wait...',
+        'launched_successfully': 'Successfully launched: {}',
+        'errors_occurred': 'Errors: {}',
+        'file_not_found': '{} not found at: {}',
+        'closing_in': ' (Closing in {} seconds...)'
+    },
+    'de': {
+        'title': 'Path of Exile Launcher',
+        'game_version': 'Spiel Version',
+        'steam_version': 'Steam Version',
+        'standalone_version': 'Standalone Version',
+        'steam_path': 'Steam Pfad:',
+        'game_path': 'Spiel Pfad:',
+        'companion_programs': 'Begleitprogramme',
+        'awakened_trade': 'Awakened PoE Trade',
+        'poe_lurker': 'Poe Lurker',
+        'chaos_recipe': 'Chaos Recipe Enhancer',
+        'websites': 'Webseiten',
+        'filterblade': 'FilterBlade',
+        'trade_site': 'Handelsseite',
+        'browse': 'Durchsuchen',
+        'launch': 'Starten',
+        'start': 'Starten',
+        'language': 'Sprache:',
+        'auto_detect': 'Programme Automatisch Erkennen',
+        'profile': 'Profil:',
+        'detection_timings': 'Erkennungszeiten',
+        'supervise_companions': 'Begleitprogramme bis zum Beenden des Spiels am Laufen halten',
+        'supervising': 'Überwache Begleitprogramme bis Path of Exile beendet wird...',
+        'path_missing': '{} ist nicht mehr am eingestellten Pfad',
+        'path_moved': '{} ist nicht mehr am eingestellten Pfad - möglicherweise verschoben nach: {}',
+        'new_profile': 'Neu',
+        'delete_profile': 'Löschen',
+        'profile_name_prompt': 'Name des neuen Profils:',
+        'steam_path_info': 'Pfad zur Steam-Anwendung (steam.exe)\n\nWird verwendet, um Steam zu starten, falls es noch nicht läuft.\nDas eigentliche Path of Exile Spiel wird automatisch\naus Ihrer Steam-Bibliothek gestartet.',
+        'game_path_info': 'Pfad zur eigenständigen Path of Exile Anwendung\n(PathOfExile.exe)\n\nDies ist die direkte Spiel-Anwendung für die\neigenständige (Nicht-Steam) Version von Path of Exile.',
+        'launching': 'Programme werden gestartet...',
+        'steam_starting': 'Steam wird gestartet... Bitte warten...',
+        'launched_successfully': 'Erfolgreich gestartet: {}',
+        'errors_occurred': 'Fehler: {}',
+        'file_not_found': '{} nicht gefunden unter: {}',
+        'closing_in': ' (Schließt in {} Sekunden...)'
+    }
+}
+
+
+def system_language():
+    """Pick the UI language from the system locale"""
+    try:
+        system_lang = locale.getdefaultlocale()[0]
+        if system_lang and system_lang.startswith('de'):
+            return 'de'
+    except Exception:
+        pass
+    return 'en'
+
+
+def translator(language):
+    """Return a t(key) function for the given language"""
+    texts = TRANSLATIONS.get(language, TRANSLATIONS['en'])
+    return lambda key: texts.get(key, key)
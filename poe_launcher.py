@@ -1,37 +1,152 @@
 #!/usr/bin/env python3
+import time
+
+# Reference point for the startup timings (time-to-first-frame etc.)
+STARTUP_CLOCK_START = time.perf_counter()
+
+import sys
+
+# A frozen executable re-runs itself for detection worker processes; those
+# must not be mistaken for command line use
+if __name__ == "__main__" and getattr(sys, 'frozen', False):
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+# Headless use (--launch, --detect) never needs Tk - hand over before importing it
+if __name__ == "__main__" and len(sys.argv) > 1:
+    from poe_core.cli import main as cli_main
+    sys.exit(cli_main())
+
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import json
+from tkinter import ttk, filedialog, messagebox, simpledialog
 import os
-import subprocess
-import psutil
-import webbrowser
-import locale
-import sys
 from pathlib import Path
-import time
+import queue
 import threading
-import glob
-import string
-try:
-    import winreg
-except ImportError:
-    winreg = None
+
+from poe_core.catalog import CATALOG
+from poe_core.config import DEFAULT_HISTORY_SIZE, config_dir
+from poe_core.detection import normalize_path
+from poe_core.engine import Engine, merge_detected, missing_paths
+from poe_core.profiles import DEFAULT_PROFILE
+from poe_core.readiness import DEFAULT_STEAM_SIGNAL, DEFAULT_STEAM_TIMEOUT
+from poe_core.squirrel import current_build
+from poe_core.translations import TRANSLATIONS, system_language, translator
+
+# psutil, webbrowser and the launch pipeline modules are imported on first
+# use - they are not needed to show the window
+
+# Edits are written to config.json once the user pauses for this long (ms)
+SETTINGS_SAVE_DELAY = 500
+
+class UIUpdateQueue:
+    """Hands UI work from worker threads to the Tk main loop
+
+    Workers never touch widgets or Tk variables directly. They queue calls
+    and status messages, and a root.after pump applies them at a bounded
+    frame rate. Status messages are merged so only the latest one per frame
+    is rendered.
+    """
+    
+    def __init__(self, root, status_label, fps=30):
+        self.root = root
+        self.status_label = status_label
+        self.interval = max(1, int(1000 / fps))
+        self.calls = queue.Queue()
+        self.status_lock = threading.Lock()
+        self.pending_status = None
+        self.running = True
+        self.root.after(self.interval, self.pump)
+    
+    def call(self, func, *args):
+        """Run func(*args) on the UI thread during the next frame"""
+        self.calls.put((func, args))
+    
+    def set_status(self, message):
+        """Show a status message; later messages in the same frame replace it"""
+        with self.status_lock:
+            self.pending_status = message
+    
+    def pump(self):
+        """Apply everything queued since the last frame"""
+        if not self.running:
+            return
+        while True:
+            try:
+                func, args = self.calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"UI update failed: {e}")
+        
+        with self.status_lock:
+            message, self.pending_status = self.pending_status, None
+        if message is not None:
+            self.status_label.config(text=message)
+        
+        self.root.after(self.interval, self.pump)
+    
+    def stop(self):
+        self.running = False
+
 
 class PoELauncher:
-    def __init__(self):
+    def __init__(self, fast_start=True):
+        self.startup_timings = {}
+        # While set, path validation is postponed until the window is shown
+        self.startup_pending = fast_start
+        self.startup_validated = threading.Event()
+        
         self.root = tk.Tk()
         self.setup_window()
         self.setup_variables()
         self.load_translations()
         self.setup_config_path()
         self.create_widgets()
+        self.ui = UIUpdateQueue(self.root, self.status_label)
         self.load_settings()
         self.update_ui()
+        self.watch_settings()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Auto-detect installations on startup (only if paths are empty)
-        self.auto_detect_on_startup()
+        if fast_start:
+            # Show the window with the saved values first, then validate
+            # paths and auto-detect in the background
+            self.root.after_idle(self.on_first_frame)
+        else:
+            # load_settings already validated all paths
+            self.record_startup_timing('first_frame')
+            self.record_startup_timing('interactive')
+            self.startup_validated.set()
+            self.watch_paths()
+            # Auto-detect installations on startup (only if paths are empty)
+            self.auto_detect_on_startup(self.collect_settings())
+    
+    def record_startup_timing(self, name):
+        """Remember seconds since process start for the startup benchmark"""
+        self.startup_timings[name] = time.perf_counter() - STARTUP_CLOCK_START
+    
+    def on_first_frame(self):
+        """Called once the main loop is idle for the first time"""
+        self.root.update_idletasks()
+        self.record_startup_timing('first_frame')
+        thread = threading.Thread(target=self.finish_startup, args=(self.collect_settings(),))
+        thread.daemon = True
+        thread.start()
+    
+    def finish_startup(self, settings):
+        """Validate configured paths and run startup detection off the UI thread"""
+        states = self.check_paths(settings)
+        self.ui.call(self.apply_path_states, states)
+        
+        # Detected paths must be validated normally, so wait for the UI thread
+        self.startup_validated.wait()
         
+        # Auto-detect installations on startup (only if paths are empty)
+        self.auto_detect_on_startup(settings)
+    
     def setup_window(self):
         self.root.title("Path of Exile Launcher")
         self.root.geometry("600x800")
@@ -53,102 +168,64 @@ class PoELauncher:
         self.root.configure(bg=self.colors['bg'])
         
     def setup_variables(self):
+        # Settings profile shown in the window
+        self.profile = tk.StringVar(value=DEFAULT_PROFILE)
+        # Set while a profile's values are applied, to validate paths once afterwards
+        self.applying_profile = False
+        
         # Game version
         self.game_version = tk.StringVar(value="steam")
         
-        # Paths
-        self.steam_path = tk.StringVar(value="")
-        self.standalone_path = tk.StringVar(value="")
-        
-        # Companion programs
-        self.awakened_path = tk.StringVar(value="")
-        self.lurker_path = tk.StringVar(value="")
-        self.chaos_recipe_path = tk.StringVar(value="")
-        
-        # Checkboxes
-        self.start_awakened = tk.BooleanVar(value=False)
-        self.start_lurker = tk.BooleanVar(value=False)
-        self.start_chaos_recipe = tk.BooleanVar(value=False)
-        self.open_filterblade = tk.BooleanVar(value=False)
-        self.open_trade_site = tk.BooleanVar(value=False)
+        # Paths and "start" checkboxes for every catalogued program, keyed by
+        # program key and also exposed under their config names
+        # (self.steam_path, self.start_awakened, ...)
+        self.path_vars = {}
+        self.start_vars = {}
+        for spec in CATALOG:
+            self.path_vars[spec.key] = tk.StringVar(value="")
+            setattr(self, spec.path_attr, self.path_vars[spec.key])
+            if spec.start_attr:
+                self.start_vars[spec.key] = tk.BooleanVar(value=False)
+                setattr(self, spec.start_attr, self.start_vars[spec.key])
+        
+        # Website checkboxes
+        self.website_vars = {}
+        for site in CATALOG.websites:
+            self.website_vars[site.key] = tk.BooleanVar(value=False)
+            setattr(self, site.start_attr, self.website_vars[site.key])
+        
+        # Restart crashed companions and stop them with the game
+        self.supervise_companions = tk.BooleanVar(value=False)
         
         # Language
         self.language = tk.StringVar(value="en")
         
+        # Show the detection timing panel after manual detection (not saved)
+        self.profile_detection = tk.BooleanVar(value=False)
+        
+        # Maximum time to wait for a freshly started Steam client (seconds)
+        self.steam_ready_timeout = DEFAULT_STEAM_TIMEOUT
+        # What signals that Steam is ready, plus an optional port to wait for
+        self.steam_ready_signal = DEFAULT_STEAM_SIGNAL
+        self.steam_ready_port = 0
+        
+        # Launches kept in the launch trace history (0 disables it)
+        self.launch_history = DEFAULT_HISTORY_SIZE
+        
+        # Run detection in a worker process so disk and registry scans never
+        # stall the Tk main loop
+        self.detect_in_process = True
+        
         # Store checkbox references for enabling/disabling
         self.checkboxes = {}
         
         # Steam PoE path detection removed - no longer needed
         
     def load_translations(self):
-        self.translations = {
-            'en': {
-                'title': 'Path of Exile Launcher',
-                'game_version': 'Game Version',
-                'steam_version': 'Steam Version',
-                'standalone_version': 'Standalone Version',
-                'steam_path': 'Steam Path:',
-                'game_path': 'Game Path:',
-                'companion_programs': 'Companion Programs',
-                'awakened_trade': 'Awakened PoE Trade',
-                'poe_lurker': 'Poe Lurker',
-                'chaos_recipe': 'Chaos Recipe Enhancer',
-                'websites': 'Websites',
-                'filterblade': 'FilterBlade',
-                'trade_site': 'Trade Site',
-                'browse': 'Browse',
-                'launch': 'Start',
-                'start': 'Start',
-                'language': 'Language:',
-                'auto_detect': 'Auto-Detect Programs',
-                'steam_path_info': 'Path to Steam executable (steam.exe)\n\nThis is used to start Steam if it\'s not already running.\nThe actual Path of Exile game will be launched automatically\nfrom your Steam library.',
-                'game_path_info': 'Path to standalone Path of Exile executable\n(PathOfExile.exe)\n\nThis is the direct game executable for the\nstandalone (non-Steam) version of Path of Exile.',
-                'launching': 'Launching programs...',
-                'steam_starting': 'Starting Steam... Please wait...',
-                'launched_successfully': 'Successfully launched: {}',
-                'errors_occurred': 'Errors: {}',
-                'file_not_found': '{} not found at: {}',
-                'closing_in': ' (Closing in {} seconds...)'
-            },
-            'de': {
-                'title': 'Path of Exile Launcher',
-                'game_version': 'Spiel Version',
-                'steam_version': 'Steam Version',
-                'standalone_version': 'Standalone Version',
-                'steam_path': 'Steam Pfad:',
-                'game_path': 'Spiel Pfad:',
-                'companion_programs': 'Begleitprogramme',
-                'awakened_trade': 'Awakened PoE Trade',
-                'poe_lurker': 'Poe Lurker',
-                'chaos_recipe': 'Chaos Recipe Enhancer',
-                'websites': 'Webseiten',
-                'filterblade': 'FilterBlade',
-                'trade_site': 'Handelsseite',
-                'browse': 'Durchsuchen',
-                'launch': 'Starten',
-                'start': 'Starten',
-                'language': 'Sprache:',
-                'auto_detect': 'Programme Automatisch Erkennen',
-                'steam_path_info': 'Pfad zur Steam-Anwendung (steam.exe)\n\nWird verwendet, um Steam zu starten, falls es noch nicht läuft.\nDas eigentliche Path of Exile Spiel wird automatisch\naus Ihrer Steam-Bibliothek gestartet.',
-                'game_path_info': 'Pfad zur eigenständigen Path of Exile Anwendung\n(PathOfExile.exe)\n\nDies ist die direkte Spiel-Anwendung für die\neigenständige (Nicht-Steam) Version von Path of Exile.',
-                'launching': 'Programme werden gestartet...',
-                'steam_starting': 'Steam wird gestartet... Bitte warten...',
-                'launched_successfully': 'Erfolgreich gestartet: {}',
-                'errors_occurred': 'Fehler: {}',
-                'file_not_found': '{} nicht gefunden unter: {}',
-                'closing_in': ' (Schließt in {} Sekunden...)'
-            }
-        }
+        self.translations = TRANSLATIONS
         
         # Detect system language
-        try:
-            system_lang = locale.getdefaultlocale()[0]
-            if system_lang and system_lang.startswith('de'):
-                self.language.set('de')
-            else:
-                self.language.set('en')
-        except:
-            self.language.set('en')
+        self.language.set(system_language())
     
     def t(self, key):
         """Get translated text"""
@@ -156,13 +233,23 @@ class PoELauncher:
     
     def setup_config_path(self):
         """Setup configuration file path"""
-        if os.name == 'nt':  # Windows
-            config_dir = os.path.expanduser('~\\AppData\\Local\\PoELauncher')
-        else:
-            config_dir = os.path.expanduser('~/.config/PoeLauncher')
-        
-        os.makedirs(config_dir, exist_ok=True)
-        self.config_file = os.path.join(config_dir, 'config.json')
+        directory = config_dir()
+        os.makedirs(directory, exist_ok=True)
+        # GUI-free settings, detection and launch engine; the window only
+        # hands it plain settings dicts collected from the Tk variables
+        self.engine = Engine(os.path.join(directory, 'config.json'))
+        self.config_file = self.engine.config_file
+        self.profiles = self.engine.profiles
+        self.save_job = None
+        # Detection runs that are still going; cancelled when the window closes
+        self.detection_runs = []
+        # Worker process shared by the detection runs of this session; the
+        # startup thread and the Detect button may both create it (the lock
+        # also guards detection_runs)
+        self.detection_worker = None
+        self.detection_worker_lock = threading.Lock()
+        # Re-checks the companion paths in the background once the window is up
+        self.path_watcher = None
         
         # Debug: Print config path to help with troubleshooting
         print(f"Config file path: {self.config_file}")
@@ -200,6 +287,38 @@ class PoELauncher:
                                         relief='flat', padx=15)
         self.auto_detect_btn.pack(side='right')
         
+        # Opt-in timing report after manual detection
+        self.profile_detection_check = tk.Checkbutton(lang_combo_frame, text=self.t('detection_timings'),
+                                                      variable=self.profile_detection,
+                                                      fg=self.colors['text'], bg=self.colors['bg_light'],
+                                                      selectcolor=self.colors['bg'],
+                                                      activebackground=self.colors['bg_light'])
+        self.profile_detection_check.pack(side='right', padx=(0, 10))
+        
+        # Profile selection
+        profile_frame = self.create_section_frame(main_frame)
+        self.profile_title = self.create_section_title(profile_frame, 'profile')
+        
+        profile_row = tk.Frame(profile_frame, bg=self.colors['bg_light'])
+        profile_row.pack(fill='x')
+        
+        self.profile_combo = ttk.Combobox(profile_row, textvariable=self.profile,
+                                         values=[DEFAULT_PROFILE], state='readonly', width=25)
+        self.profile_combo.pack(side='left')
+        self.profile_combo.bind('<<ComboboxSelected>>', self.on_profile_selected)
+        
+        self.delete_profile_btn = tk.Button(profile_row, text=self.t('delete_profile'),
+                                           command=self.delete_profile,
+                                           bg=self.colors['secondary'], fg='white',
+                                           relief='flat', padx=15)
+        self.delete_profile_btn.pack(side='right')
+        
+        self.new_profile_btn = tk.Button(profile_row, text=self.t('new_profile'),
+                                        command=self.new_profile,
+                                        bg=self.colors['button_bg'], fg='white',
+                                        relief='flat', padx=15)
+        self.new_profile_btn.pack(side='right', padx=(0, 5))
+        
         # Game Version Section
         game_frame = self.create_section_frame(main_frame)
         self.game_version_title = self.create_section_title(game_frame, 'game_version')
@@ -223,50 +342,45 @@ class PoELauncher:
         self.standalone_radio.pack(side='left')
         
         # Steam path with info icon
-        self.steam_path_frame = self.create_path_input_with_info(game_frame, 'steam_path', self.steam_path, self.browse_steam_path, 'steam_path_info')
+        self.steam_path_frame = self.create_path_input_with_info(game_frame, 'steam_path', self.steam_path, lambda: self.browse_program('steam'), 'steam_path_info')
         
         # Standalone path with info icon
-        self.standalone_path_frame = self.create_path_input_with_info(game_frame, 'game_path', self.standalone_path, self.browse_standalone_path, 'game_path_info')
+        self.standalone_path_frame = self.create_path_input_with_info(game_frame, 'game_path', self.standalone_path, lambda: self.browse_program('poe_standalone'), 'game_path_info')
         
         # Companion Programs Section
         companion_frame = self.create_section_frame(main_frame)
         self.companion_title = self.create_section_title(companion_frame, 'companion_programs')
         
-        # Awakened PoE Trade
-        self.create_program_input(companion_frame, 'awakened_trade', self.start_awakened, 
-                                 self.awakened_path, self.browse_awakened_path)
-        
-        # PoE Lurker
-        self.create_program_input(companion_frame, 'poe_lurker', self.start_lurker, 
-                                 self.lurker_path, self.browse_lurker_path)
-        
-        # Chaos Recipe Enhancer
-        self.create_program_input(companion_frame, 'chaos_recipe', self.start_chaos_recipe, 
-                                 self.chaos_recipe_path, self.browse_chaos_recipe_path)
+        # One row per companion program in the catalog
+        for spec in CATALOG.companions:
+            self.create_program_input(companion_frame, spec.key, self.start_vars[spec.key],
+                                     self.path_vars[spec.key],
+                                     lambda key=spec.key: self.browse_program(key))
         
         # Websites Section
         websites_frame = self.create_section_frame(main_frame)
         self.websites_title = self.create_section_title(websites_frame, 'websites')
         
-        # FilterBlade checkbox
-        filterblade_frame = tk.Frame(websites_frame, bg=self.colors['bg_light'])
-        filterblade_frame.pack(fill='x', pady=(0, 5))
-        
-        self.filterblade_check = tk.Checkbutton(filterblade_frame, text=self.t('filterblade'),
-                                               variable=self.open_filterblade,
-                                               fg=self.colors['text'], bg=self.colors['bg_light'],
-                                               selectcolor=self.colors['bg'], activebackground=self.colors['bg_light'])
-        self.filterblade_check.pack(side='left')
-        
-        # Trade Site checkbox
-        trade_frame = tk.Frame(websites_frame, bg=self.colors['bg_light'])
-        trade_frame.pack(fill='x')
-        
-        self.trade_check = tk.Checkbutton(trade_frame, text=self.t('trade_site'),
-                                         variable=self.open_trade_site,
-                                         fg=self.colors['text'], bg=self.colors['bg_light'],
-                                         selectcolor=self.colors['bg'], activebackground=self.colors['bg_light'])
-        self.trade_check.pack(side='left')
+        # One checkbox per website in the catalog
+        self.website_checks = {}
+        for site in CATALOG.websites:
+            site_frame = tk.Frame(websites_frame, bg=self.colors['bg_light'])
+            site_frame.pack(fill='x', pady=(0, 5))
+            
+            site_check = tk.Checkbutton(site_frame, text=self.t(site.key),
+                                        variable=self.website_vars[site.key],
+                                        fg=self.colors['text'], bg=self.colors['bg_light'],
+                                        selectcolor=self.colors['bg'], activebackground=self.colors['bg_light'])
+            site_check.pack(side='left')
+            self.website_checks[site.key] = site_check
+        
+        # Resident supervisor after the launch
+        self.supervise_check = tk.Checkbutton(main_frame, text=self.t('supervise_companions'),
+                                              variable=self.supervise_companions,
+                                              fg=self.colors['text'], bg=self.colors['bg'],
+                                              selectcolor=self.colors['bg_light'],
+                                              activebackground=self.colors['bg'])
+        self.supervise_check.pack(anchor='w', pady=(15, 0))
         
         # Launch Button
         self.launch_button = tk.Button(main_frame, text=self.t('launch'),
@@ -429,6 +543,11 @@ class PoELauncher:
             self.title_label.config(text=self.t('title'))
         if hasattr(self, 'lang_title'):
             self.lang_title.config(text=self.t('language'))
+        if hasattr(self, 'profile_title'):
+            self.profile_title.config(text=self.t('profile'))
+        if hasattr(self, 'new_profile_btn'):
+            self.new_profile_btn.config(text=self.t('new_profile'))
+            self.delete_profile_btn.config(text=self.t('delete_profile'))
         
         # Update section titles
         if hasattr(self, 'game_version_title'):
@@ -456,18 +575,13 @@ class PoELauncher:
         
         # Update checkbox texts
         if hasattr(self, 'checkboxes'):
-            if 'awakened_trade' in self.checkboxes:
-                self.checkboxes['awakened_trade'].config(text=self.t('awakened_trade'))
-            if 'poe_lurker' in self.checkboxes:
-                self.checkboxes['poe_lurker'].config(text=self.t('poe_lurker'))
-            if 'chaos_recipe' in self.checkboxes:
-                self.checkboxes['chaos_recipe'].config(text=self.t('chaos_recipe'))
+            for label_key, check in self.checkboxes.items():
+                check.config(text=self.t(label_key))
         
         # Update website checkboxes
-        if hasattr(self, 'filterblade_check'):
-            self.filterblade_check.config(text=self.t('filterblade'))
-        if hasattr(self, 'trade_check'):
-            self.trade_check.config(text=self.t('trade_site'))
+        if hasattr(self, 'website_checks'):
+            for site_key, check in self.website_checks.items():
+                check.config(text=self.t(site_key))
         
         # Update launch button
         if hasattr(self, 'launch_button'):
@@ -476,28 +590,22 @@ class PoELauncher:
         # Update auto-detect button
         if hasattr(self, 'auto_detect_btn'):
             self.auto_detect_btn.config(text=self.t('auto_detect'))
+        if hasattr(self, 'profile_detection_check'):
+            self.profile_detection_check.config(text=self.t('detection_timings'))
+        if hasattr(self, 'supervise_check'):
+            self.supervise_check.config(text=self.t('supervise_companions'))
         
         print(f"UI language changed to: {self.language.get()}")
     
-    def browse_steam_path(self):
-        self.browse_file(self.steam_path, "Steam executable (steam.exe)")
-    
-    def browse_standalone_path(self):
-        self.browse_file(self.standalone_path, "Path of Exile executable (PathOfExile.exe)")
-    
-    def browse_awakened_path(self):
-        self.browse_file(self.awakened_path, "Awakened PoE Trade executable")
-    
-    def browse_lurker_path(self):
-        self.browse_file(self.lurker_path, "PoE Lurker executable")
-    
-    def browse_chaos_recipe_path(self):
-        self.browse_file(self.chaos_recipe_path, "Chaos Recipe Enhancer executable")
+    def browse_program(self, key):
+        spec = CATALOG[key]
+        self.browse_file(self.path_vars[key], spec.browse_title)
     
     def browse_file(self, var, title):
         filename = filedialog.askopenfilename(
             title=f"Select {title}",
-            filetypes=[("Executable files", "*.exe"), ("All files", "*.*")]
+            filetypes=[("Executable files", "*.exe"), ("Shortcuts and batch files", "*.lnk *.bat *.cmd"),
+                       ("All files", "*.*")]
         )
         if filename:
             var.set(filename)
@@ -509,348 +617,201 @@ class PoELauncher:
     
     def validate_path(self, label_key, path_var):
         """Validate path and enable/disable corresponding checkbox"""
+        if self.startup_pending or self.applying_profile:
+            return
         path = path_var.get().strip()
+        # Squirrel installs (app-x.y.z folders) are checked at their newest build
+        valid = bool(path and os.path.exists(current_build(path)))
+        self.profiles.remember_validation(label_key, path, valid)
+        self.set_path_state(label_key, valid)
+    
+    def set_path_state(self, label_key, valid):
+        """Enable/disable a program checkbox for a validated path"""
         if label_key in self.checkboxes:
-            if path and os.path.exists(path):
+            if valid:
                 self.checkboxes[label_key].config(state='normal')
             else:
                 self.checkboxes[label_key].config(state='disabled')
                 # Uncheck if path becomes invalid
-                if label_key == 'awakened_trade':
-                    self.start_awakened.set(False)
-                elif label_key == 'poe_lurker':
-                    self.start_lurker.set(False)
-                elif label_key == 'chaos_recipe':
-                    self.start_chaos_recipe.set(False)
+                if label_key in self.start_vars:
+                    self.start_vars[label_key].set(False)
+    
+    def check_paths(self, settings):
+        """Check which companion paths exist (safe to call from a worker thread)"""
+        return self.engine.check_paths(settings)
+    
+    def apply_path_states(self, states):
+        """Apply results of check_paths on the UI thread and finish startup"""
+        self.startup_pending = False
+        for label_key, valid in states.items():
+            self.set_path_state(label_key, valid)
+        if 'interactive' not in self.startup_timings:
+            self.record_startup_timing('interactive')
+        self.startup_validated.set()
+        self.watch_paths()
+    
+    def watch_paths(self):
+        """Hand the current companion paths to the background path watcher"""
+        if self.startup_pending:
+            return
+        if self.path_watcher is None:
+            from poe_core.path_watcher import PathWatcher, default_notifications
+            self.path_watcher = PathWatcher(self.on_watched_path_changed,
+                                            notifications=default_notifications()).start()
+        self.path_watcher.watch({spec.key: self.path_vars[spec.key].get() for spec in CATALOG.companions})
+    
+    def on_watched_path_changed(self, key, path, valid, hint):
+        """A watched executable appeared or disappeared (called on the watcher thread)"""
+        self.ui.call(self.apply_watched_path, key, path, valid, hint)
+    
+    def apply_watched_path(self, key, path, valid, hint):
+        """Update the checkbox of a watched path and hint at a new location"""
+        if self.path_vars[key].get().strip() != path:
+            # Edited since the check; the watcher gets the new path on save
+            return
+        self.profiles.remember_validation(key, path, valid)
+        self.set_path_state(key, valid)
+        if valid or not path:
+            return
+        name = CATALOG[key].display_name
+        if hint:
+            self.show_status(self.t('path_moved').format(name, hint))
+        else:
+            self.show_status(self.t('path_missing').format(name))
     
     def load_settings(self):
         """Load settings from config file"""
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                # Load all settings
-                self.game_version.set(config.get('game_version', 'steam'))
-                self.steam_path.set(config.get('steam_path', self.steam_path.get()))
-                self.standalone_path.set(config.get('standalone_path', self.standalone_path.get()))
-                self.awakened_path.set(config.get('awakened_path', self.awakened_path.get()))
-                self.lurker_path.set(config.get('lurker_path', self.lurker_path.get()))
-                self.chaos_recipe_path.set(config.get('chaos_recipe_path', self.chaos_recipe_path.get()))
-                
-                self.start_awakened.set(config.get('start_awakened', False))
-                self.start_lurker.set(config.get('start_lurker', False))
-                self.start_chaos_recipe.set(config.get('start_chaos_recipe', False))
-                self.open_filterblade.set(config.get('open_filterblade', False))
-                self.open_trade_site.set(config.get('open_trade_site', False))
-                
-                self.language.set(config.get('language', self.language.get()))
-                
-                # Steam PoE path loading removed - no longer needed
-                
-                # Validate all paths after loading
-                self.validate_all_paths()
-                
-        except Exception as e:
-            print(f"Error loading settings: {e}")
+        self.engine.load()
+        self.apply_settings(self.profiles.settings())
+        self.refresh_profiles()
         
         # Always validate paths even if no config file exists
         if hasattr(self, 'checkboxes'):
             self.validate_all_paths()
     
-    def validate_all_paths(self):
-        """Validate all program paths and update checkbox states"""
-        self.validate_path('awakened_trade', self.awakened_path)
-        self.validate_path('poe_lurker', self.lurker_path)
-        self.validate_path('chaos_recipe', self.chaos_recipe_path)
+    def apply_settings(self, settings):
+        """Show a settings dict (config.json layout) in the window"""
+        self.game_version.set(settings.get('game_version', 'steam'))
+        for spec in CATALOG:
+            path_var = self.path_vars[spec.key]
+            path_var.set(settings.get(spec.path_attr, path_var.get()))
+            if spec.start_attr:
+                self.start_vars[spec.key].set(settings.get(spec.start_attr, False))
+        
+        for site in CATALOG.websites:
+            self.website_vars[site.key].set(settings.get(site.start_attr, False))
+        self.supervise_companions.set(settings.get('supervise_companions', False))
+        
+        self.language.set(settings.get('language', self.language.get()))
+        self.steam_ready_timeout = settings.get('steam_ready_timeout', self.steam_ready_timeout)
+        self.steam_ready_signal = settings.get('steam_ready_signal', self.steam_ready_signal)
+        self.steam_ready_port = settings.get('steam_ready_port', self.steam_ready_port)
+        self.launch_history = settings.get('launch_history', self.launch_history)
+        self.detect_in_process = settings.get('detect_in_process', self.detect_in_process)
     
-    def detect_from_registry(self):
-        """Detect installed programs from Windows registry"""
-        detected = {}
-        
-        # Skip registry detection on non-Windows platforms
-        if os.name != 'nt' or winreg is None:
-            return detected
-        registry_roots = [
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Wow6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
-            (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall")
-        ]
-        
-        for hkey, subkey_path in registry_roots:
-            try:
-                with winreg.OpenKey(hkey, subkey_path) as key:
-                    i = 0
-                    while True:
-                        try:
-                            subkey_name = winreg.EnumKey(key, i)
-                            with winreg.OpenKey(key, subkey_name) as subkey:
-                                try:
-                                    display_name = winreg.QueryValueEx(subkey, "DisplayName")[0]
-                                    install_location = ""
-                                    uninstall_string = ""
-                                    
-                                    try:
-                                        install_location = winreg.QueryValueEx(subkey, "InstallLocation")[0]
-                                    except FileNotFoundError:
-                                        pass
-                                    
-                                    try:
-                                        uninstall_string = winreg.QueryValueEx(subkey, "UninstallString")[0]
-                                    except FileNotFoundError:
-                                        pass
-                                    
-                                    # Check for Steam
-                                    if "steam" in display_name.lower():
-                                        if install_location and os.path.exists(os.path.join(install_location, "steam.exe")):
-                                            detected['steam'] = os.path.join(install_location, "steam.exe")
-                                    
-                                    # Check for Path of Exile
-                                    if "path of exile" in display_name.lower():
-                                        if install_location and os.path.exists(os.path.join(install_location, "PathOfExile.exe")):
-                                            detected['poe_standalone'] = os.path.join(install_location, "PathOfExile.exe")
-                                    
-                                    # Check for Awakened PoE Trade
-                                    if "awakened" in display_name.lower() and "poe" in display_name.lower():
-                                        exe_path = self.find_exe_in_location(install_location, "Awakened PoE Trade.exe")
-                                        if exe_path:
-                                            detected['awakened_trade'] = exe_path
-                                    
-                                    # Check for PoE Lurker
-                                    if "poe lurker" in display_name.lower() or "lurker" in display_name.lower():
-                                        exe_path = self.find_exe_in_location(install_location, ["PoeLurker.exe", "Poe Lurker.exe"])
-                                        if exe_path:
-                                            detected['poe_lurker'] = exe_path
-                                    
-                                    # Check for Chaos Recipe Enhancer
-                                    if "chaos" in display_name.lower() and "recipe" in display_name.lower():
-                                        exe_path = self.find_exe_in_location(install_location, "ChaosRecipeEnhancer.exe")
-                                        if exe_path:
-                                            detected['chaos_recipe'] = exe_path
-                                
-                                except FileNotFoundError:
-                                    pass
-                            i += 1
-                        except OSError:
-                            break
-            except OSError:
-                continue
-        
-        return detected
+    def refresh_profiles(self):
+        """Update the profile selector from the store"""
+        self.profile_combo.config(values=self.profiles.names())
+        self.profile.set(self.profiles.active)
     
-    def find_exe_in_location(self, location, exe_names):
-        """Find executable in given location, supports single name or list"""
-        if not location or not os.path.exists(location):
-            return None
-        
-        if isinstance(exe_names, str):
-            exe_names = [exe_names]
+    def switch_profile(self, name, keep_edits=True):
+        """Show another profile, re-validating only paths that differ from its last check"""
+        if keep_edits:
+            # Save edits of the profile we are leaving
+            self.flush_settings()
+        settings = self.profiles.switch(name)
+        
+        self.applying_profile = True
+        try:
+            self.apply_settings(settings)
+        finally:
+            self.applying_profile = False
+        self.refresh_profiles()
+        self.update_ui()
         
-        for exe_name in exe_names:
-            exe_path = os.path.join(location, exe_name)
-            if os.path.exists(exe_path):
-                return exe_path
+        if not self.startup_pending:
+            for spec in CATALOG.companions:
+                path = self.path_vars[spec.key].get().strip()
+                valid = self.profiles.cached_validation(spec.key, path)
+                if valid is None:
+                    self.validate_path(spec.key, self.path_vars[spec.key])
+                else:
+                    self.set_path_state(spec.key, valid)
         
-        return None
+        self.schedule_save()
+        print(f"Switched to profile: {name}")
     
-    def get_all_drives(self):
-        """Get all available drive letters"""
-        drives = []
-        for letter in string.ascii_uppercase:
-            drive = f"{letter}:\\"
-            if os.path.exists(drive):
-                drives.append(drive)
-        return drives
+    def on_profile_selected(self, event=None):
+        name = self.profile.get()
+        if name != self.profiles.active:
+            self.switch_profile(name)
     
-    def detect_from_filesystem(self):
-        """Detect programs using filesystem patterns - only if registry detection failed"""
-        detected = {}
-        
-        # Skip filesystem detection on non-Windows platforms
-        if os.name != 'nt':
-            return detected
-            
-        drives = self.get_all_drives()
-        
-        # Only define search patterns - no hardcoded paths
-        # Only search for programs relevant to current game version
-        current_version = getattr(self, 'game_version', None)
-        selected_version = current_version.get() if current_version else 'steam'
-        
-        search_locations = {
-            'steam': [
-                ('Program Files (x86)', 'Steam', 'steam.exe'),
-                ('Program Files', 'Steam', 'steam.exe'),
-                ('Steam', '', 'steam.exe')
-            ],
-            'awakened_trade': [
-                ('Program Files', 'Awakened PoE Trade', '', 'Awakened PoE Trade.exe'),
-            ],
-            'poe_lurker': [
-                ('Program Files', 'Poe Lurker', '', 'Poe Lurker.exe'),
-                ('Program Files (x86)', 'Poe Lurker', '', 'Poe Lurker.exe')
-            ],
-            'chaos_recipe': [
-                ('Program Files (x86)', 'Chaos Recipe Enhancer', '', 'ChaosRecipeEnhancer.exe'),
-                ('Program Files', 'Chaos Recipe Enhancer', '', 'ChaosRecipeEnhancer.exe'),
-                ('Program Files (x86)', 'ChaosRecipeEnhancer', '', 'ChaosRecipeEnhancer.exe'),
-                ('Program Files', 'ChaosRecipeEnhancer', '', 'ChaosRecipeEnhancer.exe'),
-            ]
-        }
-        
-        # Add version-specific game detection
-        if selected_version == 'standalone':
-            search_locations['poe_standalone'] = [
-                ('Program Files (x86)', 'Grinding Gear Games', 'Path of Exile', 'PathOfExile.exe'),
-                ('Program Files', 'Grinding Gear Games', 'Path of Exile', 'PathOfExile.exe'),
-                ('Games', 'Path of Exile', '', 'PathOfExile.exe')
-            ]
-        
-        # Search each drive for each program
-        for program, locations in search_locations.items():
-            if program in detected:
-                continue
-                
-            for drive in drives:
-                for location_parts in locations:
-                    # Build path using os.path.join for correct separators
-                    path_parts = [drive] + [part for part in location_parts[:-1] if part] + [location_parts[-1]]
-                    full_path = os.path.join(*path_parts)
-                    
-                    if os.path.exists(full_path):
-                        detected[program] = full_path
-                        break
-                        
-                if program in detected:
-                    break
-        
-        # Special handling for AppData programs
+    def new_profile(self):
+        """Create a profile from the current values and switch to it"""
+        name = simpledialog.askstring(self.t('new_profile'), self.t('profile_name_prompt'), parent=self.root)
+        if not name:
+            return
         try:
-            localappdata = os.path.expandvars('%LOCALAPPDATA%')
-            
-            # Awakened PoE Trade in AppData
-            if 'awakened_trade' not in detected:
-                appdata_awakened = os.path.join(localappdata, 'Programs', 'Awakened PoE Trade', 'Awakened PoE Trade.exe')
-                if os.path.exists(appdata_awakened):
-                    detected['awakened_trade'] = appdata_awakened
-            
-            # PoE Lurker with wildcard version folders
-            if 'poe_lurker' not in detected:
-                lurker_base = os.path.join(localappdata, 'PoeLurker')
-                if os.path.exists(lurker_base):
-                    for item in os.listdir(lurker_base):
-                        lurker_path = os.path.join(lurker_base, item, 'PoeLurker.exe')
-                        if os.path.exists(lurker_path):
-                            detected['poe_lurker'] = lurker_path
-                            break
-            
-            # Chaos Recipe Enhancer in AppData
-            if 'chaos_recipe' not in detected:
-                appdata_chaos = os.path.join(localappdata, 'Programs', 'ChaosRecipeEnhancer', 'ChaosRecipeEnhancer.exe')
-                if os.path.exists(appdata_chaos):
-                    detected['chaos_recipe'] = appdata_chaos
-                    
-        except Exception as e:
-            print(f"Error checking AppData locations: {e}")
-        
-        return detected
+            self.flush_settings()
+            name = self.profiles.create(name, self.collect_settings())
+        except ValueError as e:
+            messagebox.showerror(self.t('profile'), str(e))
+            return
+        self.switch_profile(name)
     
-    def detect_steam_games(self, steam_path):
-        """Detect games in Steam libraries"""
-        detected = {}
-        if not steam_path or not os.path.exists(steam_path):
-            return detected
-        
-        steam_dir = os.path.dirname(steam_path)
-        
-        # Check default Steam library
-        default_library = os.path.join(steam_dir, 'steamapps', 'common', 'Path of Exile', 'PathOfExile.exe')
-        if os.path.exists(default_library):
-            detected['poe_steam'] = default_library
-        
-        # Check additional Steam libraries from libraryfolders.vdf
+    def delete_profile(self):
+        """Delete the shown profile and switch to the next one"""
         try:
-            libraryfolders_path = os.path.join(steam_dir, 'steamapps', 'libraryfolders.vdf')
-            if os.path.exists(libraryfolders_path):
-                with open(libraryfolders_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Parse VDF format for library paths
-                import re
-                path_matches = re.findall(r'"path"\s+"([^"]+)"', content)
-                
-                for lib_path in path_matches:
-                    poe_path = os.path.join(lib_path, 'steamapps', 'common', 'Path of Exile', 'PathOfExile.exe')
-                    if os.path.exists(poe_path):
-                        detected['poe_steam'] = poe_path
-                        break
-        except Exception as e:
-            print(f"Error parsing Steam library folders: {e}")
-        
-        return detected
+            self.profiles.delete(self.profiles.active)
+        except ValueError as e:
+            messagebox.showerror(self.t('profile'), str(e))
+            return
+        # The deleted profile's values must not be saved into its successor
+        if self.save_job is not None:
+            self.root.after_cancel(self.save_job)
+            self.save_job = None
+        self.switch_profile(self.profiles.active, keep_edits=False)
     
-    def auto_detect_installations(self):
-        """Main auto-detection method combining all detection strategies"""
-        print("Starting auto-detection of installations...")
-        detected = {}
-        
-        # 1. Registry detection (fastest)
-        try:
-            registry_detected = self.detect_from_registry()
-            detected.update(registry_detected)
-            print(f"Registry detection found: {list(registry_detected.keys())}")
-        except Exception as e:
-            print(f"Registry detection failed: {e}")
-        
-        # 2. Filesystem pattern detection
-        try:
-            filesystem_detected = self.detect_from_filesystem()
-            # Only add if not already detected
-            for key, value in filesystem_detected.items():
-                if key not in detected:
-                    detected[key] = value
-            print(f"Filesystem detection found: {list(filesystem_detected.keys())}")
-        except Exception as e:
-            print(f"Filesystem detection failed: {e}")
-        
-        # 3. Steam games detection (if Steam was found)
-        steam_path = detected.get('steam')
-        if steam_path:
-            try:
-                steam_games = self.detect_steam_games(steam_path)
-                for key, value in steam_games.items():
-                    if key not in detected:
-                        detected[key] = value
-                print(f"Steam games detection found: {list(steam_games.keys())}")
-            except Exception as e:
-                print(f"Steam games detection failed: {e}")
-        
-        # Apply detected paths to UI
-        self.apply_detected_paths(detected)
-        
-        return detected
+    def validate_all_paths(self):
+        """Validate all program paths and update checkbox states"""
+        for spec in CATALOG.companions:
+            self.validate_path(spec.key, self.path_vars[spec.key])
     
-    def apply_detected_paths(self, detected):
-        """Apply detected paths to the UI variables"""
-        # Steam executable - only set if no Steam path currently set
-        if 'steam' in detected and not self.steam_path.get():
-            self.steam_path.set(self.normalize_path(detected['steam']))
-        
-        # Standalone PoE path - only set if no standalone path currently set
-        if 'poe_standalone' in detected and not self.standalone_path.get():
-            self.standalone_path.set(self.normalize_path(detected['poe_standalone']))
-        
-        # Steam PoE path detection removed - no longer needed
-        
-        # Companion programs - only set if paths are currently empty
-        if 'awakened_trade' in detected and not self.awakened_path.get():
-            self.awakened_path.set(self.normalize_path(detected['awakened_trade']))
-        
-        if 'poe_lurker' in detected and not self.lurker_path.get():
-            self.lurker_path.set(self.normalize_path(detected['poe_lurker']))
+    def start_detection(self, game_version, force=False, timings=False, **callbacks):
+        """Start a detection run (in a worker process unless disabled in config.json)"""
+        from poe_core.detection_worker import DetectionRun, DetectionWorker
+        
+        worker = None
+        if self.detect_in_process:
+            with self.detection_worker_lock:
+                if self.detection_worker is None:
+                    self.detection_worker = DetectionWorker(self.config_file)
+                worker = self.detection_worker
+        run = DetectionRun(self.engine, game_version, force, timings,
+                           in_process=self.detect_in_process, worker=worker, **callbacks)
+        run.start()
+        # Keep unfinished runs so closing the window can cancel them
+        with self.detection_worker_lock:
+            self.detection_runs = [other for other in self.detection_runs if other.running]
+            self.detection_runs.append(run)
+        return run
+    
+    def auto_detect_installations(self, game_version):
+        """Startup detection: fill in empty paths once the run is done"""
+        return self.start_detection(
+            game_version,
+            on_done=lambda report: self.ui.call(self.apply_detected_paths, report['detected']),
+            on_error=lambda message: print(f"Auto-detection error: {message}"))
+    
+    def apply_detected_paths(self, detected, overwrite=False):
+        """Apply detected paths to the UI variables
         
-        if 'chaos_recipe' in detected and not self.chaos_recipe_path.get():
-            self.chaos_recipe_path.set(self.normalize_path(detected['chaos_recipe']))
+        Only empty paths are set unless overwrite is true (manual detection).
+        """
+        settings = self.collect_settings()
+        detected = {key: normalize_path(path) for key, path in detected.items()}
+        for key in merge_detected(settings, detected, overwrite):
+            self.path_vars[key].set(settings[CATALOG[key].path_attr])
         
         # Validate all paths after setting them
         self.validate_all_paths()
@@ -858,196 +819,76 @@ class PoELauncher:
         print(f"Applied detected paths: {len(detected)} programs found")
     
     def auto_detect_threaded(self):
-        """Run auto-detection in a separate thread to avoid blocking UI"""
+        """Run manual detection in the background; found paths are shown as they come in"""
         self.show_status("Detecting installed programs...")
-        thread = threading.Thread(target=self.run_auto_detect_manual)
-        thread.daemon = True
-        thread.start()
+        self.start_detection(
+            self.game_version.get(), force=True, timings=self.profile_detection.get(),
+            on_progress=self.on_detection_progress,
+            on_done=self.on_manual_detection_done,
+            on_error=self.on_detection_failed,
+            on_cancelled=lambda: self.show_status(""))
     
-    def run_auto_detect_manual(self):
-        """Run manual auto-detection and update status - forces re-detection"""
-        try:
-            detected = self.auto_detect_installations_force()
-            count = len(detected)
-            if count > 0:
-                self.show_status(f"Auto-detection complete: {count} programs found")
-            else:
-                self.show_status("Auto-detection complete: No programs found")
-            
-            # Clear status after a few seconds
-            def clear_status():
-                time.sleep(3)
-                self.show_status("")
-            
-            clear_thread = threading.Thread(target=clear_status)
-            clear_thread.daemon = True
-            clear_thread.start()
-            
-        except Exception as e:
-            self.show_status(f"Auto-detection failed: {str(e)}")
-            print(f"Auto-detection error: {e}")
+    def on_detection_progress(self, name, result, detected):
+        """Partial results after each strategy (called on the detection reader thread)"""
+        self.show_status(f"Detecting installed programs... {name}: {len(result['found'])} found")
+        if detected:
+            # Manual detection overwrites existing paths
+            self.ui.call(self.apply_detected_paths, detected, True)
     
-    def auto_detect_installations_force(self):
-        """Force auto-detection regardless of current paths"""
-        print("Starting forced auto-detection of installations...")
-        detected = {}
-        detection_results = {}
-        
-        # 1. Registry detection (fastest)
-        try:
-            registry_detected = self.detect_from_registry()
-            detected.update(registry_detected)
-            detection_results['registry'] = {'found': list(registry_detected.keys()), 'searched': 'Windows Registry'}
-            print(f"Registry detection found: {list(registry_detected.keys())}")
-        except Exception as e:
-            detection_results['registry'] = {'found': [], 'error': str(e)}
-            print(f"Registry detection failed: {e}")
-        
-        # 2. Filesystem pattern detection
-        try:
-            filesystem_detected = self.detect_from_filesystem()
-            # Only add if not already detected
-            for key, value in filesystem_detected.items():
-                if key not in detected:
-                    detected[key] = value
-            detection_results['filesystem'] = {'found': list(filesystem_detected.keys()), 'searched': 'Program Files'}
-            print(f"Filesystem detection found: {list(filesystem_detected.keys())}")
-        except Exception as e:
-            detection_results['filesystem'] = {'found': [], 'error': str(e)}
-            print(f"Filesystem detection failed: {e}")
-        
-        # 3. Enhanced detection for missing programs
-        try:
-            enhanced_detected = self.detect_enhanced_methods()
-            for key, value in enhanced_detected.items():
-                if key not in detected:
-                    detected[key] = value
-            detection_results['enhanced'] = {'found': list(enhanced_detected.keys()), 'searched': 'Desktop, Downloads, Portable Apps'}
-            print(f"Enhanced detection found: {list(enhanced_detected.keys())}")
-        except Exception as e:
-            detection_results['enhanced'] = {'found': [], 'error': str(e)}
-            print(f"Enhanced detection failed: {e}")
-        
-        # Steam game detection removed - only need steam.exe for Steam version
-        
-        # Apply detected paths to UI (force mode allows overwriting)
-        self.apply_detected_paths_force(detected)
+    def on_manual_detection_done(self, report):
+        """Show the final results of manual detection"""
+        self.ui.call(self.apply_detected_paths, report['detected'], True)
+        self.ui.call(self.show_detection_results, report)
+        if 'timings' in report:
+            self.ui.call(self.show_detection_timings, report['timings'])
+        
+        count = len(report['detected'])
+        if count > 0:
+            self.show_status(f"Auto-detection complete: {count} programs found")
+        else:
+            self.show_status("Auto-detection complete: No programs found")
         
-        # Show detailed results to user
-        self.show_detection_results(detected, detection_results)
+        # Clear status after a few seconds
+        def clear_status():
+            time.sleep(3)
+            self.show_status("")
         
-        return detected
+        clear_thread = threading.Thread(target=clear_status)
+        clear_thread.daemon = True
+        clear_thread.start()
     
-    def detect_enhanced_methods(self):
-        """Enhanced detection methods for hard-to-find programs"""
-        detected = {}
-        
-        if os.name != 'nt':
-            return detected
-        
-        # 1. Desktop and Downloads folder detection
-        try:
-            search_folders = [
-                os.path.expanduser('~\\Desktop'),
-                os.path.expanduser('~\\Downloads'),
-                os.path.expanduser('~\\Documents'),
-                os.path.expandvars('%PUBLIC%\\Desktop')
-            ]
-            
-            for folder in search_folders:
-                if os.path.exists(folder):
-                    # Search for executables and shortcuts
-                    for item in os.listdir(folder):
-                        item_path = os.path.join(folder, item)
-                        
-                        # Direct executable files
-                        if item.lower().endswith('.exe'):
-                            if 'chaosrecipe' in item.lower() and 'chaos_recipe' not in detected:
-                                detected['chaos_recipe'] = item_path
-                                print(f"Found CRE in {folder}: {item_path}")
-                            elif 'awakened' in item.lower() and 'poe' in item.lower() and 'awakened_trade' not in detected:
-                                detected['awakened_trade'] = item_path
-                            elif 'lurker' in item.lower() and 'poe_lurker' not in detected:
-                                detected['poe_lurker'] = item_path
-                        
-                        # Search inside subfolders (one level deep)
-                        elif os.path.isdir(item_path):
-                            try:
-                                for subitem in os.listdir(item_path):
-                                    if subitem.lower().endswith('.exe'):
-                                        subitem_path = os.path.join(item_path, subitem)
-                                        if 'chaosrecipe' in subitem.lower() and 'chaos_recipe' not in detected:
-                                            detected['chaos_recipe'] = subitem_path
-                                            print(f"Found CRE in subfolder: {subitem_path}")
-                            except (OSError, PermissionError):
-                                continue
-                                
-        except Exception as e:
-            print(f"Folder detection failed: {e}")
-        
-        # 2. Alternative executable names for CRE
-        if 'chaos_recipe' not in detected:
-            alternative_names = [
-                'ChaosRecipeEnhancer.exe',
-                'Chaos Recipe Enhancer.exe', 
-                'CRE.exe',
-                'chaos-recipe-enhancer.exe'
-            ]
-            
-            drives = self.get_all_drives()
-            for drive in drives:
-                for alt_name in alternative_names:
-                    # Check common portable app locations
-                    portable_locations = [
-                        'PortableApps',
-                        'Tools',
-                        'Games',
-                        'Utilities'
-                    ]
-                    
-                    for location in portable_locations:
-                        search_path = os.path.join(drive, location, alt_name)
-                        if os.path.exists(search_path):
-                            detected['chaos_recipe'] = search_path
-                            print(f"Found CRE in portable location: {search_path}")
-                            break
-                    
-                    if 'chaos_recipe' in detected:
-                        break
-                if 'chaos_recipe' in detected:
-                    break
-        
-        return detected
+    def on_detection_failed(self, message):
+        self.show_status(f"Auto-detection failed: {message}")
+        print(f"Auto-detection error: {message}")
     
-    def show_detection_results(self, detected, detection_results):
+    def show_detection_timings(self, report):
+        """Panel with the detection timing report, slowest drives and folders first"""
+        from poe_core.detection_profile import format_report
+        
+        window = tk.Toplevel(self.root)
+        window.title(self.t('detection_timings'))
+        window.configure(bg=self.colors['bg'])
+        
+        text = tk.Text(window, width=110, height=32, wrap='none',
+                       bg=self.colors['bg_light'], fg=self.colors['text'],
+                       font=('Consolas', 9))
+        scrollbar = tk.Scrollbar(window, command=text.yview)
+        text.config(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side='right', fill='y')
+        text.pack(fill='both', expand=True)
+        text.insert('1.0', format_report(report, roots=25, probes=25))
+        text.config(state='disabled')
+    
+    def show_detection_results(self, report):
         """Show detailed detection results to user"""
-        total_found = len(detected)
-        
-        # Create detailed message - show only relevant program count
-        relevant_count = len([k for k in detected.keys() if k in {'steam', 'poe_standalone', 'awakened_trade', 'poe_lurker', 'chaos_recipe'}])
-        message_lines = [f"Auto-detection completed: {relevant_count} programs found\n"]
-        
-        # Get current game version to filter relevant programs
-        current_version = getattr(self, 'game_version', None)
-        selected_version = current_version.get() if current_version else 'steam'
-        
-        # Only show programs relevant to selected version
-        if selected_version == 'steam':
-            relevant_programs = {'steam', 'awakened_trade', 'poe_lurker', 'chaos_recipe'}
-            program_names = {
-                'steam': 'Steam',
-                'awakened_trade': 'Awakened PoE Trade',
-                'poe_lurker': 'PoE Lurker',
-                'chaos_recipe': 'Chaos Recipe Enhancer'
-            }
-        else:  # standalone
-            relevant_programs = {'poe_standalone', 'awakened_trade', 'poe_lurker', 'chaos_recipe'}
-            program_names = {
-                'poe_standalone': 'Path of Exile (Standalone)',
-                'awakened_trade': 'Awakened PoE Trade',
-                'poe_lurker': 'PoE Lurker',
-                'chaos_recipe': 'Chaos Recipe Enhancer'
-            }
+        detected = report['detected']
+        detection_results = report['strategies']
+        message_lines = [f"Auto-detection completed: {len(detected)} programs found\n"]
+        
+        # Only show programs relevant to the version detection ran for
+        relevant_specs = CATALOG.for_version(report['game_version'])
+        relevant_programs = {spec.key for spec in relevant_specs}
+        program_names = {spec.key: spec.display_name for spec in relevant_specs}
         
         # Filter detected programs to only show relevant ones
         relevant_detected = {k: v for k, v in detected.items() if k in relevant_programs}
@@ -1084,228 +925,155 @@ class PoELauncher:
                 message_lines.append(f"  • {result.get('searched', method)}: Failed")
             else:
                 found_count = len(result.get('found', []))
-                message_lines.append(f"  • {result.get('searched', method)}: {found_count} found")
+                message_lines.append(f"  • {result.get('searched', method)}: {found_count} found "
+                                     f"({result.get('elapsed_ms', 0):.0f} ms)")
         
         detailed_message = "\n".join(message_lines)
         
         # Show in dialog
         messagebox.showinfo("Auto-Detection Results", detailed_message)
     
-    def normalize_path(self, path):
-        """Normalize path to use consistent Windows backslashes"""
-        if not path:
-            return path
-        # Convert forward slashes to backslashes and normalize
-        return os.path.normpath(path.replace('/', '\\'))
-    
-    def apply_detected_paths_force(self, detected):
-        """Apply detected paths to the UI variables - force mode overwrites existing"""
-        # Steam executable
-        if 'steam' in detected:
-            self.steam_path.set(self.normalize_path(detected['steam']))
-        
-        # Standalone PoE path
-        if 'poe_standalone' in detected:
-            self.standalone_path.set(self.normalize_path(detected['poe_standalone']))
-        
-        # Steam PoE path detection removed - no longer needed
-        
-        # Companion programs
-        if 'awakened_trade' in detected:
-            self.awakened_path.set(self.normalize_path(detected['awakened_trade']))
-        
-        if 'poe_lurker' in detected:
-            self.lurker_path.set(self.normalize_path(detected['poe_lurker']))
-        
-        if 'chaos_recipe' in detected:
-            self.chaos_recipe_path.set(self.normalize_path(detected['chaos_recipe']))
-        
-        # Validate all paths after setting them
-        self.validate_all_paths()
-        
-        print(f"Applied detected paths (force): {len(detected)} programs found")
-    
-    def auto_detect_on_startup(self):
+    def auto_detect_on_startup(self, settings):
         """Run auto-detection on startup only if paths are missing"""
-        # Check if we need auto-detection (if main paths are empty)
-        need_detection = (
-            not self.steam_path.get() or 
-            not self.standalone_path.get() or
-            not self.awakened_path.get() or
-            not self.lurker_path.get() or
-            not self.chaos_recipe_path.get()
-        )
-        
-        if need_detection:
-            print("Running auto-detection on startup...")
-            # Run detection in thread to avoid blocking UI startup
-            thread = threading.Thread(target=self.auto_detect_installations)
-            thread.daemon = True
-            thread.start()
-        else:
+        if not missing_paths(settings):
             print("Skipping auto-detection: all paths already configured")
+            return
+        
+        # Re-validate cached results first - one stat per cached path
+        hits, stale = self.engine.cached_detection(settings)
+        if hits:
+            print(f"Using cached detection results: {list(hits.keys())}")
+            self.ui.call(self.apply_detected_paths, hits)
+        
+        if stale:
+            print(f"Running auto-detection on startup (stale: {stale})...")
+            # Runs in the background and fills in paths when it is done
+            self.auto_detect_installations(settings['game_version'])
+        else:
+            print("Skipping auto-detection: detection cache is up to date")
     
-    def save_settings(self):
-        """Save settings to config file"""
+    def collect_settings(self):
+        """Current UI state as a plain settings dict (config.json layout)"""
+        config = {'game_version': self.game_version.get()}
+        for spec in CATALOG:
+            config[spec.path_attr] = self.path_vars[spec.key].get()
+        for spec in CATALOG:
+            if spec.start_attr:
+                config[spec.start_attr] = self.start_vars[spec.key].get()
+        for site in CATALOG.websites:
+            config[site.start_attr] = self.website_vars[site.key].get()
+        config['supervise_companions'] = self.supervise_companions.get()
+        config['language'] = self.language.get()
+        config['steam_ready_timeout'] = self.steam_ready_timeout
+        config['steam_ready_signal'] = self.steam_ready_signal
+        config['steam_ready_port'] = self.steam_ready_port
+        config['launch_history'] = self.launch_history
+        config['detect_in_process'] = self.detect_in_process
+        return config
+    
+    def save_settings(self, settings=None):
+        """Save settings to config file (skipped if nothing changed)"""
         try:
-            config = {
-                'game_version': self.game_version.get(),
-                'steam_path': self.steam_path.get(),
-                'standalone_path': self.standalone_path.get(),
-                'awakened_path': self.awakened_path.get(),
-                'lurker_path': self.lurker_path.get(),
-                'chaos_recipe_path': self.chaos_recipe_path.get(),
-                'start_awakened': self.start_awakened.get(),
-                'start_lurker': self.start_lurker.get(),
-                'start_chaos_recipe': self.start_chaos_recipe.get(),
-                'open_filterblade': self.open_filterblade.get(),
-                'open_trade_site': self.open_trade_site.get(),
-                'language': self.language.get()
-            }
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-            
-            print(f"Settings saved to: {self.config_file}")
+            if self.engine.save(settings or self.collect_settings()):
+                print(f"Settings saved to: {self.config_file}")
                 
         except Exception as e:
             print(f"Error saving settings: {e}")
     
-    def is_process_running(self, process_name):
-        """Check if a process is running"""
-        try:
-            for proc in psutil.process_iter(['name']):
-                if proc.info['name'] and proc.info['name'].lower() == process_name.lower():
-                    return True
-        except:
-            pass
-        return False
+    def watch_settings(self):
+        """Save edits shortly after they are made"""
+        variables = [self.game_version, self.language, self.supervise_companions]
+        variables += list(self.path_vars.values())
+        variables += list(self.start_vars.values())
+        variables += list(self.website_vars.values())
+        for var in variables:
+            var.trace('w', lambda *args: self.schedule_save())
     
-    def run_program(self, path):
-        """Run a program and return success status"""
-        try:
-            if os.path.exists(path):
-                # Set working directory to the program's directory to avoid path issues
-                program_dir = os.path.dirname(path)
-                subprocess.Popen([path], cwd=program_dir, shell=True)
-                return True
-        except Exception as e:
-            print(f"Error running {path}: {e}")
-        return False
+    def schedule_save(self):
+        """Debounce saves: restart the timer on every change"""
+        if self.save_job is not None:
+            self.root.after_cancel(self.save_job)
+        self.save_job = self.root.after(SETTINGS_SAVE_DELAY, self.flush_settings)
     
-    def launch_steam_game(self, steam_path, app_id):
-        """Launch Steam game with specific app ID"""
-        try:
-            # Use Steam URL protocol to avoid security warnings
-            steam_url = f"steam://rungameid/{app_id}"
-            webbrowser.open(steam_url)
-            return True
-        except Exception as e:
-            print(f"Error launching Steam game: {e}")
-            # Fallback to old method if URL protocol fails
-            try:
-                subprocess.Popen([steam_path, f"-applaunch", app_id], shell=True)
-                return True
-            except:
-                return False
+    def flush_settings(self):
+        """Write a pending save now"""
+        if self.save_job is not None:
+            self.root.after_cancel(self.save_job)
+            self.save_job = None
+        self.save_settings()
+        self.watch_paths()
+    
+    def on_close(self):
+        """Keep unsaved edits when the window is closed"""
+        self.flush_settings()
+        with self.detection_worker_lock:
+            runs = list(self.detection_runs)
+            worker = self.detection_worker
+        for run in runs:
+            run.cancel()
+        if worker is not None:
+            worker.stop()
+        self.engine.stop_supervising()
+        if self.path_watcher is not None:
+            self.path_watcher.stop()
+        self.ui.stop()
+        self.root.destroy()
     
     def show_status(self, message):
-        """Update status label"""
-        self.status_label.config(text=message)
-        self.root.update()
+        """Update status label (safe to call from any thread)"""
+        self.ui.set_status(message)
     
     def launch_threaded(self):
         """Launch in separate thread to avoid blocking UI"""
         self.launch_button.config(state='disabled')
-        thread = threading.Thread(target=self.launch)
+        from poe_core.tracing import Tracer
+        
+        # The launch timeline starts at the click
+        tracer = Tracer()
+        # Read the Tk variables here, on the UI thread
+        with tracer.span("save_settings"):
+            self.flush_settings()
+            settings = self.collect_settings()
+        thread = threading.Thread(target=self.launch, args=(settings, tracer, self.profiles.active))
         thread.daemon = True
         thread.start()
     
-    def launch(self):
-        """Launch all selected programs and websites"""
-        self.save_settings()
-        self.show_status(self.t('launching'))
-        
-        errors = []
-        launched = []
-        
-        # Launch the game
-        version = self.game_version.get()
-        
-        if version == 'steam':
-            steam_path = self.steam_path.get()
-            
-            if steam_path and os.path.exists(steam_path):
-                # Check if Steam is running
-                if not self.is_process_running("steam.exe"):
-                    self.run_program(steam_path)
-                    self.show_status(self.t('steam_starting'))
-                    time.sleep(5)  # Wait for Steam to start
-                
-                if self.launch_steam_game(steam_path, "238960"):
-                    launched.append("Path of Exile (Steam)")
-            else:
-                errors.append(self.t('file_not_found').format("Steam", steam_path))
-        else:
-            standalone_path = self.standalone_path.get()
-            if self.run_program(standalone_path):
-                launched.append("Path of Exile (Standalone)")
-            else:
-                errors.append(self.t('file_not_found').format("Path of Exile", standalone_path))
-        
-        time.sleep(1)  # Small delay between launches
-        
-        # Launch companion programs
-        if self.start_awakened.get():
-            awakened_path = self.awakened_path.get()
-            if not self.is_process_running("Awakened PoE Trade.exe"):
-                if self.run_program(awakened_path):
-                    launched.append("Awakened PoE Trade")
-                else:
-                    errors.append(self.t('file_not_found').format("Awakened PoE Trade", awakened_path))
-        
-        if self.start_lurker.get():
-            lurker_path = self.lurker_path.get()
-            if not self.is_process_running("Poe Lurker.exe"):
-                if self.run_program(lurker_path):
-                    launched.append("PoE Lurker")
-                else:
-                    errors.append(self.t('file_not_found').format("PoE Lurker", lurker_path))
-        
-        if self.start_chaos_recipe.get():
-            chaos_path = self.chaos_recipe_path.get()
-            if not self.is_process_running("ChaosRecipeEnhancer.exe"):
-                if self.run_program(chaos_path):
-                    launched.append("Chaos Recipe Enhancer")
-                else:
-                    errors.append(self.t('file_not_found').format("Chaos Recipe Enhancer", chaos_path))
-        
-        # Open websites
-        if self.open_filterblade.get():
-            webbrowser.open("https://www.filterblade.xyz")
-            launched.append("FilterBlade")
-        
-        if self.open_trade_site.get():
-            webbrowser.open("https://www.pathofexile.com/trade")
-            launched.append("Trade Site")
+    def launch(self, settings, tracer=None, profile=None):
+        """Launch all selected programs and websites (on the launch thread)"""
+        # self.t reads the language StringVar; only plain data off the UI thread
+        t = translator(settings['language'])
+        report = self.engine.launch(settings, translate=t, status=self.show_status,
+                                    tracer=tracer, profile=profile)
+        errors = report.errors
+        launched = report.launched
         
         # Show results
         if errors:
-            error_msg = self.t('errors_occurred').format(", ".join(errors))
+            error_msg = t('errors_occurred').format(", ".join(errors))
             self.show_status(error_msg)
             if launched:
                 time.sleep(3)
-                success_msg = self.t('launched_successfully').format(", ".join(launched))
-                self.show_status(success_msg + self.t('closing_in').format(3))
+                success_msg = t('launched_successfully').format(", ".join(launched))
+                self.show_status(success_msg + t('closing_in').format(3))
                 time.sleep(3)
-                self.root.quit()
+                self.finish_launch(settings, report, t)
         elif launched:
-            success_msg = self.t('launched_successfully').format(", ".join(launched))
+            success_msg = t('launched_successfully').format(", ".join(launched))
             self.show_status(success_msg)
             time.sleep(2)
-            self.root.quit()
+            self.finish_launch(settings, report, t)
         
-        self.launch_button.config(state='normal')
+        self.ui.call(lambda: self.launch_button.config(state='normal'))
+    
+    def finish_launch(self, settings, report, t):
+        """Quit after a launch, or stay minimized and supervise the companions it started"""
+        if settings.get('supervise_companions') and report.started:
+            self.show_status(t('supervising'))
+            self.ui.call(self.root.iconify)
+            # Blocks this launch thread until the game exits; closing the
+            # window stops it
+            self.engine.supervise(settings, report, status=self.show_status)
+        self.ui.call(self.root.quit)
     
     def run(self):
         """Start the application"""
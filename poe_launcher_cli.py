@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""Console entry point, built as PoE-Launcher-CLI.exe
+
+PoE-Launcher.exe is built --windowed and has no console, so nothing it
+prints (e.g. --detect --json) reaches the terminal. This build is a
+console program with the same arguments as poe_core.cli.
+"""
+import sys
+
+if __name__ == "__main__":
+    if getattr(sys, 'frozen', False):
+        # Detection worker processes re-run the executable
+        import multiprocessing
+        multiprocessing.freeze_support()
+    from poe_core.cli import main
+    sys.exit(main())
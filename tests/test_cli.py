@@ -0,0 +1,24 @@
+"""Headless command line entry point"""
+import json
+import sys
+
+import pytest
+
+from poe_core import cli
+
+
+@pytest.mark.parametrize('as_json', [False, True])
+def test_main_without_stdout_prints_nothing(tmp_path, monkeypatch, as_json):
+    # The windowed executable runs with sys.stdout (and sys.stderr) set to None
+    monkeypatch.setattr(sys, 'stdout', None)
+    monkeypatch.setattr(sys, 'stderr', None)
+    argv = ['--history', '--config', str(tmp_path / 'config.json')]
+    if as_json:
+        argv.append('--json')
+    assert cli.main(argv) == cli.EXIT_OK
+
+
+def test_json_report_goes_to_stdout(tmp_path, capsys):
+    assert cli.main(['--history', '--json', '--config', str(tmp_path / 'config.json')]) == cli.EXIT_OK
+    report = json.loads(capsys.readouterr().out)
+    assert report['ok'] and report['launches'] == []
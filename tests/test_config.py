@@ -0,0 +1,53 @@
+"""Atomic config writes"""
+import os
+import stat
+import subprocess
+import sys
+
+import pytest
+
+from poe_core.config import umask, write_atomic
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+posix_only = pytest.mark.skipif(os.name == 'nt', reason="POSIX permission bits")
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_write_atomic_replaces_the_content(tmp_path):
+    path = str(tmp_path / 'config.json')
+    write_atomic(path, '{"a": 1}')
+    write_atomic(path, '{"a": 2}')
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == '{"a": 2}'
+    assert os.listdir(tmp_path) == ['config.json']
+
+
+@posix_only
+def test_new_file_gets_the_umask_default(tmp_path):
+    path = str(tmp_path / 'config.json')
+    write_atomic(path, '{}')
+    assert mode(path) == 0o666 & ~umask()
+
+
+@posix_only
+def test_existing_file_keeps_its_mode(tmp_path):
+    path = str(tmp_path / 'config.json')
+    write_atomic(path, '{}')
+    os.chmod(path, 0o640)
+    write_atomic(path, '{"a": 1}')
+    assert mode(path) == 0o640
+
+
+@posix_only
+def test_umask_is_read_on_first_write(tmp_path):
+    code = ("import os, sys; os.umask(0o027); from poe_core import config; "
+            "assert config._umask is None; "
+            "config.write_atomic(sys.argv[1], '{}'); "
+            "assert config._umask == 0o027 and os.umask(0o027) == 0o027")
+    path = str(tmp_path / 'config.json')
+    subprocess.run([sys.executable, '-c', code, path], check=True, cwd=ROOT)
+    assert mode(path) == 0o640
@@ -0,0 +1,98 @@
+"""DriveProber against virtual drives (benchmarks.fakes.FakeFilesystem)"""
+import ntpath
+import time
+
+from benchmarks.fakes import FakeFilesystem
+from poe_core.drives import DriveProber, windows_drive_roots
+
+WANTED = {
+    'steam': ['Steam\\steam.exe', 'Program Files (x86)\\Steam\\steam.exe'],
+    'cre': ['Tools\\ChaosRecipeEnhancer.exe'],
+}
+
+
+class RecordingFilesystem(FakeFilesystem):
+    """FakeFilesystem that remembers which drives were probed"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.probed = []
+
+    def exists(self, path):
+        with self.lock:
+            self.probed.append(ntpath.splitdrive(path)[0].upper())
+        return super().exists(path)
+
+
+def normalized(found):
+    """Found paths as Windows paths (os.path.join uses / on Linux)"""
+    return {key: ntpath.normpath(path) for key, path in found.items()}
+
+
+def make_prober(fs, drive_timeout=1.0):
+    return DriveProber(windows_drive_roots(), exists=fs.exists, drive_timeout=drive_timeout)
+
+
+def test_finds_programs_on_the_earliest_drive_and_pattern():
+    fs = FakeFilesystem([
+        'D:\\Steam\\steam.exe',
+        'C:\\Program Files (x86)\\Steam\\steam.exe',
+        'E:\\Tools\\ChaosRecipeEnhancer.exe',
+    ])
+    found = make_prober(fs).find(WANTED)
+    assert normalized(found) == {
+        'steam': 'C:\\Program Files (x86)\\Steam\\steam.exe',
+        'cre': 'E:\\Tools\\ChaosRecipeEnhancer.exe',
+    }
+
+
+def test_available_roots_in_drive_order():
+    fs = FakeFilesystem(['E:\\x', 'C:\\y'])
+    assert make_prober(fs).available_roots() == ['C:\\', 'E:\\']
+
+
+def test_slow_drive_misses_its_deadline_without_delaying_the_others():
+    fs = FakeFilesystem(['C:\\Steam\\steam.exe', 'E:\\Tools\\ChaosRecipeEnhancer.exe'],
+                        latency={'E:\\': 0.5})
+    prober = make_prober(fs, drive_timeout=0.1)
+    start = time.monotonic()
+    found = prober.find(WANTED)
+    assert time.monotonic() - start < 0.4
+    assert normalized(found) == {'steam': 'C:\\Steam\\steam.exe'}
+    assert 'E:\\' in prober.blacklist
+
+
+def test_blacklisted_drive_is_not_probed_again():
+    fs = RecordingFilesystem(['C:\\Steam\\steam.exe'], latency={'E:\\': 0.3})
+    prober = make_prober(fs, drive_timeout=0.05)
+    prober.find(WANTED)
+    assert prober.blacklist == {'E:\\'}
+
+    fs.probed.clear()
+    prober.find(WANTED)
+    assert 'E:' not in fs.probed
+    assert 'C:' in fs.probed
+
+
+def test_results_of_a_drive_that_timed_out_are_dropped():
+    # E: answers the first program in time, then misses the deadline on the next one
+    fs = FakeFilesystem(['E:\\Steam\\steam.exe', 'E:\\Tools\\ChaosRecipeEnhancer.exe'],
+                        latency={'E:\\': 0.08})
+    prober = make_prober(fs, drive_timeout=0.2)
+    assert prober.find(WANTED) == {}
+    # Late writes of the still running probe thread do not leak into a later run
+    time.sleep(0.3)
+    assert prober.find(WANTED) == {}
+
+
+def test_stops_early_once_no_pending_drive_can_win():
+    fs = RecordingFilesystem(['C:\\Steam\\steam.exe', 'C:\\Tools\\ChaosRecipeEnhancer.exe'],
+                             latency={'D:\\': 0.5})
+    prober = make_prober(fs, drive_timeout=2.0)
+    start = time.monotonic()
+    found = prober.find(WANTED)
+    assert time.monotonic() - start < 0.4
+    assert normalized(found) == {'steam': 'C:\\Steam\\steam.exe', 'cre': 'C:\\Tools\\ChaosRecipeEnhancer.exe'}
+    # D: is still busy with its root probe and never got to the programs
+    assert fs.probed.count('D:') == 1
+    assert 'D:\\' not in prober.blacklist
@@ -0,0 +1,43 @@
+"""Engine: detection cache on startup"""
+from poe_core.detection import Detector
+from poe_core.engine import Engine, missing_paths
+
+
+class CountingDetector(Detector):
+    """Detector that finds nothing without touching the disk, counting its runs"""
+
+    runs = 0
+
+    def auto_detect(self, game_version='steam', profiler=None, progress=None, cancel=None):
+        CountingDetector.runs += 1
+        strategies = [('registry', 'Uninstall keys', lambda detected: {})]
+        return self.run_strategies(strategies, searched_keys=self.searched_keys(game_version))
+
+
+def startup(config_file):
+    """What the GUI does on startup: detect only what the cache cannot answer"""
+    engine = Engine(config_file)
+    engine.detector = CountingDetector(detection_cache=engine.detection_cache)
+    engine.load()
+    settings = engine.settings()
+    hits, stale = engine.cached_detection(settings)
+    if stale:
+        engine.detect(settings['game_version'])
+    return hits, stale
+
+
+def test_missing_paths_follow_the_game_version():
+    steam = missing_paths({'game_version': 'steam'})
+    standalone = missing_paths({'game_version': 'standalone'})
+    assert 'steam' in steam and 'poe_standalone' not in steam
+    assert 'poe_standalone' in standalone and 'steam' not in standalone
+
+
+def test_second_startup_does_not_detect_again(tmp_path):
+    config_file = str(tmp_path / 'config.json')
+    CountingDetector.runs = 0
+    hits, stale = startup(config_file)
+    assert stale and CountingDetector.runs == 1
+
+    assert startup(config_file) == ({}, [])
+    assert CountingDetector.runs == 1
@@ -0,0 +1,49 @@
+"""Launching companions: duplicate-instance checks by executable path"""
+import os
+
+from benchmarks.fakes import FakeProcess, RecordingPopen, fake_process_iter
+from poe_core.catalog import CATALOG
+from poe_core.launching import Launcher
+from poe_core.processes import normalize_exe_path
+from poe_core.squirrel import UPDATE_EXE
+
+LURKER = CATALOG['poe_lurker']
+
+
+def lurker_install(tmp_path):
+    """Squirrel layout: stub and Update.exe in the base folder, builds in app-x.y.z"""
+    base = tmp_path / 'PoeLurker'
+    build = base / 'app-1.5.0'
+    build.mkdir(parents=True)
+    for path in (base / 'PoeLurker.exe', base / UPDATE_EXE, build / 'PoeLurker.exe'):
+        path.write_bytes(b'')
+    return str(base / 'PoeLurker.exe'), str(build / 'PoeLurker.exe')
+
+
+def launch_lurker(path, table):
+    settings = {'game_version': 'standalone', 'language': 'en', 'launch_history': 0,
+                LURKER.path_attr: path, LURKER.start_attr: True}
+    popen = RecordingPopen()
+    launcher = Launcher(settings, status=lambda message: None, popen=popen,
+                        process_iter=fake_process_iter(table))
+    launcher.launch()
+    return [args[0] for args, options in popen.calls]
+
+
+def test_configured_stub_matches_the_running_build(tmp_path):
+    stub, build = lurker_install(tmp_path)
+    # psutil reports the build, the stub exited after starting it
+    table = [FakeProcess(100, 'PoeLurker.exe', normalize_exe_path(build))]
+    assert launch_lurker(stub, table) == []
+
+
+def test_configured_stub_starts_when_nothing_runs(tmp_path):
+    stub, build = lurker_install(tmp_path)
+    assert launch_lurker(stub, []) == [stub]
+
+
+def test_other_program_with_the_same_name_does_not_count(tmp_path):
+    stub, build = lurker_install(tmp_path)
+    other = os.path.join(str(tmp_path), 'Elsewhere', 'PoeLurker.exe')
+    table = [FakeProcess(100, 'PoeLurker.exe', normalize_exe_path(other))]
+    assert launch_lurker(stub, table) == [stub]
@@ -0,0 +1,93 @@
+"""PathWatcher's polling fallback (used wherever change notifications are unavailable)"""
+import os
+import threading
+import time
+
+from poe_core.path_watcher import PathWatcher
+
+INTERVAL = 0.01
+MAX_INTERVAL = 0.05
+
+
+class Changes:
+    """on_change callback that records its calls"""
+
+    def __init__(self):
+        self.calls = []
+        self.condition = threading.Condition()
+
+    def __call__(self, key, path, valid, hint):
+        with self.condition:
+            self.calls.append((key, valid))
+            self.condition.notify_all()
+
+    def wait_for(self, count, timeout=5.0):
+        with self.condition:
+            self.condition.wait_for(lambda: len(self.calls) >= count, timeout)
+            return list(self.calls)
+
+
+def write(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def settle():
+    """Long enough for several polls at the maximum interval"""
+    time.sleep(MAX_INTERVAL * 4)
+
+
+def test_polling_reports_each_change_once(tmp_path):
+    folder = tmp_path / 'Tool'
+    folder.mkdir()
+    exe = str(folder / 'Tool.exe')
+    write(exe, 'v1')
+
+    changes = Changes()
+    watcher = PathWatcher(changes, interval=INTERVAL, max_interval=MAX_INTERVAL, notifications=None)
+    watcher.watch({'tool': exe})
+    watcher.start()
+    try:
+        assert changes.wait_for(1) == [('tool', True)]
+
+        # Updated in place a few times: still there, nothing to report
+        for version in ('v2', 'v3 is larger'):
+            write(exe, version)
+            settle()
+        assert changes.calls == [('tool', True)]
+
+        os.remove(exe)
+        assert changes.wait_for(2) == [('tool', True), ('tool', False)]
+        settle()
+        assert len(changes.calls) == 2
+
+        write(exe, 'v4')
+        assert changes.wait_for(3)[-1] == ('tool', True)
+        settle()
+        assert len(changes.calls) == 3
+    finally:
+        watcher.stop()
+        watcher.thread.join(5.0)
+
+    assert not watcher.thread.is_alive()
+    os.remove(exe)
+    settle()
+    assert len(changes.calls) == 3
+
+
+def test_watch_checks_new_paths_right_away(tmp_path):
+    exe = str(tmp_path / 'Tool.exe')
+    changes = Changes()
+    # Intervals long enough that only watch() can trigger the second check
+    watcher = PathWatcher(changes, interval=30.0, max_interval=30.0, notifications=None)
+    watcher.watch({'tool': ''})
+    watcher.start()
+    try:
+        time.sleep(INTERVAL * 5)
+        write(exe, 'v1')
+        watcher.watch({'tool': exe})
+        assert changes.wait_for(2)[-1] == ('tool', True)
+    finally:
+        watcher.stop()
+        watcher.thread.join(5.0)
+    assert not watcher.thread.is_alive()
@@ -0,0 +1,140 @@
+"""Settings profiles in config.json, and the migration from the flat layout"""
+import json
+
+import pytest
+
+from poe_core.config import ConfigStore
+from poe_core.profiles import CONFIG_VERSION, DEFAULT_PROFILE, ProfileStore, UnknownProfileError
+
+# config.json as written before profiles existed
+FLAT_CONFIG = {
+    'game_version': 'standalone',
+    'steam_path': '',
+    'standalone_path': r'C:\Games\Path of Exile\PathOfExile.exe',
+    'lurker_path': r'C:\Users\me\AppData\Local\PoeLurker\PoeLurker.exe',
+    'start_lurker': True,
+    'open_trade_site': False,
+    'language': 'de',
+    'steam_ready_timeout': 45,
+}
+
+
+def write_config(tmp_path, config):
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config), encoding='utf-8')
+    return str(path)
+
+
+def read_config(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_store(path):
+    return ProfileStore(ConfigStore(path)).load()
+
+
+def test_flat_config_becomes_the_default_profile(tmp_path):
+    path = write_config(tmp_path, FLAT_CONFIG)
+    store = load_store(path)
+    assert store.names() == [DEFAULT_PROFILE]
+    settings = store.settings()
+    for key, value in FLAT_CONFIG.items():
+        assert settings[key] == value
+
+    assert store.save()
+    config = read_config(path)
+    assert config['version'] == CONFIG_VERSION
+    assert config['active_profile'] == DEFAULT_PROFILE
+    assert config['language'] == 'de' and config['steam_ready_timeout'] == 45
+    assert 'language' not in config['profiles'][DEFAULT_PROFILE]
+    assert config['profiles'][DEFAULT_PROFILE]['lurker_path'] == FLAT_CONFIG['lurker_path']
+
+
+def test_migrated_config_round_trips_unchanged(tmp_path):
+    path = write_config(tmp_path, FLAT_CONFIG)
+    store = load_store(path)
+    store.save()
+    migrated = read_config(path)
+
+    again = load_store(path)
+    assert again.settings() == store.settings()
+    # Nothing changed, so nothing is written
+    assert not again.save()
+    assert read_config(path) == migrated
+
+
+def test_unknown_keys_of_old_configs_are_kept(tmp_path):
+    path = write_config(tmp_path, dict(FLAT_CONFIG, window_geometry='600x800'))
+    store = load_store(path)
+    store.save()
+    assert read_config(path)['profiles'][DEFAULT_PROFILE]['window_geometry'] == '600x800'
+
+
+def test_missing_config_gives_the_defaults(tmp_path):
+    store = load_store(str(tmp_path / 'config.json'))
+    assert store.names() == [DEFAULT_PROFILE]
+    assert store.settings()['game_version'] == 'steam'
+
+
+def test_profiles_switch_and_share_global_settings(tmp_path):
+    path = write_config(tmp_path, FLAT_CONFIG)
+    store = load_store(path)
+    store.create('league start', dict(store.settings(), game_version='steam', start_lurker=False))
+    store.update(dict(store.settings(), language='fr'))
+
+    steam = store.switch('league start')
+    assert store.active == 'league start'
+    assert steam['game_version'] == 'steam' and not steam['start_lurker']
+    assert steam['language'] == 'fr'
+    assert store.settings(DEFAULT_PROFILE)['game_version'] == 'standalone'
+
+    store.save()
+    reloaded = load_store(path)
+    assert reloaded.active == 'league start'
+    assert reloaded.names() == [DEFAULT_PROFILE, 'league start']
+
+
+def test_profile_names_are_checked(tmp_path):
+    store = load_store(write_config(tmp_path, FLAT_CONFIG))
+    with pytest.raises(ValueError):
+        store.create('  ')
+    with pytest.raises(ValueError):
+        store.create(DEFAULT_PROFILE)
+    with pytest.raises(UnknownProfileError):
+        store.switch('missing')
+    with pytest.raises(UnknownProfileError):
+        store.settings('missing')
+
+
+def test_deleting_the_active_profile_activates_another(tmp_path):
+    store = load_store(write_config(tmp_path, FLAT_CONFIG))
+    store.create('second')
+    store.switch('second')
+    store.remember_validation('poe_lurker', 'x', True)
+    store.delete('second')
+    assert store.active == DEFAULT_PROFILE
+    assert store.names() == [DEFAULT_PROFILE]
+    assert 'second' not in store.validation
+    with pytest.raises(ValueError):
+        store.delete(DEFAULT_PROFILE)
+
+
+def test_validation_is_cached_per_profile_and_path(tmp_path):
+    store = load_store(write_config(tmp_path, FLAT_CONFIG))
+    store.create('second')
+    lurker = FLAT_CONFIG['lurker_path']
+    store.remember_validation('poe_lurker', lurker, True)
+
+    assert store.cached_validation('poe_lurker', lurker) is True
+    # Another path, another profile or another program: not cached
+    assert store.cached_validation('poe_lurker', r'D:\Other\PoeLurker.exe') is None
+    assert store.cached_validation('poe_lurker', lurker, 'second') is None
+    assert store.cached_validation('chaos_recipe', lurker) is None
+
+    store.remember_validation('poe_lurker', lurker, False, 'second')
+    assert store.cached_validation('poe_lurker', lurker, 'second') is False
+    assert store.cached_validation('poe_lurker', lurker) is True
+    # Reloading config.json starts over
+    store.load()
+    assert store.cached_validation('poe_lurker', lurker) is None
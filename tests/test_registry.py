@@ -0,0 +1,88 @@
+"""Uninstall registry index, off Windows through FakeWinreg"""
+from benchmarks.fakes import FakeWinreg, make_uninstall_registry
+from poe_core.registry import UNINSTALL_KEY, UNINSTALL_KEY_WOW64, RegistryIndex, name_tokens
+
+PROGRAMS = {
+    'PoeLurker': r'C:\Users\me\AppData\Local\PoeLurker',
+    'Path of Exile': r'C:\Games\Path of Exile',
+    'Awakened PoE Trade 3.25.1': r'C:\Program Files\Awakened PoE Trade',
+}
+
+
+def build_index(count=50):
+    index = RegistryIndex(make_uninstall_registry(count, PROGRAMS))
+    assert index.refresh()
+    return index
+
+
+def names(entries):
+    return sorted(entry.display_name for entry in entries)
+
+
+def test_camel_case_names_are_indexed_whole_and_split():
+    assert name_tokens('PoeLurker') == {'poelurker', 'poe', 'lurker'}
+    assert name_tokens('Awakened PoE Trade 3.25.1') >= {'awakened', 'poe', 'trade', '3', '25', '1'}
+    assert name_tokens('') == set()
+
+
+def test_query_matches_split_and_whole_tokens():
+    index = build_index()
+    assert names(index.query('lurker')) == ['PoeLurker']
+    assert names(index.query('PoeLurker')) == ['PoeLurker']
+    assert index.query('lurker')[0].install_location == PROGRAMS['PoeLurker']
+
+
+def test_query_requires_every_token():
+    index = build_index()
+    assert names(index.query('poe')) == ['Awakened PoE Trade 3.25.1', 'PoeLurker']
+    assert names(index.query('poe', 'trade')) == ['Awakened PoE Trade 3.25.1']
+    assert names(index.query('Path', 'Exile')) == ['Path of Exile']
+    assert index.query('poe', 'missing') == []
+    assert len(index.query()) == 50 + len(PROGRAMS)
+
+
+def test_entries_without_display_name_are_skipped():
+    fake = FakeWinreg()
+    root = fake.add_key(fake.HKEY_LOCAL_MACHINE, UNINSTALL_KEY)
+    root.child('{update}', {'InstallLocation': r'C:\Somewhere'})
+    root.child('Tool', {'DisplayName': 'Tool'})
+    index = RegistryIndex(fake)
+    index.refresh()
+    assert names(index.entries) == ['Tool']
+
+
+def test_all_uninstall_roots_are_read():
+    fake = FakeWinreg()
+    fake.add_key(fake.HKEY_LOCAL_MACHINE, UNINSTALL_KEY_WOW64).child('A', {'DisplayName': 'Tool A'})
+    fake.add_key(fake.HKEY_CURRENT_USER, UNINSTALL_KEY).child('B', {'DisplayName': 'Tool B'})
+    index = RegistryIndex(fake)
+    index.refresh()
+    assert names(index.query('tool')) == ['Tool A', 'Tool B']
+
+
+def test_unchanged_registry_is_not_walked_again():
+    index = build_index()
+    calls = index.winreg.calls
+    assert not index.refresh()
+    assert index.builds == 1
+    # Only the last-write stamps of the roots were read
+    assert index.winreg.calls - calls <= 2 * len(index.roots)
+
+
+def test_added_key_rebuilds_the_index():
+    index = build_index()
+    assert index.query('exilence') == []
+    root = index.winreg.add_key(index.winreg.HKEY_LOCAL_MACHINE, UNINSTALL_KEY)
+    root.child('Exilence', {'DisplayName': 'Exilence Next', 'InstallLocation': r'C:\Exilence'})
+
+    assert index.refresh()
+    assert index.builds == 2
+    assert names(index.query('exilence')) == ['Exilence Next']
+
+
+def test_without_winreg_nothing_is_indexed():
+    index = RegistryIndex(None)
+    index.winreg = None
+    assert not index.available
+    assert not index.refresh()
+    assert index.query('poe') == []
@@ -0,0 +1,105 @@
+"""Shell link parsing against .lnk files built by benchmarks.fakes.make_lnk"""
+import random
+import struct
+
+import pytest
+
+from benchmarks.fakes import make_lnk
+from poe_core.shortcuts import HEADER_SIZE, parse_lnk, shortcut_target
+
+TARGET = 'C:\\Program Files\\Awakened PoE Trade\\Awakened PoE Trade.exe'
+
+
+def write_lnk(tmp_path, data, name='tool.lnk'):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_link_info_local_base_path():
+    link = parse_lnk(make_lnk(TARGET))
+    assert link.target == TARGET
+    assert link.resolve() == TARGET
+
+
+def test_link_info_without_unicode_paths():
+    link = parse_lnk(make_lnk('C:\\Spiele\\Übung\\tool.exe', unicode_paths=False))
+    assert link.target == 'C:\\Spiele\\Übung\\tool.exe'
+
+
+def test_string_data():
+    link = parse_lnk(make_lnk(TARGET, arguments='--minimized', working_dir='C:\\Program Files\\Awakened PoE Trade'))
+    assert link.arguments == '--minimized'
+    assert link.working_dir == 'C:\\Program Files\\Awakened PoE Trade'
+
+
+def test_unicode_strings():
+    target = 'C:\\Spiele\\Ψ工具 🎮\\ツール.exe'
+    link = parse_lnk(make_lnk(target, arguments='--名前 "Ü"', working_dir='C:\\Spiele\\Ψ工具 🎮'))
+    assert link.target == target
+    assert link.arguments == '--名前 "Ü"'
+    assert link.working_dir == 'C:\\Spiele\\Ψ工具 🎮'
+
+
+def test_relative_path_is_resolved_against_the_shortcut_folder():
+    link = parse_lnk(make_lnk(None, relative_path='..\\Tools\\CRE.exe', working_dir='D:\\Elsewhere'))
+    assert link.target is None
+    assert link.resolve('D:\\Games\\Shortcuts\\CRE.lnk') == 'D:\\Games\\Tools\\CRE.exe'
+
+
+def test_relative_path_is_combined_with_the_working_directory():
+    link = parse_lnk(make_lnk(None, relative_path='.\\bin\\CRE.exe', working_dir='D:\\Tools\\CRE'))
+    assert link.resolve() == 'D:\\Tools\\CRE\\bin\\CRE.exe'
+
+
+def test_relative_path_without_a_base_does_not_resolve():
+    assert parse_lnk(make_lnk(None, relative_path='CRE.exe')).resolve() is None
+
+
+def test_environment_variable_target():
+    link = parse_lnk(make_lnk('%LOCALAPPDATA%\\PoeLurker\\PoeLurker.exe', env_target=True))
+    assert link.target is None
+    assert link.env_target == '%LOCALAPPDATA%\\PoeLurker\\PoeLurker.exe'
+
+
+def test_shortcut_target_reads_the_file(tmp_path):
+    assert shortcut_target(write_lnk(tmp_path, make_lnk(TARGET))) == TARGET
+
+
+def test_missing_file_returns_none(tmp_path):
+    assert shortcut_target(str(tmp_path / 'missing.lnk')) is None
+
+
+@pytest.mark.parametrize('data', [
+    b'',
+    b'not a shortcut at all',
+    make_lnk(TARGET)[:HEADER_SIZE - 1],
+    b'\x4c\0\0\0' + b'\xff' * 16 + make_lnk(TARGET)[20:],
+])
+def test_not_a_shell_link_returns_none(tmp_path, data):
+    assert shortcut_target(write_lnk(tmp_path, data)) is None
+
+
+def test_truncated_files_never_resolve_to_a_wrong_path(tmp_path):
+    data = make_lnk(TARGET, arguments='--minimized', working_dir='C:\\Program Files\\Awakened PoE Trade')
+    for length in range(len(data)):
+        target = shortcut_target(write_lnk(tmp_path, data[:length]))
+        assert target in (None, TARGET), length
+    # Cut inside the header, the ID list or the LinkInfo there is no target
+    link_info = HEADER_SIZE + 2 + struct.unpack_from('<H', data, HEADER_SIZE)[0]
+    link_info_end = link_info + struct.unpack_from('<I', data, link_info)[0]
+    for length in range(HEADER_SIZE, link_info_end):
+        assert shortcut_target(write_lnk(tmp_path, data[:length])) is None, length
+
+
+def test_corrupt_files_raise_value_error_or_parse():
+    data = bytearray(make_lnk(TARGET, arguments='--minimized'))
+    rng = random.Random(7)
+    for _ in range(500):
+        corrupt = bytearray(data)
+        for _ in range(rng.randint(1, 8)):
+            corrupt[rng.randrange(20, len(corrupt))] = rng.randrange(256)
+        try:
+            parse_lnk(bytes(corrupt))
+        except ValueError:
+            pass
@@ -0,0 +1,84 @@
+"""Starting programs: directly, through cmd.exe or through the shell"""
+import subprocess
+
+import pytest
+
+from benchmarks.fakes import RecordingPopen
+from poe_core.spawning import CREATE_NEW_PROCESS_GROUP, DETACHED_PROCESS, Spawner, launch_method
+
+
+class RecordingStartfile:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args):
+        self.calls.append(args)
+
+
+def windows_spawner():
+    popen = RecordingPopen()
+    startfile = RecordingStartfile()
+    return Spawner(popen=popen, windows=True, startfile=startfile), popen, startfile
+
+
+def test_exe_starts_directly_and_detached():
+    spawner, popen, startfile = windows_spawner()
+    # Forward slashes, so os.path.dirname finds the folder off Windows too
+    process = spawner.spawn('C:/Tools/Trade/Trade.exe', ['--minimized'])
+
+    (args, options), = popen.calls
+    assert args == ['C:/Tools/Trade/Trade.exe', '--minimized']
+    assert not options.get('shell', False)
+    assert options['cwd'] == 'C:/Tools/Trade'
+    assert options['creationflags'] == DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+    assert options['stdin'] is subprocess.DEVNULL
+    assert process.direct and process.pid is not None
+    assert process.poll() is None
+    assert not startfile.calls
+
+
+def test_explicit_cwd_wins():
+    spawner, popen, _ = windows_spawner()
+    spawner.spawn(r'C:\Tools\Trade\Trade.exe', cwd=r'D:\Work')
+    assert popen.calls[0][1]['cwd'] == r'D:\Work'
+
+
+@pytest.mark.parametrize('name', ['start.bat', 'START.CMD'])
+def test_batch_files_run_through_cmd(name):
+    spawner, popen, startfile = windows_spawner()
+    path = 'C:\\Tools\\' + name
+    process = spawner.spawn(path, ['-x'])
+
+    (args, options), = popen.calls
+    assert args == ['cmd.exe', '/c', path, '-x']
+    assert not options.get('shell', False)
+    assert not process.direct
+    assert not startfile.calls
+
+
+@pytest.mark.parametrize('name', ['Tool.lnk', 'poe.ninja.url'])
+def test_shortcuts_open_through_the_shell(name):
+    spawner, popen, startfile = windows_spawner()
+    path = 'C:\\Users\\me\\Desktop\\' + name
+    process = spawner.spawn(path)
+
+    assert not popen.calls
+    assert startfile.calls and startfile.calls[0][0] == path
+    assert not process.direct
+    assert process.pid is None and process.poll() is None
+
+
+def test_shell_targets_fail_without_a_shell():
+    spawner = Spawner(popen=RecordingPopen(), windows=True)
+    spawner.startfile = None
+    with pytest.raises(OSError):
+        spawner.spawn(r'C:\Tools\Tool.lnk')
+
+
+def test_posix_starts_everything_directly():
+    assert launch_method('/opt/tool/start.bat', windows=False) == 'direct'
+    popen = RecordingPopen()
+    Spawner(popen=popen, windows=False).spawn('/opt/tool/run.sh')
+    (args, options), = popen.calls
+    assert args == ['/opt/tool/run.sh']
+    assert options['start_new_session'] and 'creationflags' not in options
@@ -0,0 +1,132 @@
+"""Squirrel version folders: ordering, resolution and the resolver cache"""
+import os
+
+from poe_core.squirrel import UPDATE_EXE, SquirrelResolver, current_build, parse_version, stub_target
+
+EXE = 'Tool.exe'
+
+
+def newest(*names):
+    return max(names, key=parse_version)
+
+
+def test_versions_compare_numerically():
+    assert newest('app-1.9.0', 'app-1.10.0') == 'app-1.10.0'
+    assert parse_version('app-1.4') == parse_version('app-1.4.0')
+    assert parse_version('Tool.exe') is None
+
+
+def test_release_sorts_after_its_prereleases():
+    assert newest('app-1.5.0-beta.3', 'app-1.5.0') == 'app-1.5.0'
+    assert newest('app-1.5.0-beta', 'app-1.4.9') == 'app-1.5.0-beta'
+
+
+def test_prerelease_identifiers_follow_semver():
+    assert newest('app-1.5.0-beta.9', 'app-1.5.0-beta.10') == 'app-1.5.0-beta.10'
+    assert newest('app-1.5.0-beta', 'app-1.5.0-beta.1') == 'app-1.5.0-beta.1'
+    assert newest('app-1.5.0-beta.2', 'app-1.5.0-beta.x') == 'app-1.5.0-beta.x'
+    assert newest('app-1.5.0-alpha.2', 'app-1.5.0-beta.1') == 'app-1.5.0-beta.1'
+
+
+def install(base, *versions, stub=False):
+    os.makedirs(base, exist_ok=True)
+    for version in versions:
+        folder = os.path.join(base, 'app-' + version)
+        os.makedirs(folder, exist_ok=True)
+        touch(os.path.join(folder, EXE))
+    if stub:
+        touch(os.path.join(base, EXE))
+
+
+def touch(path):
+    with open(path, 'w'):
+        pass
+
+
+def set_mtime(path, seconds):
+    os.utime(path, (seconds, seconds))
+
+
+def test_resolves_the_newest_build(tmp_path):
+    base = str(tmp_path / 'Tool')
+    install(base, '1.4.2', '1.10.0', '1.5.0-beta.1', stub=True)
+    resolver = SquirrelResolver()
+    assert resolver.resolve(base, EXE) == os.path.join(base, 'app-1.10.0', EXE)
+
+
+def test_falls_back_to_the_stub(tmp_path):
+    base = str(tmp_path / 'Tool')
+    install(base, stub=True)
+    os.makedirs(os.path.join(base, 'app-2.0.0'))
+    assert SquirrelResolver().resolve(base, EXE) == os.path.join(base, EXE)
+
+
+def test_unchanged_folder_is_not_rescanned(tmp_path):
+    base = str(tmp_path / 'Tool')
+    install(base, '1.4.2')
+    resolver = SquirrelResolver()
+    first = resolver.resolve(base, EXE)
+    assert resolver.resolve(base, EXE) == first
+    assert resolver.scans == 1
+
+
+def test_exe_extracted_into_an_existing_folder_is_found(tmp_path):
+    base = str(tmp_path / 'Tool')
+    install(base, '1.4.2')
+    pending = os.path.join(base, 'app-1.5.0')
+    os.makedirs(pending)
+    set_mtime(pending, 1000)
+    set_mtime(base, 1000)
+    resolver = SquirrelResolver()
+    assert resolver.resolve(base, EXE) == os.path.join(base, 'app-1.4.2', EXE)
+
+    # The update finishes extracting: only the version folder changes
+    touch(os.path.join(pending, EXE))
+    set_mtime(pending, 2000)
+    set_mtime(base, 1000)
+    assert resolver.resolve(base, EXE) == os.path.join(pending, EXE)
+    assert resolver.scans == 2
+
+
+def test_deleted_exe_is_not_served_from_the_cache(tmp_path):
+    base = str(tmp_path / 'Tool')
+    install(base, '1.4.2', '1.5.0', stub=True)
+    set_mtime(base, 1000)
+    resolver = SquirrelResolver()
+    exe = resolver.resolve(base, EXE)
+    assert exe == os.path.join(base, 'app-1.5.0', EXE)
+
+    os.remove(exe)
+    set_mtime(base, 1000)
+    assert resolver.resolve(base, EXE) == os.path.join(base, 'app-1.4.2', EXE)
+
+
+def test_current_build_moves_versioned_paths_only(tmp_path):
+    base = str(tmp_path / 'Tool')
+    install(base, '1.4.2', '1.5.0')
+    old = os.path.join(base, 'app-1.4.2', EXE)
+    resolver = SquirrelResolver()
+    assert current_build(old, resolver) == os.path.join(base, 'app-1.5.0', EXE)
+
+    plain = str(tmp_path / 'Other' / EXE)
+    assert current_build(plain, resolver) == plain
+    assert current_build('', resolver) == ''
+
+
+def test_stub_target_is_the_newest_build(tmp_path):
+    base = str(tmp_path / 'Tool')
+    install(base, '1.4.2', '1.5.0', stub=True)
+    touch(os.path.join(base, UPDATE_EXE))
+    resolver = SquirrelResolver()
+    assert stub_target(os.path.join(base, EXE), resolver) == os.path.join(base, 'app-1.5.0', EXE)
+    # Already a build
+    assert stub_target(os.path.join(base, 'app-1.5.0', EXE), resolver) is None
+
+
+def test_stub_target_needs_a_squirrel_folder(tmp_path):
+    base = str(tmp_path / 'Tool')
+    install(base, '1.5.0', stub=True)
+    resolver = SquirrelResolver()
+    assert stub_target(os.path.join(base, EXE), resolver) is None
+    assert resolver.scans == 0
+    assert stub_target('', resolver) is None
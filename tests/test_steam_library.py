@@ -0,0 +1,172 @@
+"""VDF parsing and the Steam library index"""
+import os
+
+import pytest
+
+from poe_core.steam_library import POE_EXE_NAME, POE_STEAM_APP_ID, SteamLibraryIndex, load_vdf, parse_vdf
+
+NEW_FORMAT = r'''
+"libraryfolders"
+{
+	"0"
+	{
+		"path"		"{steam}"
+		"label"		""
+		"contentid"		"6062171366476436484"
+		"apps"
+		{
+			"228980"		"263446986"
+		}
+	}
+	"1"
+	{
+		"path"		"{library}"
+		"label"		""
+		"apps"
+		{
+			"238960"		"40133625856"
+			"440"		"26814318540"
+		}
+	}
+}
+'''
+
+OLD_FORMAT = r'''
+"LibraryFolders"
+{
+	"TimeNextStatsReport"		"1700000000"
+	"ContentStatsID"		"-4529402938262018271"
+	"1"		"{library}"
+}
+'''
+
+
+def vdf_path(path):
+    return path.replace('\\', '\\\\')
+
+
+def make_steam(tmp_path, vdf, manifest_installdir="Path of Exile", game_dir="Path of Exile"):
+    """Steam folder plus a second library holding Path of Exile; returns (steam dir, library)"""
+    steam = tmp_path / 'Steam'
+    library = tmp_path / 'SteamLibrary'
+    (steam / 'steamapps').mkdir(parents=True)
+    (library / 'steamapps' / 'common' / game_dir).mkdir(parents=True)
+    (library / 'steamapps' / 'common' / game_dir / POE_EXE_NAME).write_text('')
+    if manifest_installdir is not None:
+        (library / 'steamapps' / f'appmanifest_{POE_STEAM_APP_ID}.acf').write_text(
+            f'"AppState"\n{{\n\t"appid"\t\t"{POE_STEAM_APP_ID}"\n\t"installdir"\t\t"{manifest_installdir}"\n}}\n')
+    text = vdf.replace('{steam}', vdf_path(str(steam))).replace('{library}', vdf_path(str(library)))
+    (steam / 'steamapps' / 'libraryfolders.vdf').write_text(text)
+    return str(steam), str(library)
+
+
+def test_nested_blocks_with_lowercased_keys():
+    assert parse_vdf('"AppState" { "AppID" "238960" "UserConfig" { "Language" "english" } }') == {
+        'appstate': {'appid': '238960', 'userconfig': {'language': 'english'}},
+    }
+
+
+def test_escapes_in_quoted_strings():
+    parsed = parse_vdf(r'"path" "D:\\Steam Library" "name" "say \"hi\"" "lines" "a\nb\tc" "other" "\q"')
+    assert parsed == {'path': 'D:\\Steam Library', 'name': 'say "hi"', 'lines': 'a\nb\tc', 'other': '\\q'}
+
+
+def test_comments_and_conditionals_are_skipped():
+    text = '''
+    // a comment line
+    "root"
+    {
+        "key"   "value"   [$WIN32]   // trailing comment
+        "bare"  word
+        "block" [$!OSX]
+        {
+            "x" "1"
+        }
+    }
+    '''
+    assert parse_vdf(text) == {'root': {'key': 'value', 'bare': 'word', 'block': {'x': '1'}}}
+
+
+@pytest.mark.parametrize('text', [
+    '"root" {',
+    '"root" { } }',
+    '"key"',
+    '{ "key" "value" }',
+    '"root" { "key" }',
+    '"key" "unterminated',
+])
+def test_malformed_input_raises_value_error(text):
+    with pytest.raises(ValueError):
+        parse_vdf(text)
+
+
+def test_chunked_input_parses_like_the_whole_text():
+    text = NEW_FORMAT.replace('{steam}', 'C:\\\\Steam').replace('{library}', 'D:\\\\Lib \\"x\\"')
+    # A string with a raw line break, and a comment at the end
+    text = text.rstrip()[:-1] + '\t"note"\t"first line\nsecond line"\n}\n// end'
+    expected = parse_vdf(text)
+    assert expected['libraryfolders']['note'] == 'first line\nsecond line'
+    assert expected['libraryfolders']['1']['path'] == 'D:\\Lib "x"'
+    for size in (1, 2, 3, 7, 64):
+        chunks = (text[i:i + size] for i in range(0, len(text), size))
+        assert parse_vdf(chunks) == expected
+
+
+def test_load_vdf_reads_in_blocks(tmp_path, monkeypatch):
+    import poe_core.steam_library as steam_library
+
+    monkeypatch.setattr(steam_library, 'VDF_BLOCK_SIZE', 5)
+    path = tmp_path / 'appmanifest.acf'
+    path.write_text('"AppState"\n{\n\t"installdir"\t\t"Path of Exile"\n}\n')
+    assert load_vdf(str(path)) == {'appstate': {'installdir': 'Path of Exile'}}
+
+
+def test_new_format_indexes_apps_by_library(tmp_path):
+    steam, library = make_steam(tmp_path, NEW_FORMAT)
+    index = SteamLibraryIndex(steam)
+    assert index.libraries == [os.path.normpath(steam), os.path.normpath(library)]
+    assert index.library_for(POE_STEAM_APP_ID) == os.path.normpath(library)
+    assert index.library_for('228980') == os.path.normpath(steam)
+    assert index.library_for('999') is None
+
+
+def test_old_format_finds_the_library_by_manifest(tmp_path):
+    steam, library = make_steam(tmp_path, OLD_FORMAT)
+    index = SteamLibraryIndex(steam)
+    assert index.libraries == [os.path.normpath(steam), os.path.normpath(library)]
+    assert index.app_libraries == {}
+    assert index.find_poe() == os.path.join(os.path.normpath(library), 'steamapps', 'common',
+                                            'Path of Exile', POE_EXE_NAME)
+
+
+def test_find_poe_uses_the_manifest_installdir(tmp_path):
+    steam, library = make_steam(tmp_path, NEW_FORMAT, manifest_installdir="PoE Custom", game_dir="PoE Custom")
+    assert SteamLibraryIndex(steam).find_poe() == os.path.join(os.path.normpath(library), 'steamapps', 'common',
+                                                               'PoE Custom', POE_EXE_NAME)
+
+
+def test_find_poe_falls_back_to_the_default_folder_without_a_manifest(tmp_path):
+    steam, library = make_steam(tmp_path, NEW_FORMAT, manifest_installdir=None)
+    assert SteamLibraryIndex(steam).find_poe() == os.path.join(os.path.normpath(library), 'steamapps', 'common',
+                                                               'Path of Exile', POE_EXE_NAME)
+
+
+def test_find_poe_without_the_executable(tmp_path):
+    steam, library = make_steam(tmp_path, NEW_FORMAT, manifest_installdir="Elsewhere")
+    assert SteamLibraryIndex(steam).find_poe() is None
+
+
+def test_find_poe_with_a_broken_manifest_uses_the_default_folder(tmp_path):
+    steam, library = make_steam(tmp_path, NEW_FORMAT)
+    manifest = os.path.join(library, 'steamapps', f'appmanifest_{POE_STEAM_APP_ID}.acf')
+    with open(manifest, 'w') as f:
+        f.write('"AppState" { "installdir" ')
+    assert SteamLibraryIndex(steam).find_poe().endswith(os.path.join('Path of Exile', POE_EXE_NAME))
+
+
+def test_without_libraryfolders_only_the_steam_folder_is_a_library(tmp_path):
+    steam = tmp_path / 'Steam'
+    steam.mkdir()
+    index = SteamLibraryIndex(str(steam))
+    assert index.libraries == [str(steam)]
+    assert index.find_poe() is None
@@ -0,0 +1,136 @@
+"""Supervisor: restart backoff, stub hand-off and stopping companions with the game"""
+import itertools
+
+from benchmarks.fakes import FakeProcess, fake_process_iter
+from poe_core.processes import ProcessSnapshot
+from poe_core.supervisor import MAX_RESTARTS, RESTART_DELAY, STATUS_ZOMBIE, Companion, Supervisor
+
+TRADE = r'C:\Tools\Trade\Trade.exe'
+LURKER_STUB = r'C:\Users\me\AppData\Local\PoeLurker\PoeLurker.exe'
+LURKER_APP = r'C:\Users\me\AppData\Local\PoeLurker\app-1.2.3\PoeLurker.exe'
+GAME = r'C:\Games\Path of Exile\PathOfExile.exe'
+
+
+class FakeHandle:
+    """psutil.Process stand-in that runs until it is killed"""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.alive = True
+        self.terminated = False
+
+    def is_running(self):
+        return self.alive
+
+    def status(self):
+        return 'running' if self.alive else STATUS_ZOMBIE
+
+    def terminate(self):
+        self.terminated = True
+        self.alive = False
+
+    def wait(self, timeout=None):
+        return 0
+
+    def kill(self):
+        self.alive = False
+
+
+class Processes:
+    """process_factory and start_program over FakeHandles"""
+
+    def __init__(self):
+        self.handles = {}
+        self.pids = itertools.count(1000)
+        self.started = []
+
+    def __call__(self, pid):
+        return self.handles.setdefault(pid, FakeHandle(pid))
+
+    def start_program(self, path, args):
+        self.started.append(path)
+        return self(next(self.pids))
+
+
+def supervisor(companions, processes, table=(), **kwargs):
+    messages = []
+    supervisor = Supervisor(companions, processes.start_program, status=messages.append,
+                            process_iter=fake_process_iter(list(table)), process_factory=processes,
+                            clock=lambda: 0.0, poll_interval=0, **kwargs)
+    return supervisor, messages
+
+
+def test_crashing_companion_is_restarted_with_backoff_then_given_up():
+    processes = Processes()
+    trade = Companion('trade', 'Trade', TRADE, pid=100)
+    sup, messages = supervisor([trade], processes)
+    now = 0.0
+    sup.watch(trade, 100, now)
+
+    delays = []
+    while True:
+        # Up long enough not to be taken for a launcher stub, then it crashes
+        now += 30.0
+        trade.process.alive = False
+        sup.check(now)
+        if trade.restart_at is None:
+            break
+        delays.append(trade.restart_at - now)
+        sup.check(trade.restart_at - 0.1)
+        assert trade.process is None
+        now = trade.restart_at
+        sup.check(now)
+        assert trade.process is not None and trade.process.alive
+
+    assert delays == [RESTART_DELAY * 2 ** n for n in range(MAX_RESTARTS)]
+    assert len(processes.started) == MAX_RESTARTS == sup.restarted
+    assert trade.gave_up
+    assert messages[-1] == "Trade keeps exiting, not restarting it again"
+
+    # Given up for good: further checks start nothing
+    sup.check(now + 1000.0)
+    assert len(processes.started) == MAX_RESTARTS
+
+
+def test_exiting_stub_is_followed_to_the_real_program():
+    processes = Processes()
+    lurker = Companion('lurker', 'PoE Lurker', LURKER_STUB, pid=100)
+    sup, messages = supervisor([lurker], processes)
+    sup.watch(lurker, 100, 0.0)
+
+    # The stub exits right after starting app-1.2.3\PoeLurker.exe
+    lurker.process.alive = False
+    sup.check(1.0)
+    assert lurker.handed_off and lurker.pending_since == 1.0
+    assert lurker.restart_at is None and not messages
+
+    snapshot = ProcessSnapshot([{'pid': 200, 'name': 'PoeLurker.exe', 'exe': LURKER_APP}], include_paths=True)
+    sup.adopt(snapshot, 2.0)
+    assert lurker.process.pid == 200 and lurker.pending_since is None
+    assert not processes.started
+
+
+def test_companions_are_stopped_when_the_game_exits():
+    processes = Processes()
+    trade = Companion('trade', 'Trade', TRADE, pid=100)
+    table = [FakeProcess(500, 'PathOfExile.exe', GAME), FakeProcess(100, 'Trade.exe', TRADE)]
+    sup, messages = supervisor([trade], processes, table)
+
+    game = processes(500)
+    checks = itertools.count()
+    # The game runs for two polls, then exits
+    game.is_running = lambda: next(checks) < 2
+
+    assert sup.run() is True
+    assert sup.game is game
+    assert processes(100).terminated
+    assert messages == ["Path of Exile closed, stopping companion programs"]
+
+
+def test_game_that_never_starts_leaves_companions_running():
+    processes = Processes()
+    trade = Companion('trade', 'Trade', TRADE, pid=100)
+    sup, messages = supervisor([trade], processes, [FakeProcess(100, 'Trade.exe', TRADE)],
+                               game_start_timeout=0.0)
+    assert sup.run() is False
+    assert not processes(100).terminated